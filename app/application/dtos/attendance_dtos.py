@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
 class ClockInRequest:
     employee_id: str
     clock_in_time: datetime
+    site_id: Optional[str] = None
 
 
 @dataclass
@@ -23,6 +24,7 @@ class ClockInResponse:
 class ClockOutRequest:
     employee_id: str
     clock_out_time: datetime
+    site_id: Optional[str] = None
 
 
 @dataclass
@@ -40,6 +42,7 @@ class ClockOutResponse:
 class StartBreakRequest:
     employee_id: str
     break_start_time: datetime
+    site_id: Optional[str] = None
 
 
 @dataclass
@@ -56,6 +59,7 @@ class StartBreakResponse:
 class EndBreakRequest:
     employee_id: str
     break_end_time: datetime
+    site_id: Optional[str] = None
 
 
 @dataclass
@@ -66,4 +70,36 @@ class EndBreakResponse:
     date: str
     break_end_time: str
     current_state: str
-    break_duration_minutes: Optional[int] = None
\ No newline at end of file
+    break_duration_minutes: Optional[int] = None
+
+
+@dataclass
+class AttendanceEvent:
+    employee_id: str
+    event_type: str
+    occurred_at: datetime
+    site_id: Optional[str] = None
+
+
+@dataclass
+class AttendanceEventsBatchRequest:
+    events: List[AttendanceEvent]
+
+
+@dataclass
+class AttendanceEventResult:
+    index: int
+    employee_id: str
+    event_type: str
+    occurred_at: str
+    success: bool
+    message: str
+    current_state: str
+
+
+@dataclass
+class AttendanceEventsBatchResponse:
+    processed: int
+    succeeded: int
+    failed: int
+    results: List[AttendanceEventResult]
@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class AttendanceImportRecord:
+    line_number: int
+    fields: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class AttendanceImportError:
+    line_number: int
+    message: str
+
+
+@dataclass
+class ImportAttendanceResponse:
+    rows_read: int
+    rows_imported: int
+    rows_failed: int
+    elapsed_seconds: float
+    rows_per_second: float
+    errors: List[AttendanceImportError] = field(default_factory=list)
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
+
+MinuteColumn = Union[Sequence[int], "numpy.typing.NDArray[numpy.int64]"]
+
+
+@dataclass
+class ExportPayrollRequest:
+    year_month: str
+
+
+@dataclass
+class PayrollExport:
+    """Per-employee payroll totals for a month, one column per field.
+
+    The minute columns are NumPy int64 arrays when NumPy is installed and
+    plain lists otherwise; row i of every column belongs to employee_ids[i].
+    """
+    year_month: str
+    employee_ids: List[str]
+    statuses: List[str]
+    worked_minutes: MinuteColumn
+    break_minutes: MinuteColumn
+    overtime_minutes: MinuteColumn
+    days_present: Sequence[int]
+    elapsed_seconds: float = 0.0
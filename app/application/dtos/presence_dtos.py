@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class PresenceEvent:
+    employee_id: str
+    site_id: Optional[str]
+    event_type: str
+    current_state: str
+    occurred_at: str
+
+
+@dataclass
+class PresenceSnapshot:
+    present: List[PresenceEvent]
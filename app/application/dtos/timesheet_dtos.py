@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class MonthlySummaryRequest:
+    employee_id: str
+    year_month: str
+
+
+@dataclass
+class MonthlySummaryResponse:
+    employee_id: str
+    year_month: str
+    status: str
+    total_worked_minutes: int
+    total_break_minutes: int
+    overtime_minutes: int
+    days_present: int
+
+
+@dataclass
+class SubmitTimesheetRequest:
+    employee_id: str
+    year_month: str
+    approver_id: Optional[str] = None
+
+
+@dataclass
+class ReviewTimesheetRequest:
+    employee_id: str
+    year_month: str
+    reviewer_id: str
+    comment: Optional[str] = None
+
+
+@dataclass
+class TimesheetStatusResponse:
+    employee_id: str
+    year_month: str
+    status: str
+    approver_id: Optional[str] = None
+
+
+@dataclass
+class BulkApproveTimesheetsRequest:
+    """Approve the listed employees' timesheets, or with no list every
+    SUBMITTED timesheet of year_month assigned to the reviewer"""
+    year_month: str
+    reviewer_id: str
+    employee_ids: Optional[List[str]] = None
+
+
+@dataclass
+class TimesheetApprovalResult:
+    employee_id: str
+    success: bool
+    message: str
+    status: str
+
+
+@dataclass
+class BulkApproveTimesheetsResponse:
+    processed: int
+    succeeded: int
+    failed: int
+    results: List[TimesheetApprovalResult]
@@ -1,3 +1,3 @@
-from .clock_in_usecase import ClockInUseCase
+from .clock_in_usecase import ClockInUseCase, AsyncClockInUseCase
 
-__all__ = ["ClockInUseCase"]
\ No newline at end of file
+__all__ = ["ClockInUseCase", "AsyncClockInUseCase"]
\ No newline at end of file
@@ -0,0 +1,193 @@
+from typing import Iterator, List, Optional, Sequence, Tuple, TypeVar
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.models import Timesheet, EmployeeId, YearMonth, TimesheetStatus
+from ...domain.exceptions import DomainException, TimesheetNotFoundError
+from .conflict_retry import retry_on_conflict
+from ..dtos.timesheet_dtos import (
+    BulkApproveTimesheetsRequest,
+    BulkApproveTimesheetsResponse,
+    TimesheetApprovalResult
+)
+
+
+DEFAULT_CHUNK_SIZE = 500
+
+T = TypeVar("T")
+
+_Candidate = Tuple[EmployeeId, Optional[Timesheet]]
+
+
+class BulkApproveTimesheetsUseCase:
+    """Approve many timesheets of one month at once, e.g. at month-end close.
+
+    Timesheets are loaded a page of ``chunk_size`` at a time, approved and
+    written with one save_all per page, which the SQLite backend commits in
+    a single transaction. A timesheet that cannot be approved (not found, not
+    submitted, assigned to another approver, or still conflicting after the
+    usual retries) gets a failed result and does not hold up the others.
+    """
+
+    def __init__(
+        self,
+        timesheet_repository: TimesheetRepository,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        self.timesheet_repository = timesheet_repository
+        self.chunk_size = chunk_size
+
+    def execute(self, request: BulkApproveTimesheetsRequest) -> BulkApproveTimesheetsResponse:
+        year_month = YearMonth.from_string(request.year_month)
+        reviewer_id = EmployeeId(request.reviewer_id)
+        results: List[TimesheetApprovalResult] = []
+
+        if request.employee_ids is None:
+            # Paged by employee, so timesheets that fail to approve (and stay
+            # submitted) are not fetched again
+            after: Optional[EmployeeId] = None
+            while True:
+                page = self.timesheet_repository.find_by_approver(
+                    year_month,
+                    reviewer_id,
+                    TimesheetStatus.SUBMITTED,
+                    after=after,
+                    limit=self.chunk_size
+                )
+                if not page:
+                    break
+                candidates: List[_Candidate] = [
+                    (timesheet.employee_id, timesheet) for timesheet in page
+                ]
+                results.extend(self._approve_chunk(year_month, reviewer_id, candidates))
+                after = page[-1].employee_id
+        else:
+            # Each employee is approved (and reported) once
+            employee_ids = [
+                EmployeeId(employee_id) for employee_id in dict.fromkeys(request.employee_ids)
+            ]
+            for id_chunk in _chunks(employee_ids, self.chunk_size):
+                candidates = [
+                    (employee_id, self.timesheet_repository.find_by(employee_id, year_month))
+                    for employee_id in id_chunk
+                ]
+                results.extend(self._approve_chunk(year_month, reviewer_id, candidates))
+
+        return _bulk_response(results)
+
+    def _approve_chunk(
+        self,
+        year_month: YearMonth,
+        reviewer_id: EmployeeId,
+        candidates: Sequence[_Candidate]
+    ) -> List[TimesheetApprovalResult]:
+        # Approved timesheets are reported as successes until their save says otherwise
+        results: List[TimesheetApprovalResult] = []
+        approved: List[Tuple[int, Timesheet]] = []
+        for employee_id, timesheet in candidates:
+            try:
+                approved_timesheet = _approve(year_month, reviewer_id, employee_id, timesheet)
+            except Exception as e:
+                results.append(_failure(employee_id, timesheet, e))
+                continue
+            approved.append((len(results), approved_timesheet))
+            results.append(_success(approved_timesheet))
+
+        try:
+            errors = self.timesheet_repository.save_all([timesheet for _, timesheet in approved])
+        except Exception as e:
+            for position, timesheet in approved:
+                results[position] = _failure(timesheet.employee_id, None, e)
+            return results
+
+        for (position, timesheet), error in zip(approved, errors):
+            if error is not None:
+                # Changed since it was loaded: approve the current version
+                results[position] = self._approve_one(
+                    year_month, reviewer_id, timesheet.employee_id
+                )
+        return results
+
+    def _approve_one(
+        self,
+        year_month: YearMonth,
+        reviewer_id: EmployeeId,
+        employee_id: EmployeeId
+    ) -> TimesheetApprovalResult:
+        def approve_once() -> Timesheet:
+            timesheet = _approve(
+                year_month,
+                reviewer_id,
+                employee_id,
+                self.timesheet_repository.find_by(employee_id, year_month)
+            )
+            self.timesheet_repository.save(timesheet)
+            return timesheet
+
+        try:
+            return _success(retry_on_conflict(approve_once))
+        except Exception as e:
+            return _failure(employee_id, None, e)
+
+
+def _approve(
+    year_month: YearMonth,
+    reviewer_id: EmployeeId,
+    employee_id: EmployeeId,
+    timesheet: Optional[Timesheet]
+) -> Timesheet:
+    timesheet = _require_timesheet(year_month, employee_id, timesheet)
+    timesheet.approve(reviewer_id)
+    return timesheet
+
+
+def _require_timesheet(
+    year_month: YearMonth,
+    employee_id: EmployeeId,
+    timesheet: Optional[Timesheet]
+) -> Timesheet:
+    if not timesheet:
+        raise TimesheetNotFoundError(
+            f"No timesheet found for employee {employee_id} in {year_month}"
+        )
+    return timesheet
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _success(timesheet: Timesheet) -> TimesheetApprovalResult:
+    return TimesheetApprovalResult(
+        employee_id=timesheet.employee_id,
+        success=True,
+        message="Successfully approved timesheet",
+        status=timesheet.status.value
+    )
+
+
+def _failure(
+    employee_id: EmployeeId,
+    timesheet: Optional[Timesheet],
+    error: Exception
+) -> TimesheetApprovalResult:
+    if isinstance(error, DomainException):
+        message = str(error)
+    else:
+        message = f"An error occurred: {str(error)}"
+    return TimesheetApprovalResult(
+        employee_id=employee_id,
+        success=False,
+        message=message,
+        # The stored status when the approval itself was refused
+        status=timesheet.status.value if timesheet else "error"
+    )
+
+
+def _bulk_response(results: List[TimesheetApprovalResult]) -> BulkApproveTimesheetsResponse:
+    succeeded = sum(1 for result in results if result.success)
+    return BulkApproveTimesheetsResponse(
+        processed=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results
+    )
@@ -1,5 +1,8 @@
-from datetime import datetime
+from typing import Optional, Tuple
 from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
+from ...domain.repositories.leave_request_repository import LeaveRequestRepository
+from ...domain.repositories.async_leave_request_repository import AsyncLeaveRequestRepository
 from ...domain.models import (
     Timesheet,
     TimesheetId,
@@ -8,64 +11,159 @@ from ...domain.models import (
     Date,
     DateTime
 )
+from .conflict_retry import retry_on_conflict, retry_on_conflict_async
 from ..dtos.attendance_dtos import ClockInRequest, ClockInResponse
-from ...domain.exceptions import InvalidStateTransitionError
+from ..dtos.presence_dtos import PresenceEvent
+from .presence_publisher import PresencePublisher
+from ...domain.exceptions import (
+    InvalidStateTransitionError,
+    EmployeeOnLeaveError,
+    TimesheetAlreadySubmittedError
+)
 
 
 class ClockInUseCase:
-    def __init__(self, timesheet_repository: TimesheetRepository):
+    def __init__(
+        self,
+        timesheet_repository: TimesheetRepository,
+        leave_request_repository: Optional[LeaveRequestRepository] = None,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
         self.timesheet_repository = timesheet_repository
+        self.leave_request_repository = leave_request_repository
+        self.presence_publisher = presence_publisher
 
     def execute(self, request: ClockInRequest) -> ClockInResponse:
         try:
-            employee_id = EmployeeId(request.employee_id)
-            clock_in_datetime = DateTime(request.clock_in_time)
-            date = Date(request.clock_in_time.date())
+            if self.leave_request_repository:
+                _ensure_not_on_leave(
+                    request,
+                    self.leave_request_repository.has_approved_leave_on(*_leave_key(request))
+                )
+            return retry_on_conflict(lambda: self._execute_once(request))
+
+        except Exception as e:
+            return _error_response(request, e)
+
+    def _execute_once(self, request: ClockInRequest) -> ClockInResponse:
+        employee_id, year_month = _timesheet_key(request)
+        timesheet = self.timesheet_repository.find_by(employee_id, year_month)
+        timesheet, response = _clock_in(request, timesheet)
+        self.timesheet_repository.save(timesheet)
+        if self.presence_publisher:
+            self.presence_publisher.publish(_presence_event(request, response))
+        return response
+
+
+class AsyncClockInUseCase:
+    def __init__(
+        self,
+        timesheet_repository: AsyncTimesheetRepository,
+        leave_request_repository: Optional[AsyncLeaveRequestRepository] = None,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
+        self.timesheet_repository = timesheet_repository
+        self.leave_request_repository = leave_request_repository
+        self.presence_publisher = presence_publisher
+
+    async def execute(self, request: ClockInRequest) -> ClockInResponse:
+        try:
+            if self.leave_request_repository:
+                _ensure_not_on_leave(
+                    request,
+                    await self.leave_request_repository.has_approved_leave_on(*_leave_key(request))
+                )
+            return await retry_on_conflict_async(lambda: self._execute_once(request))
+
+        except Exception as e:
+            return _error_response(request, e)
+
+    async def _execute_once(self, request: ClockInRequest) -> ClockInResponse:
+        employee_id, year_month = _timesheet_key(request)
+        timesheet = await self.timesheet_repository.find_by(employee_id, year_month)
+        timesheet, response = _clock_in(request, timesheet)
+        await self.timesheet_repository.save(timesheet)
+        if self.presence_publisher:
+            self.presence_publisher.publish(_presence_event(request, response))
+        return response
 
-            year_month = YearMonth(
+
+def _timesheet_key(request: ClockInRequest) -> Tuple[EmployeeId, YearMonth]:
+    year_month = YearMonth(
+        year=request.clock_in_time.year,
+        month=request.clock_in_time.month
+    )
+    return EmployeeId(request.employee_id), year_month
+
+
+def _leave_key(request: ClockInRequest) -> Tuple[EmployeeId, Date]:
+    return EmployeeId(request.employee_id), Date(request.clock_in_time.date())
+
+
+def _ensure_not_on_leave(request: ClockInRequest, on_leave: bool) -> None:
+    if on_leave:
+        raise EmployeeOnLeaveError(
+            f"Cannot clock in on {request.clock_in_time.date().isoformat()}: "
+            "employee is on approved leave"
+        )
+
+
+def _clock_in(
+    request: ClockInRequest,
+    timesheet: Optional[Timesheet]
+) -> Tuple[Timesheet, ClockInResponse]:
+    employee_id = EmployeeId(request.employee_id)
+    clock_in_datetime = DateTime(request.clock_in_time)
+    date = Date(request.clock_in_time.date())
+
+    if not timesheet:
+        import uuid
+        timesheet = Timesheet(
+            timesheet_id=TimesheetId(str(uuid.uuid4())),
+            employee_id=employee_id,
+            year_month=YearMonth(
                 year=request.clock_in_time.year,
                 month=request.clock_in_time.month
             )
+        )
 
-            timesheet = self.timesheet_repository.find_by(employee_id, year_month)
+    entry = timesheet.get_or_create_entry(date)
+    entry.clock_in(clock_in_datetime)
 
-            if not timesheet:
-                import uuid
-                timesheet = Timesheet(
-                    timesheet_id=TimesheetId(str(uuid.uuid4())),
-                    employee_id=employee_id,
-                    year_month=year_month
-                )
+    return timesheet, ClockInResponse(
+        success=True,
+        message="Successfully clocked in",
+        employee_id=request.employee_id,
+        date=date.value.isoformat(),
+        clock_in_time=clock_in_datetime.value.isoformat(),
+        current_state=entry.state.value
+    )
 
-            entry = timesheet.get_or_create_entry(date)
-            entry.clock_in(clock_in_datetime)
 
-            self.timesheet_repository.save(timesheet)
+def _presence_event(request: ClockInRequest, response: ClockInResponse) -> PresenceEvent:
+    return PresenceEvent(
+        employee_id=request.employee_id,
+        site_id=request.site_id,
+        event_type="clock_in",
+        current_state=response.current_state,
+        occurred_at=response.clock_in_time
+    )
 
-            return ClockInResponse(
-                success=True,
-                message="Successfully clocked in",
-                employee_id=request.employee_id,
-                date=date.value.isoformat(),
-                clock_in_time=clock_in_datetime.value.isoformat(),
-                current_state=entry.state.value
-            )
 
-        except InvalidStateTransitionError as e:
-            return ClockInResponse(
-                success=False,
-                message=str(e),
-                employee_id=request.employee_id,
-                date=request.clock_in_time.date().isoformat(),
-                clock_in_time=request.clock_in_time.isoformat(),
-                current_state="error"
-            )
-        except Exception as e:
-            return ClockInResponse(
-                success=False,
-                message=f"An error occurred: {str(e)}",
-                employee_id=request.employee_id,
-                date=request.clock_in_time.date().isoformat(),
-                clock_in_time=request.clock_in_time.isoformat(),
-                current_state="error"
-            )
\ No newline at end of file
+def _error_response(request: ClockInRequest, error: Exception) -> ClockInResponse:
+    if isinstance(
+        error,
+        (InvalidStateTransitionError, EmployeeOnLeaveError, TimesheetAlreadySubmittedError)
+    ):
+        message = str(error)
+    else:
+        message = f"An error occurred: {str(error)}"
+
+    return ClockInResponse(
+        success=False,
+        message=message,
+        employee_id=request.employee_id,
+        date=request.clock_in_time.date().isoformat(),
+        clock_in_time=request.clock_in_time.isoformat(),
+        current_state="error"
+    )
@@ -1,87 +1,141 @@
-from datetime import datetime
+from typing import Optional, Tuple
 from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
 from ...domain.models import (
     Timesheet,
-    TimesheetId,
     EmployeeId,
     YearMonth,
     Date,
     DateTime
 )
+from .conflict_retry import retry_on_conflict, retry_on_conflict_async
 from ..dtos.attendance_dtos import ClockOutRequest, ClockOutResponse
-from ...domain.exceptions import InvalidStateTransitionError
+from ..dtos.presence_dtos import PresenceEvent
+from .presence_publisher import PresencePublisher
+from ...domain.exceptions import InvalidStateTransitionError, TimesheetAlreadySubmittedError
 
 
 class ClockOutUseCase:
-    def __init__(self, timesheet_repository: TimesheetRepository):
+    def __init__(
+        self,
+        timesheet_repository: TimesheetRepository,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
         self.timesheet_repository = timesheet_repository
+        self.presence_publisher = presence_publisher
 
     def execute(self, request: ClockOutRequest) -> ClockOutResponse:
         try:
-            employee_id = EmployeeId(request.employee_id)
-            clock_out_datetime = DateTime(request.clock_out_time)
-            date = Date(request.clock_out_time.date())
-
-            year_month = YearMonth(
-                year=request.clock_out_time.year,
-                month=request.clock_out_time.month
-            )
-
-            timesheet = self.timesheet_repository.find_by(employee_id, year_month)
-
-            if not timesheet:
-                return ClockOutResponse(
-                    success=False,
-                    message="No timesheet found for this employee and month",
-                    employee_id=request.employee_id,
-                    date=date.value.isoformat(),
-                    clock_out_time=clock_out_datetime.value.isoformat(),
-                    current_state="error"
-                )
-
-            entry = timesheet.get_entry(date)
-            if not entry:
-                return ClockOutResponse(
-                    success=False,
-                    message="No attendance entry found for this date",
-                    employee_id=request.employee_id,
-                    date=date.value.isoformat(),
-                    clock_out_time=clock_out_datetime.value.isoformat(),
-                    current_state="error"
-                )
-
-            entry.clock_out(clock_out_datetime)
-
-            worked_minutes = entry.calculate_worked_minutes()
-            worked_minutes_value = worked_minutes.value if worked_minutes else None
+            return retry_on_conflict(lambda: self._execute_once(request))
 
+        except Exception as e:
+            return _error_response(request, e)
+
+    def _execute_once(self, request: ClockOutRequest) -> ClockOutResponse:
+        employee_id, year_month = _timesheet_key(request)
+        timesheet = self.timesheet_repository.find_by(employee_id, year_month)
+        response = _clock_out(request, timesheet)
+        if timesheet and response.success:
             self.timesheet_repository.save(timesheet)
+            if self.presence_publisher:
+                self.presence_publisher.publish(_presence_event(request, response))
+        return response
+
+
+class AsyncClockOutUseCase:
+    def __init__(
+        self,
+        timesheet_repository: AsyncTimesheetRepository,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
+        self.timesheet_repository = timesheet_repository
+        self.presence_publisher = presence_publisher
+
+    async def execute(self, request: ClockOutRequest) -> ClockOutResponse:
+        try:
+            return await retry_on_conflict_async(lambda: self._execute_once(request))
 
-            return ClockOutResponse(
-                success=True,
-                message="Successfully clocked out",
-                employee_id=request.employee_id,
-                date=date.value.isoformat(),
-                clock_out_time=clock_out_datetime.value.isoformat(),
-                current_state=entry.state.value,
-                worked_minutes=worked_minutes_value
-            )
-
-        except InvalidStateTransitionError as e:
-            return ClockOutResponse(
-                success=False,
-                message=str(e),
-                employee_id=request.employee_id,
-                date=request.clock_out_time.date().isoformat(),
-                clock_out_time=request.clock_out_time.isoformat(),
-                current_state="error"
-            )
         except Exception as e:
-            return ClockOutResponse(
-                success=False,
-                message=f"An error occurred: {str(e)}",
-                employee_id=request.employee_id,
-                date=request.clock_out_time.date().isoformat(),
-                clock_out_time=request.clock_out_time.isoformat(),
-                current_state="error"
-            )
\ No newline at end of file
+            return _error_response(request, e)
+
+    async def _execute_once(self, request: ClockOutRequest) -> ClockOutResponse:
+        employee_id, year_month = _timesheet_key(request)
+        timesheet = await self.timesheet_repository.find_by(employee_id, year_month)
+        response = _clock_out(request, timesheet)
+        if timesheet and response.success:
+            await self.timesheet_repository.save(timesheet)
+            if self.presence_publisher:
+                self.presence_publisher.publish(_presence_event(request, response))
+        return response
+
+
+def _timesheet_key(request: ClockOutRequest) -> Tuple[EmployeeId, YearMonth]:
+    year_month = YearMonth(
+        year=request.clock_out_time.year,
+        month=request.clock_out_time.month
+    )
+    return EmployeeId(request.employee_id), year_month
+
+
+def _clock_out(request: ClockOutRequest, timesheet: Optional[Timesheet]) -> ClockOutResponse:
+    clock_out_datetime = DateTime(request.clock_out_time)
+    date = Date(request.clock_out_time.date())
+
+    if not timesheet:
+        return ClockOutResponse(
+            success=False,
+            message="No timesheet found for this employee and month",
+            employee_id=request.employee_id,
+            date=date.value.isoformat(),
+            clock_out_time=clock_out_datetime.value.isoformat(),
+            current_state="error"
+        )
+
+    entry = timesheet.get_entry_for_update(date)
+    if not entry:
+        return ClockOutResponse(
+            success=False,
+            message="No attendance entry found for this date",
+            employee_id=request.employee_id,
+            date=date.value.isoformat(),
+            clock_out_time=clock_out_datetime.value.isoformat(),
+            current_state="error"
+        )
+
+    entry.clock_out(clock_out_datetime)
+
+    return ClockOutResponse(
+        success=True,
+        message="Successfully clocked out",
+        employee_id=request.employee_id,
+        date=date.value.isoformat(),
+        clock_out_time=clock_out_datetime.value.isoformat(),
+        current_state=entry.state.value,
+        worked_minutes=entry.worked_minutes
+    )
+
+
+def _presence_event(request: ClockOutRequest, response: ClockOutResponse) -> PresenceEvent:
+    return PresenceEvent(
+        employee_id=request.employee_id,
+        site_id=request.site_id,
+        event_type="clock_out",
+        current_state=response.current_state,
+        occurred_at=response.clock_out_time
+    )
+
+
+def _error_response(request: ClockOutRequest, error: Exception) -> ClockOutResponse:
+    if isinstance(error, (InvalidStateTransitionError, TimesheetAlreadySubmittedError)):
+        message = str(error)
+    else:
+        message = f"An error occurred: {str(error)}"
+
+    return ClockOutResponse(
+        success=False,
+        message=message,
+        employee_id=request.employee_id,
+        date=request.clock_out_time.date().isoformat(),
+        clock_out_time=request.clock_out_time.isoformat(),
+        current_state="error"
+    )
@@ -0,0 +1,27 @@
+from typing import Awaitable, Callable, TypeVar
+from ...domain.exceptions import ConcurrencyConflictError
+
+
+T = TypeVar("T")
+
+MAX_CONFLICT_ATTEMPTS = 5
+
+
+def retry_on_conflict(operation: Callable[[], T]) -> T:
+    """Re-run a load/modify/save operation when the save loses a version race"""
+    for _ in range(MAX_CONFLICT_ATTEMPTS - 1):
+        try:
+            return operation()
+        except ConcurrencyConflictError:
+            continue
+    return operation()
+
+
+async def retry_on_conflict_async(operation: Callable[[], Awaitable[T]]) -> T:
+    """Async counterpart of retry_on_conflict"""
+    for _ in range(MAX_CONFLICT_ATTEMPTS - 1):
+        try:
+            return await operation()
+        except ConcurrencyConflictError:
+            continue
+    return await operation()
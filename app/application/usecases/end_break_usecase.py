@@ -1,108 +1,150 @@
-from datetime import datetime
+from typing import Optional, Tuple
 from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
 from ...domain.models import (
+    Timesheet,
     EmployeeId,
     YearMonth,
     Date,
     DateTime
 )
+from .conflict_retry import retry_on_conflict, retry_on_conflict_async
 from ..dtos.attendance_dtos import EndBreakRequest, EndBreakResponse
-from ...domain.exceptions import InvalidStateTransitionError, InvalidTimeRangeError
+from ..dtos.presence_dtos import PresenceEvent
+from .presence_publisher import PresencePublisher
+from ...domain.exceptions import (
+    InvalidStateTransitionError,
+    InvalidTimeRangeError,
+    TimesheetAlreadySubmittedError
+)
 
 
 class EndBreakUseCase:
-    def __init__(self, timesheet_repository: TimesheetRepository):
+    def __init__(
+        self,
+        timesheet_repository: TimesheetRepository,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
         self.timesheet_repository = timesheet_repository
+        self.presence_publisher = presence_publisher
 
     def execute(self, request: EndBreakRequest) -> EndBreakResponse:
         try:
-            employee_id = EmployeeId(request.employee_id)
-            break_end_datetime = DateTime(request.break_end_time)
-            date = Date(request.break_end_time.date())
-
-            year_month = YearMonth(
-                year=request.break_end_time.year,
-                month=request.break_end_time.month
-            )
-
-            timesheet = self.timesheet_repository.find_by(employee_id, year_month)
-
-            if not timesheet:
-                return EndBreakResponse(
-                    success=False,
-                    message="No timesheet found for this employee and month",
-                    employee_id=request.employee_id,
-                    date=date.value.isoformat(),
-                    break_end_time=break_end_datetime.value.isoformat(),
-                    current_state="error"
-                )
-
-            entry = timesheet.get_entry(date)
-            if not entry:
-                return EndBreakResponse(
-                    success=False,
-                    message="No attendance entry found for this date",
-                    employee_id=request.employee_id,
-                    date=date.value.isoformat(),
-                    break_end_time=break_end_datetime.value.isoformat(),
-                    current_state="error"
-                )
-
-            # Get the ongoing break to calculate duration
-            ongoing_break = None
-            for break_interval in entry.breaks:
-                if break_interval.is_ongoing():
-                    ongoing_break = break_interval
-                    break
-
-            entry.end_break(break_end_datetime)
+            return retry_on_conflict(lambda: self._execute_once(request))
+
+        except Exception as e:
+            return _error_response(request, e)
+
+    def _execute_once(self, request: EndBreakRequest) -> EndBreakResponse:
+        employee_id, year_month = _timesheet_key(request)
+        timesheet = self.timesheet_repository.find_by(employee_id, year_month)
+        response = _end_break(request, timesheet)
+        if timesheet and response.success:
             self.timesheet_repository.save(timesheet)
+            if self.presence_publisher:
+                self.presence_publisher.publish(_presence_event(request, response))
+        return response
+
+
+class AsyncEndBreakUseCase:
+    def __init__(
+        self,
+        timesheet_repository: AsyncTimesheetRepository,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
+        self.timesheet_repository = timesheet_repository
+        self.presence_publisher = presence_publisher
+
+    async def execute(self, request: EndBreakRequest) -> EndBreakResponse:
+        try:
+            return await retry_on_conflict_async(lambda: self._execute_once(request))
 
-            # Calculate the break duration if we found the ongoing break
-            break_duration_minutes = None
-            if ongoing_break:
-                # The break has now been ended, so we can get its duration
-                for break_interval in entry.breaks:
-                    if break_interval.start_at == ongoing_break.start_at:
-                        duration = break_interval.duration_minutes()
-                        if duration:
-                            break_duration_minutes = duration.value
-                        break
-
-            return EndBreakResponse(
-                success=True,
-                message="Successfully ended break",
-                employee_id=request.employee_id,
-                date=date.value.isoformat(),
-                break_end_time=break_end_datetime.value.isoformat(),
-                current_state=entry.state.value,
-                break_duration_minutes=break_duration_minutes
-            )
-
-        except InvalidStateTransitionError as e:
-            return EndBreakResponse(
-                success=False,
-                message=str(e),
-                employee_id=request.employee_id,
-                date=request.break_end_time.date().isoformat(),
-                break_end_time=request.break_end_time.isoformat(),
-                current_state="error"
-            )
-        except InvalidTimeRangeError as e:
-            return EndBreakResponse(
-                success=False,
-                message=str(e),
-                employee_id=request.employee_id,
-                date=request.break_end_time.date().isoformat(),
-                break_end_time=request.break_end_time.isoformat(),
-                current_state="error"
-            )
         except Exception as e:
-            return EndBreakResponse(
-                success=False,
-                message=f"An error occurred: {str(e)}",
-                employee_id=request.employee_id,
-                date=request.break_end_time.date().isoformat(),
-                break_end_time=request.break_end_time.isoformat(),
-                current_state="error"
-            )
\ No newline at end of file
+            return _error_response(request, e)
+
+    async def _execute_once(self, request: EndBreakRequest) -> EndBreakResponse:
+        employee_id, year_month = _timesheet_key(request)
+        timesheet = await self.timesheet_repository.find_by(employee_id, year_month)
+        response = _end_break(request, timesheet)
+        if timesheet and response.success:
+            await self.timesheet_repository.save(timesheet)
+            if self.presence_publisher:
+                self.presence_publisher.publish(_presence_event(request, response))
+        return response
+
+
+def _timesheet_key(request: EndBreakRequest) -> Tuple[EmployeeId, YearMonth]:
+    year_month = YearMonth(
+        year=request.break_end_time.year,
+        month=request.break_end_time.month
+    )
+    return EmployeeId(request.employee_id), year_month
+
+
+def _end_break(request: EndBreakRequest, timesheet: Optional[Timesheet]) -> EndBreakResponse:
+    break_end_datetime = DateTime(request.break_end_time)
+    date = Date(request.break_end_time.date())
+
+    if not timesheet:
+        return EndBreakResponse(
+            success=False,
+            message="No timesheet found for this employee and month",
+            employee_id=request.employee_id,
+            date=date.value.isoformat(),
+            break_end_time=break_end_datetime.value.isoformat(),
+            current_state="error"
+        )
+
+    entry = timesheet.get_entry_for_update(date)
+    if not entry:
+        return EndBreakResponse(
+            success=False,
+            message="No attendance entry found for this date",
+            employee_id=request.employee_id,
+            date=date.value.isoformat(),
+            break_end_time=break_end_datetime.value.isoformat(),
+            current_state="error"
+        )
+
+    ended_break = entry.end_break(break_end_datetime)
+    duration = ended_break.duration_minutes()
+    break_duration_minutes = duration.value if duration else None
+
+    return EndBreakResponse(
+        success=True,
+        message="Successfully ended break",
+        employee_id=request.employee_id,
+        date=date.value.isoformat(),
+        break_end_time=break_end_datetime.value.isoformat(),
+        current_state=entry.state.value,
+        break_duration_minutes=break_duration_minutes
+    )
+
+
+def _presence_event(request: EndBreakRequest, response: EndBreakResponse) -> PresenceEvent:
+    return PresenceEvent(
+        employee_id=request.employee_id,
+        site_id=request.site_id,
+        event_type="end_break",
+        current_state=response.current_state,
+        occurred_at=response.break_end_time
+    )
+
+
+def _error_response(request: EndBreakRequest, error: Exception) -> EndBreakResponse:
+    if isinstance(
+        error,
+        (InvalidStateTransitionError, InvalidTimeRangeError, TimesheetAlreadySubmittedError)
+    ):
+        message = str(error)
+    else:
+        message = f"An error occurred: {str(error)}"
+
+    return EndBreakResponse(
+        success=False,
+        message=message,
+        employee_id=request.employee_id,
+        date=request.break_end_time.date().isoformat(),
+        break_end_time=request.break_end_time.isoformat(),
+        current_state="error"
+    )
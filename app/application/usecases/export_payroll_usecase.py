@@ -0,0 +1,171 @@
+import time
+from array import array
+from datetime import timedelta
+from typing import TYPE_CHECKING, List, Tuple
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.models import Timesheet, YearMonth
+from ...domain.models.timesheet import STANDARD_HOURS_PER_DAY
+from ..dtos.payroll_dtos import ExportPayrollRequest, PayrollExport, MinuteColumn
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    try:
+        import numpy as np
+    except ImportError:  # NumPy is optional; the pure-Python path gives the same totals
+        np = None
+
+
+_MICROSECONDS_PER_MINUTE = 60_000_000
+
+# Worked, break and overtime minutes per employee
+_Totals = Tuple[MinuteColumn, MinuteColumn, MinuteColumn]
+
+
+class ExportPayrollUseCase:
+    """Worked, break and overtime minutes for every employee in a month.
+
+    Timesheets are projected once into flat columns of interval lengths in
+    microseconds, and the minute arithmetic runs over whole columns (vectorized when NumPy
+    is available). Each duration is floored to whole minutes exactly like
+    BreakInterval.duration_minutes and AttendanceEntry.calculate_worked_minutes,
+    so the totals match Timesheet.calculate_overtime_minutes.
+    """
+
+    def __init__(self, timesheet_repository: TimesheetRepository):
+        self.timesheet_repository = timesheet_repository
+
+    def execute(self, request: ExportPayrollRequest) -> PayrollExport:
+        started = time.perf_counter()
+        year_month = YearMonth.from_string(request.year_month)
+
+        columns = _PayrollColumns()
+        for timesheet in self.timesheet_repository.find_all_by_year_month(year_month):
+            columns.add_timesheet(timesheet)
+
+        totals: _Totals
+        if np is not None:
+            totals = columns.totals_numpy()
+        else:
+            totals = columns.totals_python()
+        worked, breaks, overtime = totals
+
+        return PayrollExport(
+            year_month=str(year_month),
+            employee_ids=columns.employee_ids,
+            statuses=columns.statuses,
+            worked_minutes=worked,
+            break_minutes=breaks,
+            overtime_minutes=overtime,
+            days_present=columns.days_present,
+            elapsed_seconds=time.perf_counter() - started
+        )
+
+
+class _PayrollColumns:
+    """Columnar projection of a month of timesheets.
+
+    Shifts are the entries with both clock in and clock out, stored as their
+    length in microseconds; completed breaks likewise, pointing at their
+    employee and, when it has one, their shift.
+    """
+
+    def __init__(self) -> None:
+        self.employee_ids: List[str] = []
+        self.statuses: List[str] = []
+        self.days_present: List[int] = []
+
+        self.shift_employee = array("q")
+        self.shift_length = array("q")
+
+        self.break_employee = array("q")
+        self.break_shift = array("q")
+        self.break_length = array("q")
+
+    def add_timesheet(self, timesheet: Timesheet) -> None:
+        employee = len(self.employee_ids)
+        self.employee_ids.append(timesheet.employee_id)
+        self.statuses.append(timesheet.status.value)
+
+        days_present = 0
+        for entry in timesheet.entries.values():
+            if not entry.clock_in_at:
+                continue
+            days_present += 1
+
+            shift = -1
+            if entry.clock_out_at:
+                shift = len(self.shift_length)
+                self.shift_employee.append(employee)
+                self.shift_length.append(
+                    _microseconds(entry.clock_out_at.value - entry.clock_in_at.value)
+                )
+
+            for break_interval in entry.breaks:
+                if break_interval.end_at is None:
+                    continue
+                self.break_employee.append(employee)
+                self.break_shift.append(shift)
+                self.break_length.append(
+                    _microseconds(break_interval.end_at.value - break_interval.start_at.value)
+                )
+
+        self.days_present.append(days_present)
+
+    def totals_numpy(self) -> Tuple["NDArray[np.int64]", "NDArray[np.int64]", "NDArray[np.int64]"]:
+        employees = len(self.employee_ids)
+
+        break_minutes = np.frombuffer(self.break_length, dtype=np.int64) // _MICROSECONDS_PER_MINUTE
+        break_shift = np.frombuffer(self.break_shift, dtype=np.int64)
+        in_shift = break_shift >= 0
+        shift_break_minutes = np.bincount(
+            break_shift[in_shift],
+            weights=break_minutes[in_shift],
+            minlength=len(self.shift_length)
+        ).astype(np.int64)
+
+        shift_worked = (
+            np.frombuffer(self.shift_length, dtype=np.int64) // _MICROSECONDS_PER_MINUTE
+            - shift_break_minutes
+        )
+        shift_overtime = np.maximum(shift_worked - STANDARD_HOURS_PER_DAY * 60, 0)
+
+        # bincount sums in float64, which is exact for any realistic minute total
+        shift_employee = np.frombuffer(self.shift_employee, dtype=np.int64)
+        worked = np.bincount(shift_employee, weights=shift_worked, minlength=employees)
+        overtime = np.bincount(shift_employee, weights=shift_overtime, minlength=employees)
+        breaks = np.bincount(
+            np.frombuffer(self.break_employee, dtype=np.int64),
+            weights=break_minutes,
+            minlength=employees
+        )
+        return worked.astype(np.int64), breaks.astype(np.int64), overtime.astype(np.int64)
+
+    def totals_python(self) -> Tuple[List[int], List[int], List[int]]:
+        employees = len(self.employee_ids)
+        worked = [0] * employees
+        overtime = [0] * employees
+        breaks = [0] * employees
+        shift_break_minutes = [0] * len(self.shift_length)
+        standard_minutes = STANDARD_HOURS_PER_DAY * 60
+
+        for employee, shift, length in zip(self.break_employee, self.break_shift, self.break_length):
+            minutes = length // _MICROSECONDS_PER_MINUTE
+            breaks[employee] += minutes
+            if shift >= 0:
+                shift_break_minutes[shift] += minutes
+
+        for employee, length, break_minutes in zip(
+            self.shift_employee, self.shift_length, shift_break_minutes
+        ):
+            shift_worked = length // _MICROSECONDS_PER_MINUTE - break_minutes
+            worked[employee] += shift_worked
+            if shift_worked > standard_minutes:
+                overtime[employee] += shift_worked - standard_minutes
+
+        return worked, breaks, overtime
+
+
+def _microseconds(delta: timedelta) -> int:
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
@@ -0,0 +1,49 @@
+from typing import Optional
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
+from ...domain.models import Timesheet, EmployeeId, YearMonth
+from ...domain.exceptions import TimesheetNotFoundError
+from ..dtos.timesheet_dtos import MonthlySummaryRequest, MonthlySummaryResponse
+
+
+class GetMonthlySummaryUseCase:
+    def __init__(self, timesheet_repository: TimesheetRepository):
+        self.timesheet_repository = timesheet_repository
+
+    def execute(self, request: MonthlySummaryRequest) -> MonthlySummaryResponse:
+        year_month = YearMonth.from_string(request.year_month)
+        timesheet = self.timesheet_repository.find_by(EmployeeId(request.employee_id), year_month)
+        return _summary_response(request, timesheet)
+
+
+class AsyncGetMonthlySummaryUseCase:
+    def __init__(self, timesheet_repository: AsyncTimesheetRepository):
+        self.timesheet_repository = timesheet_repository
+
+    async def execute(self, request: MonthlySummaryRequest) -> MonthlySummaryResponse:
+        year_month = YearMonth.from_string(request.year_month)
+        timesheet = await self.timesheet_repository.find_by(
+            EmployeeId(request.employee_id), year_month
+        )
+        return _summary_response(request, timesheet)
+
+
+def _summary_response(
+    request: MonthlySummaryRequest,
+    timesheet: Optional[Timesheet]
+) -> MonthlySummaryResponse:
+    if not timesheet:
+        raise TimesheetNotFoundError(
+            f"No timesheet found for employee {request.employee_id} in {request.year_month}"
+        )
+
+    totals = timesheet.monthly_totals()
+    return MonthlySummaryResponse(
+        employee_id=request.employee_id,
+        year_month=str(timesheet.year_month),
+        status=timesheet.status.value,
+        total_worked_minutes=totals.worked_minutes,
+        total_break_minutes=totals.break_minutes,
+        overtime_minutes=totals.overtime_minutes,
+        days_present=totals.days_present
+    )
@@ -0,0 +1,192 @@
+import time
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.models import (
+    Timesheet,
+    TimesheetId,
+    EmployeeId,
+    YearMonth,
+    Date,
+    DateTime,
+    AttendanceEntry,
+    AttendanceState,
+    BreakInterval
+)
+from ...domain.exceptions import DomainException, InvalidTimeRangeError
+from .conflict_retry import retry_on_conflict
+from ..dtos.import_dtos import (
+    AttendanceImportRecord,
+    AttendanceImportError,
+    ImportAttendanceResponse
+)
+
+
+DEFAULT_CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 100
+
+_GroupKey = Tuple[EmployeeId, YearMonth]
+_ParsedRow = Tuple[int, AttendanceEntry]
+
+
+class ImportAttendanceUseCase:
+    """Backfill historical attendance from a stream of records.
+
+    Records are turned straight into AttendanceEntry objects and written in
+    chunks of ``chunk_size`` rows, one load/save per timesheet per chunk, so
+    memory use does not depend on the size of the input.
+    """
+
+    def __init__(
+        self,
+        timesheet_repository: TimesheetRepository,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_progress: Optional[Callable[[ImportAttendanceResponse], None]] = None
+    ):
+        self.timesheet_repository = timesheet_repository
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+
+    def execute(self, records: Iterable[AttendanceImportRecord]) -> ImportAttendanceResponse:
+        started = time.perf_counter()
+        response = ImportAttendanceResponse(
+            rows_read=0,
+            rows_imported=0,
+            rows_failed=0,
+            elapsed_seconds=0.0,
+            rows_per_second=0.0
+        )
+
+        chunk: Dict[_GroupKey, List[_ParsedRow]] = {}
+        chunk_rows = 0
+        for record in records:
+            response.rows_read += 1
+            try:
+                key, entry = _parse_record(record)
+            except Exception as e:
+                _record_error(response, record.line_number, e)
+                continue
+
+            chunk.setdefault(key, []).append((record.line_number, entry))
+            chunk_rows += 1
+            if chunk_rows >= self.chunk_size:
+                self._write_chunk(chunk, response, started)
+                chunk = {}
+                chunk_rows = 0
+
+        self._write_chunk(chunk, response, started)
+        return response
+
+    def _write_chunk(
+        self,
+        chunk: Dict[_GroupKey, List[_ParsedRow]],
+        response: ImportAttendanceResponse,
+        started: float
+    ) -> None:
+        for key, rows in chunk.items():
+            try:
+                retry_on_conflict(lambda: self._write_timesheet(key, rows))
+                response.rows_imported += len(rows)
+            except Exception as e:
+                for line_number, _ in rows:
+                    _record_error(response, line_number, e)
+
+        response.elapsed_seconds = time.perf_counter() - started
+        if response.elapsed_seconds > 0:
+            response.rows_per_second = response.rows_read / response.elapsed_seconds
+        if self.on_progress:
+            self.on_progress(response)
+
+    def _write_timesheet(self, key: _GroupKey, rows: List[_ParsedRow]) -> None:
+        employee_id, year_month = key
+        timesheet = self.timesheet_repository.find_by(employee_id, year_month)
+        if not timesheet:
+            timesheet = Timesheet(
+                timesheet_id=TimesheetId(str(uuid.uuid4())),
+                employee_id=employee_id,
+                year_month=year_month
+            )
+
+        for _, entry in rows:
+            timesheet.add_or_update_entry(entry)
+        self.timesheet_repository.save(timesheet)
+
+
+def _parse_record(record: AttendanceImportRecord) -> Tuple[_GroupKey, AttendanceEntry]:
+    if record.error:
+        raise ValueError(record.error)
+    fields: Dict[str, Any] = record.fields or {}
+
+    employee_id = fields.get("employee_id")
+    if not employee_id:
+        raise ValueError("employee_id is required")
+    entry_date = date.fromisoformat(fields["date"])
+
+    clock_in_at = _parse_datetime(fields.get("clock_in_at"))
+    clock_out_at = _parse_datetime(fields.get("clock_out_at"))
+    breaks = [
+        BreakInterval(start_at=DateTime(datetime.fromisoformat(start)), end_at=_parse_datetime(end))
+        for start, end in fields.get("breaks") or []
+    ]
+    _validate_within_shift(clock_in_at, clock_out_at, breaks)
+
+    if clock_out_at:
+        state = AttendanceState.CLOCKED_OUT
+    elif breaks and breaks[-1].is_ongoing():
+        state = AttendanceState.ON_BREAK
+    elif clock_in_at:
+        state = AttendanceState.CLOCKED_IN
+    else:
+        state = AttendanceState.CLOCKED_OUT
+
+    entry = AttendanceEntry(
+        date=Date(entry_date),
+        state=state,
+        clock_in_at=clock_in_at,
+        clock_out_at=clock_out_at,
+        breaks=breaks,
+        notes=fields.get("notes") or ""
+    )
+    key = (EmployeeId(employee_id), YearMonth(year=entry_date.year, month=entry_date.month))
+    return key, entry
+
+
+def _validate_within_shift(
+    clock_in_at: Optional[DateTime],
+    clock_out_at: Optional[DateTime],
+    breaks: List[BreakInterval]
+) -> None:
+    if breaks and not clock_in_at:
+        raise InvalidTimeRangeError("Breaks require a clock in time")
+    if clock_out_at and not clock_in_at:
+        raise InvalidTimeRangeError("Clock out time requires a clock in time")
+
+    for break_interval in breaks:
+        if clock_in_at and break_interval.start_at <= clock_in_at:
+            raise InvalidTimeRangeError(
+                f"Break start time {break_interval.start_at} must be after clock in time {clock_in_at}"
+            )
+        if clock_out_at and (break_interval.end_at is None or break_interval.end_at >= clock_out_at):
+            raise InvalidTimeRangeError(
+                f"Clock out time {clock_out_at} must be after all break end times"
+            )
+
+    for break_interval in breaks[:-1]:
+        if break_interval.is_ongoing():
+            raise InvalidTimeRangeError("Only the last break may be ongoing")
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[DateTime]:
+    return DateTime(datetime.fromisoformat(value)) if value else None
+
+
+def _record_error(response: ImportAttendanceResponse, line_number: int, error: Exception) -> None:
+    response.rows_failed += 1
+    if len(response.errors) >= MAX_REPORTED_ERRORS:
+        return
+    if isinstance(error, DomainException):
+        message = str(error)
+    else:
+        message = f"An error occurred: {str(error)}"
+    response.errors.append(AttendanceImportError(line_number=line_number, message=message))
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from ..dtos.presence_dtos import PresenceEvent
+
+
+class PresencePublisher(ABC):
+    """Receives the attendance state transitions the use cases commit"""
+
+    @abstractmethod
+    def publish(self, event: PresenceEvent) -> None:
+        """Deliver event without blocking; called after the timesheet is saved"""
+        pass
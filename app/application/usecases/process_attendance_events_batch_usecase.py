@@ -0,0 +1,287 @@
+import uuid
+from typing import Dict, List, Optional, Set, Tuple
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
+from ...domain.repositories.leave_request_repository import LeaveRequestRepository
+from ...domain.repositories.async_leave_request_repository import AsyncLeaveRequestRepository
+from ...domain.models import (
+    Timesheet,
+    TimesheetId,
+    EmployeeId,
+    YearMonth,
+    Date,
+    DateTime,
+    AttendanceEntry
+)
+from ...domain.exceptions import (
+    ConcurrencyConflictError,
+    DomainException,
+    EmployeeOnLeaveError
+)
+from .conflict_retry import retry_on_conflict, retry_on_conflict_async
+from ..dtos.attendance_dtos import (
+    AttendanceEvent,
+    AttendanceEventsBatchRequest,
+    AttendanceEventsBatchResponse,
+    AttendanceEventResult
+)
+from ..dtos.presence_dtos import PresenceEvent
+from .presence_publisher import PresencePublisher
+
+
+CLOCK_IN = "clock_in"
+START_BREAK = "start_break"
+END_BREAK = "end_break"
+CLOCK_OUT = "clock_out"
+
+_ENTRY_TRANSITIONS = {
+    START_BREAK: AttendanceEntry.start_break,
+    END_BREAK: AttendanceEntry.end_break,
+    CLOCK_OUT: AttendanceEntry.clock_out,
+}
+
+_SUCCESS_MESSAGES = {
+    CLOCK_IN: "Successfully clocked in",
+    START_BREAK: "Successfully started break",
+    END_BREAK: "Successfully ended break",
+    CLOCK_OUT: "Successfully clocked out",
+}
+
+_GroupKey = Tuple[EmployeeId, YearMonth]
+_IndexedEvent = Tuple[int, AttendanceEvent]
+
+
+class ProcessAttendanceEventsBatchUseCase:
+    """Apply a batch of punches, loading and saving each timesheet once"""
+
+    def __init__(
+        self,
+        timesheet_repository: TimesheetRepository,
+        leave_request_repository: Optional[LeaveRequestRepository] = None,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
+        self.timesheet_repository = timesheet_repository
+        self.leave_request_repository = leave_request_repository
+        self.presence_publisher = presence_publisher
+
+    def execute(self, request: AttendanceEventsBatchRequest) -> AttendanceEventsBatchResponse:
+        results: List[AttendanceEventResult] = []
+        for key, events in _group_events(request.events).items():
+            try:
+                leave_dates = self._leave_dates(key, events)
+                results.extend(
+                    retry_on_conflict(lambda: self._process_group(key, events, leave_dates))
+                )
+            except Exception as e:
+                results.extend(_group_error_results(events, e))
+        return _batch_response(results)
+
+    def _leave_dates(self, key: _GroupKey, events: List[_IndexedEvent]) -> Set[Date]:
+        if not self.leave_request_repository:
+            return set()
+        employee_id, _ = key
+        return {
+            date for date in _clock_in_dates(events)
+            if self.leave_request_repository.has_approved_leave_on(employee_id, date)
+        }
+
+    def _process_group(
+        self,
+        key: _GroupKey,
+        events: List[_IndexedEvent],
+        leave_dates: Set[Date]
+    ) -> List[AttendanceEventResult]:
+        timesheet = self.timesheet_repository.find_by(*key)
+        timesheet, results = _apply_events(key, timesheet, events, leave_dates)
+        if timesheet and any(result.success for result in results):
+            self.timesheet_repository.save(timesheet)
+            if self.presence_publisher:
+                _publish_presence(self.presence_publisher, events, results)
+        return results
+
+
+class AsyncProcessAttendanceEventsBatchUseCase:
+    """Async counterpart of ProcessAttendanceEventsBatchUseCase"""
+
+    def __init__(
+        self,
+        timesheet_repository: AsyncTimesheetRepository,
+        leave_request_repository: Optional[AsyncLeaveRequestRepository] = None,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
+        self.timesheet_repository = timesheet_repository
+        self.leave_request_repository = leave_request_repository
+        self.presence_publisher = presence_publisher
+
+    async def execute(self, request: AttendanceEventsBatchRequest) -> AttendanceEventsBatchResponse:
+        results: List[AttendanceEventResult] = []
+        for key, events in _group_events(request.events).items():
+            try:
+                leave_dates = await self._leave_dates(key, events)
+                results.extend(
+                    await retry_on_conflict_async(
+                        lambda: self._process_group(key, events, leave_dates)
+                    )
+                )
+            except Exception as e:
+                results.extend(_group_error_results(events, e))
+        return _batch_response(results)
+
+    async def _leave_dates(self, key: _GroupKey, events: List[_IndexedEvent]) -> Set[Date]:
+        if not self.leave_request_repository:
+            return set()
+        employee_id, _ = key
+        return {
+            date for date in _clock_in_dates(events)
+            if await self.leave_request_repository.has_approved_leave_on(employee_id, date)
+        }
+
+    async def _process_group(
+        self,
+        key: _GroupKey,
+        events: List[_IndexedEvent],
+        leave_dates: Set[Date]
+    ) -> List[AttendanceEventResult]:
+        timesheet = await self.timesheet_repository.find_by(*key)
+        timesheet, results = _apply_events(key, timesheet, events, leave_dates)
+        if timesheet and any(result.success for result in results):
+            await self.timesheet_repository.save(timesheet)
+            if self.presence_publisher:
+                _publish_presence(self.presence_publisher, events, results)
+        return results
+
+
+def _group_events(events: List[AttendanceEvent]) -> Dict[_GroupKey, List[_IndexedEvent]]:
+    groups: Dict[_GroupKey, List[_IndexedEvent]] = {}
+    for index, event in enumerate(events):
+        key = (
+            EmployeeId(event.employee_id),
+            YearMonth(year=event.occurred_at.year, month=event.occurred_at.month)
+        )
+        groups.setdefault(key, []).append((index, event))
+
+    for group in groups.values():
+        group.sort(key=lambda item: (item[1].occurred_at, item[0]))
+    return groups
+
+
+def _clock_in_dates(events: List[_IndexedEvent]) -> Set[Date]:
+    return {
+        Date(event.occurred_at.date()) for _, event in events if event.event_type == CLOCK_IN
+    }
+
+
+def _apply_events(
+    key: _GroupKey,
+    timesheet: Optional[Timesheet],
+    events: List[_IndexedEvent],
+    leave_dates: Set[Date]
+) -> Tuple[Optional[Timesheet], List[AttendanceEventResult]]:
+    results = []
+    for index, event in events:
+        try:
+            timesheet, entry = _apply_event(key, timesheet, event, leave_dates)
+            results.append(_event_result(
+                index, event, True, _SUCCESS_MESSAGES[event.event_type], entry.state.value
+            ))
+        except DomainException as e:
+            results.append(_event_result(index, event, False, str(e), "error"))
+        except Exception as e:
+            results.append(
+                _event_result(index, event, False, f"An error occurred: {str(e)}", "error")
+            )
+    return timesheet, results
+
+
+def _apply_event(
+    key: _GroupKey,
+    timesheet: Optional[Timesheet],
+    event: AttendanceEvent,
+    leave_dates: Set[Date]
+) -> Tuple[Timesheet, AttendanceEntry]:
+    at = DateTime(event.occurred_at)
+    date = Date(event.occurred_at.date())
+
+    if event.event_type == CLOCK_IN:
+        if date in leave_dates:
+            raise EmployeeOnLeaveError(
+                f"Cannot clock in on {date.value.isoformat()}: employee is on approved leave"
+            )
+        if not timesheet:
+            employee_id, year_month = key
+            timesheet = Timesheet(
+                timesheet_id=TimesheetId(str(uuid.uuid4())),
+                employee_id=employee_id,
+                year_month=year_month
+            )
+        entry = timesheet.get_or_create_entry(date)
+        entry.clock_in(at)
+        return timesheet, entry
+
+    transition = _ENTRY_TRANSITIONS.get(event.event_type)
+    if transition is None:
+        raise ValueError(f"Unknown event type: {event.event_type}")
+    if not timesheet:
+        raise ValueError("No timesheet found for this employee and month")
+    existing_entry = timesheet.get_entry_for_update(date)
+    if not existing_entry:
+        raise ValueError("No attendance entry found for this date")
+
+    transition(existing_entry, at)
+    return timesheet, existing_entry
+
+
+def _publish_presence(
+    publisher: PresencePublisher,
+    events: List[_IndexedEvent],
+    results: List[AttendanceEventResult]
+) -> None:
+    for (_, event), result in zip(events, results):
+        if result.success:
+            publisher.publish(PresenceEvent(
+                employee_id=event.employee_id,
+                site_id=event.site_id,
+                event_type=event.event_type,
+                current_state=result.current_state,
+                occurred_at=result.occurred_at
+            ))
+
+
+def _group_error_results(
+    events: List[_IndexedEvent],
+    error: Exception
+) -> List[AttendanceEventResult]:
+    if isinstance(error, ConcurrencyConflictError):
+        message = str(error)
+    else:
+        message = f"An error occurred: {str(error)}"
+    return [_event_result(index, event, False, message, "error") for index, event in events]
+
+
+def _event_result(
+    index: int,
+    event: AttendanceEvent,
+    success: bool,
+    message: str,
+    current_state: str
+) -> AttendanceEventResult:
+    return AttendanceEventResult(
+        index=index,
+        employee_id=event.employee_id,
+        event_type=event.event_type,
+        occurred_at=event.occurred_at.isoformat(),
+        success=success,
+        message=message,
+        current_state=current_state
+    )
+
+
+def _batch_response(results: List[AttendanceEventResult]) -> AttendanceEventsBatchResponse:
+    results.sort(key=lambda result: result.index)
+    succeeded = sum(1 for result in results if result.success)
+    return AttendanceEventsBatchResponse(
+        processed=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results
+    )
@@ -0,0 +1,96 @@
+from typing import Callable, Optional, Tuple
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
+from ...domain.models import Timesheet, EmployeeId, YearMonth
+from ...domain.exceptions import TimesheetNotFoundError
+from .conflict_retry import retry_on_conflict, retry_on_conflict_async
+from .submit_timesheet_usecase import timesheet_status_response
+from ..dtos.timesheet_dtos import ReviewTimesheetRequest, TimesheetStatusResponse
+
+
+_Review = Callable[[Timesheet, ReviewTimesheetRequest], None]
+
+
+class ApproveTimesheetUseCase:
+    def __init__(self, timesheet_repository: TimesheetRepository):
+        self.timesheet_repository = timesheet_repository
+
+    def execute(self, request: ReviewTimesheetRequest) -> TimesheetStatusResponse:
+        return retry_on_conflict(
+            lambda: _review_once(self.timesheet_repository, request, _approve)
+        )
+
+
+class AsyncApproveTimesheetUseCase:
+    def __init__(self, timesheet_repository: AsyncTimesheetRepository):
+        self.timesheet_repository = timesheet_repository
+
+    async def execute(self, request: ReviewTimesheetRequest) -> TimesheetStatusResponse:
+        return await retry_on_conflict_async(
+            lambda: _review_once_async(self.timesheet_repository, request, _approve)
+        )
+
+
+class RejectTimesheetUseCase:
+    def __init__(self, timesheet_repository: TimesheetRepository):
+        self.timesheet_repository = timesheet_repository
+
+    def execute(self, request: ReviewTimesheetRequest) -> TimesheetStatusResponse:
+        return retry_on_conflict(
+            lambda: _review_once(self.timesheet_repository, request, _reject)
+        )
+
+
+class AsyncRejectTimesheetUseCase:
+    def __init__(self, timesheet_repository: AsyncTimesheetRepository):
+        self.timesheet_repository = timesheet_repository
+
+    async def execute(self, request: ReviewTimesheetRequest) -> TimesheetStatusResponse:
+        return await retry_on_conflict_async(
+            lambda: _review_once_async(self.timesheet_repository, request, _reject)
+        )
+
+
+def _review_once(
+    repository: TimesheetRepository,
+    request: ReviewTimesheetRequest,
+    review: _Review
+) -> TimesheetStatusResponse:
+    timesheet = _require_timesheet(request, repository.find_by(*_timesheet_key(request)))
+    review(timesheet, request)
+    repository.save(timesheet)
+    return timesheet_status_response(timesheet)
+
+
+async def _review_once_async(
+    repository: AsyncTimesheetRepository,
+    request: ReviewTimesheetRequest,
+    review: _Review
+) -> TimesheetStatusResponse:
+    timesheet = _require_timesheet(request, await repository.find_by(*_timesheet_key(request)))
+    review(timesheet, request)
+    await repository.save(timesheet)
+    return timesheet_status_response(timesheet)
+
+
+def _approve(timesheet: Timesheet, request: ReviewTimesheetRequest) -> None:
+    timesheet.approve(EmployeeId(request.reviewer_id))
+
+
+def _reject(timesheet: Timesheet, request: ReviewTimesheetRequest) -> None:
+    timesheet.reject(EmployeeId(request.reviewer_id), request.comment)
+
+
+def _timesheet_key(request: ReviewTimesheetRequest) -> Tuple[EmployeeId, YearMonth]:
+    return EmployeeId(request.employee_id), YearMonth.from_string(request.year_month)
+
+
+def _require_timesheet(
+    request: ReviewTimesheetRequest,
+    timesheet: Optional[Timesheet]
+) -> Timesheet:
+    if not timesheet:
+        raise TimesheetNotFoundError(
+            f"No timesheet found for employee {request.employee_id} in {request.year_month}"
+        )
+    return timesheet
@@ -1,89 +1,150 @@
-from datetime import datetime
+from typing import Optional, Tuple
 from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
 from ...domain.models import (
+    Timesheet,
     EmployeeId,
     YearMonth,
     Date,
     DateTime
 )
+from .conflict_retry import retry_on_conflict, retry_on_conflict_async
 from ..dtos.attendance_dtos import StartBreakRequest, StartBreakResponse
-from ...domain.exceptions import InvalidStateTransitionError, InvalidTimeRangeError
+from ..dtos.presence_dtos import PresenceEvent
+from .presence_publisher import PresencePublisher
+from ...domain.exceptions import (
+    InvalidStateTransitionError,
+    InvalidTimeRangeError,
+    OverlappingBreaksError,
+    TimesheetAlreadySubmittedError
+)
 
 
 class StartBreakUseCase:
-    def __init__(self, timesheet_repository: TimesheetRepository):
+    def __init__(
+        self,
+        timesheet_repository: TimesheetRepository,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
         self.timesheet_repository = timesheet_repository
+        self.presence_publisher = presence_publisher
 
     def execute(self, request: StartBreakRequest) -> StartBreakResponse:
         try:
-            employee_id = EmployeeId(request.employee_id)
-            break_start_datetime = DateTime(request.break_start_time)
-            date = Date(request.break_start_time.date())
-
-            year_month = YearMonth(
-                year=request.break_start_time.year,
-                month=request.break_start_time.month
-            )
-
-            timesheet = self.timesheet_repository.find_by(employee_id, year_month)
-
-            if not timesheet:
-                return StartBreakResponse(
-                    success=False,
-                    message="No timesheet found for this employee and month",
-                    employee_id=request.employee_id,
-                    date=date.value.isoformat(),
-                    break_start_time=break_start_datetime.value.isoformat(),
-                    current_state="error"
-                )
-
-            entry = timesheet.get_entry(date)
-            if not entry:
-                return StartBreakResponse(
-                    success=False,
-                    message="No attendance entry found for this date. Please clock in first.",
-                    employee_id=request.employee_id,
-                    date=date.value.isoformat(),
-                    break_start_time=break_start_datetime.value.isoformat(),
-                    current_state="error"
-                )
-
-            entry.start_break(break_start_datetime)
+            return retry_on_conflict(lambda: self._execute_once(request))
+
+        except Exception as e:
+            return _error_response(request, e)
+
+    def _execute_once(self, request: StartBreakRequest) -> StartBreakResponse:
+        employee_id, year_month = _timesheet_key(request)
+        timesheet = self.timesheet_repository.find_by(employee_id, year_month)
+        response = _start_break(request, timesheet)
+        if timesheet and response.success:
             self.timesheet_repository.save(timesheet)
+            if self.presence_publisher:
+                self.presence_publisher.publish(_presence_event(request, response))
+        return response
+
+
+class AsyncStartBreakUseCase:
+    def __init__(
+        self,
+        timesheet_repository: AsyncTimesheetRepository,
+        presence_publisher: Optional[PresencePublisher] = None
+    ):
+        self.timesheet_repository = timesheet_repository
+        self.presence_publisher = presence_publisher
+
+    async def execute(self, request: StartBreakRequest) -> StartBreakResponse:
+        try:
+            return await retry_on_conflict_async(lambda: self._execute_once(request))
 
-            return StartBreakResponse(
-                success=True,
-                message="Successfully started break",
-                employee_id=request.employee_id,
-                date=date.value.isoformat(),
-                break_start_time=break_start_datetime.value.isoformat(),
-                current_state=entry.state.value
-            )
-
-        except InvalidStateTransitionError as e:
-            return StartBreakResponse(
-                success=False,
-                message=str(e),
-                employee_id=request.employee_id,
-                date=request.break_start_time.date().isoformat(),
-                break_start_time=request.break_start_time.isoformat(),
-                current_state="error"
-            )
-        except InvalidTimeRangeError as e:
-            return StartBreakResponse(
-                success=False,
-                message=str(e),
-                employee_id=request.employee_id,
-                date=request.break_start_time.date().isoformat(),
-                break_start_time=request.break_start_time.isoformat(),
-                current_state="error"
-            )
         except Exception as e:
-            return StartBreakResponse(
-                success=False,
-                message=f"An error occurred: {str(e)}",
-                employee_id=request.employee_id,
-                date=request.break_start_time.date().isoformat(),
-                break_start_time=request.break_start_time.isoformat(),
-                current_state="error"
-            )
\ No newline at end of file
+            return _error_response(request, e)
+
+    async def _execute_once(self, request: StartBreakRequest) -> StartBreakResponse:
+        employee_id, year_month = _timesheet_key(request)
+        timesheet = await self.timesheet_repository.find_by(employee_id, year_month)
+        response = _start_break(request, timesheet)
+        if timesheet and response.success:
+            await self.timesheet_repository.save(timesheet)
+            if self.presence_publisher:
+                self.presence_publisher.publish(_presence_event(request, response))
+        return response
+
+
+def _timesheet_key(request: StartBreakRequest) -> Tuple[EmployeeId, YearMonth]:
+    year_month = YearMonth(
+        year=request.break_start_time.year,
+        month=request.break_start_time.month
+    )
+    return EmployeeId(request.employee_id), year_month
+
+
+def _start_break(request: StartBreakRequest, timesheet: Optional[Timesheet]) -> StartBreakResponse:
+    break_start_datetime = DateTime(request.break_start_time)
+    date = Date(request.break_start_time.date())
+
+    if not timesheet:
+        return StartBreakResponse(
+            success=False,
+            message="No timesheet found for this employee and month",
+            employee_id=request.employee_id,
+            date=date.value.isoformat(),
+            break_start_time=break_start_datetime.value.isoformat(),
+            current_state="error"
+        )
+
+    entry = timesheet.get_entry_for_update(date)
+    if not entry:
+        return StartBreakResponse(
+            success=False,
+            message="No attendance entry found for this date. Please clock in first.",
+            employee_id=request.employee_id,
+            date=date.value.isoformat(),
+            break_start_time=break_start_datetime.value.isoformat(),
+            current_state="error"
+        )
+
+    entry.start_break(break_start_datetime)
+
+    return StartBreakResponse(
+        success=True,
+        message="Successfully started break",
+        employee_id=request.employee_id,
+        date=date.value.isoformat(),
+        break_start_time=break_start_datetime.value.isoformat(),
+        current_state=entry.state.value
+    )
+
+
+def _presence_event(request: StartBreakRequest, response: StartBreakResponse) -> PresenceEvent:
+    return PresenceEvent(
+        employee_id=request.employee_id,
+        site_id=request.site_id,
+        event_type="start_break",
+        current_state=response.current_state,
+        occurred_at=response.break_start_time
+    )
+
+
+def _error_response(request: StartBreakRequest, error: Exception) -> StartBreakResponse:
+    if isinstance(error, (
+        InvalidStateTransitionError,
+        InvalidTimeRangeError,
+        OverlappingBreaksError,
+        TimesheetAlreadySubmittedError
+    )):
+        message = str(error)
+    else:
+        message = f"An error occurred: {str(error)}"
+
+    return StartBreakResponse(
+        success=False,
+        message=message,
+        employee_id=request.employee_id,
+        date=request.break_start_time.date().isoformat(),
+        break_start_time=request.break_start_time.isoformat(),
+        current_state="error"
+    )
@@ -0,0 +1,57 @@
+from typing import Optional, Tuple
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
+from ...domain.models import Timesheet, EmployeeId, YearMonth
+from ...domain.exceptions import TimesheetNotFoundError
+from .conflict_retry import retry_on_conflict, retry_on_conflict_async
+from ..dtos.timesheet_dtos import SubmitTimesheetRequest, TimesheetStatusResponse
+
+
+class SubmitTimesheetUseCase:
+    def __init__(self, timesheet_repository: TimesheetRepository):
+        self.timesheet_repository = timesheet_repository
+
+    def execute(self, request: SubmitTimesheetRequest) -> TimesheetStatusResponse:
+        return retry_on_conflict(lambda: self._execute_once(request))
+
+    def _execute_once(self, request: SubmitTimesheetRequest) -> TimesheetStatusResponse:
+        key = _timesheet_key(request)
+        timesheet = _submit(request, self.timesheet_repository.find_by(*key))
+        self.timesheet_repository.save(timesheet)
+        return timesheet_status_response(timesheet)
+
+
+class AsyncSubmitTimesheetUseCase:
+    def __init__(self, timesheet_repository: AsyncTimesheetRepository):
+        self.timesheet_repository = timesheet_repository
+
+    async def execute(self, request: SubmitTimesheetRequest) -> TimesheetStatusResponse:
+        return await retry_on_conflict_async(lambda: self._execute_once(request))
+
+    async def _execute_once(self, request: SubmitTimesheetRequest) -> TimesheetStatusResponse:
+        key = _timesheet_key(request)
+        timesheet = _submit(request, await self.timesheet_repository.find_by(*key))
+        await self.timesheet_repository.save(timesheet)
+        return timesheet_status_response(timesheet)
+
+
+def timesheet_status_response(timesheet: Timesheet) -> TimesheetStatusResponse:
+    return TimesheetStatusResponse(
+        employee_id=timesheet.employee_id,
+        year_month=str(timesheet.year_month),
+        status=timesheet.status.value,
+        approver_id=timesheet.approver_id
+    )
+
+
+def _timesheet_key(request: SubmitTimesheetRequest) -> Tuple[EmployeeId, YearMonth]:
+    return EmployeeId(request.employee_id), YearMonth.from_string(request.year_month)
+
+
+def _submit(request: SubmitTimesheetRequest, timesheet: Optional[Timesheet]) -> Timesheet:
+    if not timesheet:
+        raise TimesheetNotFoundError(
+            f"No timesheet found for employee {request.employee_id} in {request.year_month}"
+        )
+    timesheet.submit(EmployeeId(request.approver_id) if request.approver_id else None)
+    return timesheet
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from .models.value_objects import (
+    Date,
+    DateTime,
+    DateRange,
+    EmployeeId,
+    RequestId,
+    LeaveType
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent:
+    """Something that happened to an aggregate, held by it until it is saved.
+
+    Events only carry what the aggregate root does not: timesheet events are
+    published together with the timesheet's employee and month.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class ClockedIn(DomainEvent):
+    date: Date
+    at: DateTime
+
+
+@dataclass(frozen=True, slots=True)
+class BreakStarted(DomainEvent):
+    date: Date
+    at: DateTime
+
+
+@dataclass(frozen=True, slots=True)
+class BreakEnded(DomainEvent):
+    date: Date
+    at: DateTime
+    break_minutes: int
+
+
+@dataclass(frozen=True, slots=True)
+class ClockedOut(DomainEvent):
+    date: Date
+    at: DateTime
+    worked_minutes: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class TimesheetSubmitted(DomainEvent):
+    approver_id: EmployeeId | None
+
+
+@dataclass(frozen=True, slots=True)
+class TimesheetApproved(DomainEvent):
+    reviewer_id: EmployeeId
+
+
+@dataclass(frozen=True, slots=True)
+class TimesheetRejected(DomainEvent):
+    reviewer_id: EmployeeId
+    comment: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class TimesheetReopened(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class LeaveApproved(DomainEvent):
+    request_id: RequestId
+    employee_id: EmployeeId
+    date_range: DateRange
+    leave_type: LeaveType
+    reviewer_id: EmployeeId
+
+
+@dataclass(frozen=True, slots=True)
+class LeaveRejected(DomainEvent):
+    request_id: RequestId
+    employee_id: EmployeeId
+    date_range: DateRange
+    leave_type: LeaveType
+    reviewer_id: EmployeeId
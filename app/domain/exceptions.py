@@ -23,4 +23,16 @@ class InvalidTimeRangeError(DomainException):
 
 
 class DuplicateEntryError(DomainException):
+    pass
+
+
+class ConcurrencyConflictError(DomainException):
+    pass
+
+
+class EmployeeOnLeaveError(DomainException):
+    pass
+
+
+class NotTimesheetApproverError(DomainException):
     pass
\ No newline at end of file
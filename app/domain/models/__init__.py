@@ -17,7 +17,7 @@ from .value_objects import (
 from .break_interval import BreakInterval
 from .employee import Employee
 from .attendance_entry import AttendanceEntry
-from .timesheet import Timesheet
+from .timesheet import Timesheet, MonthlyTotals
 from .overtime_request import OvertimeRequest
 from .leave_request import LeaveRequest
 
@@ -40,6 +40,7 @@ __all__ = [
     "Employee",
     "AttendanceEntry",
     "Timesheet",
+    "MonthlyTotals",
     "OvertimeRequest",
     "LeaveRequest",
 ]
\ No newline at end of file
@@ -1,7 +1,9 @@
+import bisect
 from dataclasses import dataclass, field
-from typing import List
+from typing import Callable, List, Optional
 from .value_objects import Date, DateTime, AttendanceState, Minutes
 from .break_interval import BreakInterval
+from ..events import DomainEvent, ClockedIn, BreakStarted, BreakEnded, ClockedOut
 from ..exceptions import (
     InvalidStateTransitionError,
     InvalidTimeRangeError,
@@ -9,7 +11,7 @@ from ..exceptions import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class AttendanceEntry:
     date: Date
     state: AttendanceState = AttendanceState.CLOCKED_OUT
@@ -17,6 +19,22 @@ class AttendanceEntry:
     clock_out_at: DateTime | None = None
     breaks: List[BreakInterval] = field(default_factory=list)
     notes: str = ""
+    _on_change: Optional[Callable[["AttendanceEntry"], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Breaks are kept ordered by start time, so only an entry's last break
+    # can be ongoing; this points at it while the entry is on break
+    _ongoing_break: Optional[BreakInterval] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Derived totals, kept up to date by the methods that change the entry
+    _break_minutes: int = field(default=0, init=False, repr=False, compare=False)
+    _worked_minutes: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _events: List[DomainEvent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.clock_in_at and self.clock_out_at:
@@ -26,7 +44,15 @@ class AttendanceEntry:
                 )
 
         if self.breaks:
-            BreakInterval.validate_no_overlaps(self.breaks)
+            # Timsort is linear on the already-ordered lists storage returns
+            self.breaks.sort(key=BreakInterval.start_key)
+            BreakInterval.validate_sorted(self.breaks)
+            if self.breaks[-1].is_ongoing():
+                self._ongoing_break = self.breaks[-1]
+            self._break_minutes = sum(
+                _elapsed_minutes(b.start_at, b.end_at) for b in self.breaks if b.end_at
+            )
+        self._update_worked_minutes()
 
     def clock_in(self, time: DateTime) -> None:
         if self.state != AttendanceState.CLOCKED_OUT:
@@ -36,6 +62,9 @@ class AttendanceEntry:
 
         self.clock_in_at = time
         self.state = AttendanceState.CLOCKED_IN
+        self._update_worked_minutes()
+        self._events.append(ClockedIn(date=self.date, at=time))
+        self._notify_change()
 
     def start_break(self, time: DateTime) -> None:
         if self.state != AttendanceState.CLOCKED_IN:
@@ -49,10 +78,13 @@ class AttendanceEntry:
             )
 
         new_break = BreakInterval(start_at=time)
-        self.breaks.append(new_break)
+        self._insert_break(new_break)
+        self._ongoing_break = new_break
         self.state = AttendanceState.ON_BREAK
+        self._events.append(BreakStarted(date=self.date, at=time))
 
-    def end_break(self, time: DateTime) -> None:
+    def end_break(self, time: DateTime) -> BreakInterval:
+        """End the ongoing break and return it"""
         if self.state != AttendanceState.ON_BREAK:
             raise InvalidStateTransitionError(
                 f"Cannot end break when state is {self.state.value}"
@@ -62,9 +94,17 @@ class AttendanceEntry:
         if not ongoing_break:
             raise InvalidStateTransitionError("No ongoing break found")
 
+        # The ongoing break is the last one and already clear of the breaks
+        # before it, so ending it cannot introduce an overlap
         ongoing_break.end(time)
-        BreakInterval.validate_no_overlaps(self.breaks)
+        self._ongoing_break = None
+        break_minutes = _elapsed_minutes(ongoing_break.start_at, time)
+        self._break_minutes += break_minutes
+        self._update_worked_minutes()
+        self._events.append(BreakEnded(date=self.date, at=time, break_minutes=break_minutes))
         self.state = AttendanceState.CLOCKED_IN
+        self._notify_change()
+        return ongoing_break
 
     def clock_out(self, time: DateTime) -> None:
         if self.state != AttendanceState.CLOCKED_IN:
@@ -77,40 +117,84 @@ class AttendanceEntry:
                 f"Clock out time {time} must be after clock in time {self.clock_in_at}"
             )
 
-        for break_interval in self.breaks:
-            if break_interval.end_at and break_interval.end_at >= time:
-                raise InvalidTimeRangeError(
-                    f"Clock out time {time} must be after all break end times"
-                )
+        # The last break ends after every other one
+        last_break = self.breaks[-1] if self.breaks else None
+        if last_break and last_break.end_at and last_break.end_at >= time:
+            raise InvalidTimeRangeError(
+                f"Clock out time {time} must be after all break end times"
+            )
 
         self.clock_out_at = time
         self.state = AttendanceState.CLOCKED_OUT
+        self._update_worked_minutes()
+        self._events.append(
+            ClockedOut(date=self.date, at=time, worked_minutes=self._worked_minutes)
+        )
+        self._notify_change()
+
+    def observe(self, on_change: Optional[Callable[["AttendanceEntry"], None]]) -> None:
+        self._on_change = on_change
+
+    def pending_events(self) -> List[DomainEvent]:
+        """Events recorded since the entry was loaded or last saved"""
+        return list(self._events)
+
+    def clear_events(self) -> None:
+        self._events.clear()
+
+    def _notify_change(self) -> None:
+        if self._on_change:
+            self._on_change(self)
 
     def _get_ongoing_break(self) -> BreakInterval | None:
-        for break_interval in self.breaks:
-            if break_interval.is_ongoing():
-                return break_interval
-        return None
+        return self._ongoing_break
+
+    def _insert_break(self, new_break: BreakInterval) -> None:
+        index = bisect.bisect_right(
+            self.breaks, new_break.start_at.value, key=BreakInterval.start_key
+        )
+        neighbours = self.breaks[max(index - 1, 0):index + 1]
+        for neighbour in neighbours:
+            if neighbour.overlaps_with(new_break):
+                raise OverlappingBreaksError(
+                    f"Break {new_break} overlaps with {neighbour}"
+                )
+        self.breaks.insert(index, new_break)
+
+    @property
+    def worked_minutes(self) -> int | None:
+        """Cached worked minutes as a plain int, None until clocked out"""
+        return self._worked_minutes
+
+    @property
+    def break_minutes(self) -> int:
+        """Cached minutes of the breaks that have ended"""
+        return self._break_minutes
 
     def calculate_worked_minutes(self) -> Minutes | None:
-        if not self.clock_in_at or not self.clock_out_at:
+        if self._worked_minutes is None:
             return None
+        return Minutes(self._worked_minutes)
 
-        total_delta = self.clock_out_at.value - self.clock_in_at.value
-        total_minutes = int(total_delta.total_seconds() // 60)
+    def calculate_break_minutes(self) -> Minutes:
+        return Minutes(self._break_minutes)
 
-        break_minutes = 0
-        for break_interval in self.breaks:
-            if break_interval.end_at:
-                duration = break_interval.duration_minutes()
-                if duration:
-                    break_minutes += duration.value
-
-        return Minutes(total_minutes - break_minutes)
+    def _update_worked_minutes(self) -> None:
+        if not self.clock_in_at or not self.clock_out_at:
+            self._worked_minutes = None
+            return
+        self._worked_minutes = (
+            _elapsed_minutes(self.clock_in_at, self.clock_out_at) - self._break_minutes
+        )
 
     def is_complete(self) -> bool:
         return (
             self.state == AttendanceState.CLOCKED_OUT and
             self.clock_in_at is not None and
             self.clock_out_at is not None
-        )
\ No newline at end of file
+        )
+
+
+def _elapsed_minutes(start: DateTime, end: DateTime) -> int:
+    # Whole minutes, floored the same way as BreakInterval.duration_minutes
+    return int((end.value - start.value).total_seconds() // 60)
\ No newline at end of file
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import List
 from ..exceptions import OverlappingBreaksError, InvalidTimeRangeError
 from .value_objects import DateTime, Minutes
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakInterval:
     start_at: DateTime
     end_at: DateTime | None = None
@@ -34,19 +35,32 @@ class BreakInterval:
         return Minutes(int(delta.total_seconds() // 60))
 
     def overlaps_with(self, other: "BreakInterval") -> bool:
-        if self.end_at is None or other.end_at is None:
-            return True
-
-        return not (
-            self.end_at <= other.start_at or
-            other.end_at <= self.start_at
+        # An ongoing break is open-ended: it overlaps every break that has
+        # not ended by the time it started
+        return (
+            (self.end_at is None or other.start_at < self.end_at) and
+            (other.end_at is None or self.start_at < other.end_at)
         )
 
+    @staticmethod
+    def start_key(break_interval: "BreakInterval") -> datetime:
+        return break_interval.start_at.value
+
     @staticmethod
     def validate_no_overlaps(breaks: List["BreakInterval"]) -> None:
-        for i, break1 in enumerate(breaks):
-            for break2 in breaks[i + 1:]:
-                if break1.overlaps_with(break2):
-                    raise OverlappingBreaksError(
-                        f"Break {break1} overlaps with {break2}"
-                    )
\ No newline at end of file
+        if len(breaks) < 2:
+            return
+        BreakInterval.validate_sorted(sorted(breaks, key=BreakInterval.start_key))
+
+    @staticmethod
+    def validate_sorted(breaks: List["BreakInterval"]) -> None:
+        """Check breaks already ordered by start time in a single pass.
+
+        Disjoint neighbours imply disjoint breaks overall, since each break
+        then ends before the next one starts.
+        """
+        for previous, current in zip(breaks, breaks[1:]):
+            if previous.overlaps_with(current):
+                raise OverlappingBreaksError(
+                    f"Break {previous} overlaps with {current}"
+                )
\ No newline at end of file
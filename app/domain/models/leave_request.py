@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List
 import uuid
 from ..models.value_objects import (
     RequestId,
@@ -7,6 +8,7 @@ from ..models.value_objects import (
     LeaveType,
     RequestStatus
 )
+from ..events import DomainEvent, LeaveApproved, LeaveRejected
 from ..exceptions import InvalidStateTransitionError
 
 
@@ -20,6 +22,10 @@ class LeaveRequest:
     status: RequestStatus = RequestStatus.PENDING
     reviewer_id: EmployeeId | None = None
     review_comment: str | None = None
+    approver_id: EmployeeId | None = None
+    _events: List[DomainEvent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if not self.request_id:
@@ -45,6 +51,13 @@ class LeaveRequest:
         self.status = RequestStatus.APPROVED
         self.reviewer_id = approver_id
         self.review_comment = comment
+        self._events.append(LeaveApproved(
+            request_id=self.request_id,
+            employee_id=self.employee_id,
+            date_range=self.date_range,
+            leave_type=self.leave_type,
+            reviewer_id=approver_id
+        ))
 
     def reject(self, approver_id: EmployeeId, comment: str | None = None) -> None:
         if self.status != RequestStatus.PENDING:
@@ -54,6 +67,19 @@ class LeaveRequest:
         self.status = RequestStatus.REJECTED
         self.reviewer_id = approver_id
         self.review_comment = comment
+        self._events.append(LeaveRejected(
+            request_id=self.request_id,
+            employee_id=self.employee_id,
+            date_range=self.date_range,
+            leave_type=self.leave_type,
+            reviewer_id=approver_id
+        ))
+
+    def pending_events(self) -> List[DomainEvent]:
+        return list(self._events)
+
+    def clear_events(self) -> None:
+        self._events.clear()
 
     def is_pending(self) -> bool:
         return self.status == RequestStatus.PENDING
\ No newline at end of file
@@ -20,6 +20,7 @@ class OvertimeRequest:
     status: RequestStatus = RequestStatus.PENDING
     reviewer_id: EmployeeId | None = None
     review_comment: str | None = None
+    approver_id: EmployeeId | None = None
 
     def __post_init__(self):
         if not self.request_id:
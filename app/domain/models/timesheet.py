@@ -1,5 +1,5 @@
-from dataclasses import dataclass, field
-from typing import Dict
+from dataclasses import InitVar, dataclass, field
+from typing import Dict, List, Optional
 import uuid
 from datetime import date as datetime_date
 from .value_objects import (
@@ -11,22 +11,87 @@ from .value_objects import (
     Minutes
 )
 from .attendance_entry import AttendanceEntry
+from ..events import (
+    DomainEvent,
+    TimesheetSubmitted,
+    TimesheetApproved,
+    TimesheetRejected,
+    TimesheetReopened
+)
 from ..exceptions import (
     TimesheetAlreadySubmittedError,
     DuplicateEntryError,
-    InvalidStateTransitionError
+    InvalidStateTransitionError,
+    NotTimesheetApproverError
 )
 
 
-@dataclass
+STANDARD_HOURS_PER_DAY = 8
+
+
+@dataclass(frozen=True, slots=True)
+class MonthlyTotals:
+    worked_minutes: int = 0
+    break_minutes: int = 0
+    overtime_minutes: int = 0
+    days_present: int = 0
+
+    def __add__(self, other: "MonthlyTotals") -> "MonthlyTotals":
+        return MonthlyTotals(
+            worked_minutes=self.worked_minutes + other.worked_minutes,
+            break_minutes=self.break_minutes + other.break_minutes,
+            overtime_minutes=self.overtime_minutes + other.overtime_minutes,
+            days_present=self.days_present + other.days_present
+        )
+
+    def __sub__(self, other: "MonthlyTotals") -> "MonthlyTotals":
+        return MonthlyTotals(
+            worked_minutes=self.worked_minutes - other.worked_minutes,
+            break_minutes=self.break_minutes - other.break_minutes,
+            overtime_minutes=self.overtime_minutes - other.overtime_minutes,
+            days_present=self.days_present - other.days_present
+        )
+
+    @classmethod
+    def of_entry(cls, entry: AttendanceEntry) -> "MonthlyTotals":
+        worked_minutes = entry.worked_minutes or 0
+        return cls(
+            worked_minutes=worked_minutes,
+            break_minutes=entry.break_minutes,
+            overtime_minutes=max(worked_minutes - STANDARD_HOURS_PER_DAY * 60, 0),
+            days_present=1 if entry.clock_in_at else 0
+        )
+
+
+_NO_TOTALS = MonthlyTotals()
+
+_READ_ONLY_STATUSES = frozenset({TimesheetStatus.SUBMITTED, TimesheetStatus.APPROVED})
+
+
+@dataclass(slots=True)
 class Timesheet:
     timesheet_id: TimesheetId
     employee_id: EmployeeId
     year_month: YearMonth
     entries: Dict[datetime_date, AttendanceEntry] = field(default_factory=dict)
     status: TimesheetStatus = TimesheetStatus.DRAFT
+    version: int = 0
+    approver_id: EmployeeId | None = None
+    # Month totals stored with the entries, so loading them does not rescan
+    # the month; left out, they are computed from the entries
+    totals: InitVar[MonthlyTotals | None] = None
+    _totals: MonthlyTotals = field(
+        default=_NO_TOTALS, init=False, repr=False, compare=False
+    )
+    # Built on the first entry change when the totals were given
+    _entry_totals: Optional[Dict[datetime_date, MonthlyTotals]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _events: List[DomainEvent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
-    def __post_init__(self):
+    def __post_init__(self, totals: MonthlyTotals | None):
         if not self.timesheet_id:
             self.timesheet_id = TimesheetId(str(uuid.uuid4()))
 
@@ -36,6 +101,15 @@ class Timesheet:
         if not self.year_month:
             raise ValueError("Year-month is required")
 
+        if totals is None:
+            for entry in self.entries.values():
+                self._track_entry(entry)
+        else:
+            self._totals = totals
+            self._entry_totals = None
+            for entry in self.entries.values():
+                entry.observe(self._on_entry_changed)
+
     def add_or_update_entry(self, entry: AttendanceEntry) -> None:
         self._ensure_editable()
 
@@ -47,38 +121,59 @@ class Timesheet:
                 f"Entry date {entry.date} does not match timesheet month {self.year_month}"
             )
 
+        previous = self.entries.get(entry.date.value)
+        if previous is not None and previous is not entry:
+            previous.observe(None)
+            self._events.extend(previous.pending_events())
+
         self.entries[entry.date.value] = entry
+        self._track_entry(entry)
 
     def get_entry(self, date: Date) -> AttendanceEntry | None:
         return self.entries.get(date.value)
 
+    def get_entry_for_update(self, date: Date) -> AttendanceEntry | None:
+        """The entry to punch on; entries of a submitted or approved timesheet are frozen"""
+        self._ensure_editable()
+        return self.get_entry(date)
+
     def get_or_create_entry(self, date: Date) -> AttendanceEntry:
+        self._ensure_editable()
         entry = self.get_entry(date)
         if not entry:
             entry = AttendanceEntry(date=date)
             self.add_or_update_entry(entry)
         return entry
 
-    def submit(self) -> None:
-        if self.status != TimesheetStatus.DRAFT:
+    def submit(self, approver_id: EmployeeId | None = None) -> None:
+        """Submit, or resubmit once rejected, for review; only approver_id may review it, if given"""
+        if not self.is_editable():
             raise InvalidStateTransitionError(
                 f"Cannot submit timesheet with status {self.status.value}"
             )
+        if approver_id == self.employee_id:
+            raise NotTimesheetApproverError("Employees cannot approve their own timesheet")
         self.status = TimesheetStatus.SUBMITTED
+        self.approver_id = approver_id
+        self._events.append(TimesheetSubmitted(approver_id=approver_id))
 
-    def approve(self) -> None:
+    def approve(self, reviewer_id: EmployeeId) -> None:
         if self.status != TimesheetStatus.SUBMITTED:
             raise InvalidStateTransitionError(
                 f"Cannot approve timesheet with status {self.status.value}"
             )
+        self._ensure_reviewer(reviewer_id)
         self.status = TimesheetStatus.APPROVED
+        self._events.append(TimesheetApproved(reviewer_id=reviewer_id))
 
-    def reject(self) -> None:
+    def reject(self, reviewer_id: EmployeeId, comment: str | None = None) -> None:
         if self.status != TimesheetStatus.SUBMITTED:
             raise InvalidStateTransitionError(
                 f"Cannot reject timesheet with status {self.status.value}"
             )
+        self._ensure_reviewer(reviewer_id)
         self.status = TimesheetStatus.REJECTED
+        self._events.append(TimesheetRejected(reviewer_id=reviewer_id, comment=comment))
 
     def reopen(self) -> None:
         if self.status != TimesheetStatus.REJECTED:
@@ -86,28 +181,74 @@ class Timesheet:
                 f"Cannot reopen timesheet with status {self.status.value}"
             )
         self.status = TimesheetStatus.DRAFT
+        self._events.append(TimesheetReopened())
 
-    def calculate_total_worked_minutes(self) -> Minutes:
-        total = 0
+    def pending_events(self) -> List[DomainEvent]:
+        """Events of the timesheet and its entries not yet saved, in order"""
+        events = [event for entry in self.entries.values() for event in entry.pending_events()]
+        events.extend(self._events)
+        return events
+
+    def record_event(self, event: DomainEvent) -> None:
+        self._events.append(event)
+
+    def clear_events(self) -> None:
+        """Called by repositories once the pending events are stored"""
         for entry in self.entries.values():
-            worked = entry.calculate_worked_minutes()
-            if worked:
-                total += worked.value
-        return Minutes(total)
+            entry.clear_events()
+        self._events.clear()
+
+    def monthly_totals(self) -> MonthlyTotals:
+        """Running totals, kept up to date as entries change"""
+        return self._totals
+
+    def calculate_total_worked_minutes(self) -> Minutes:
+        return Minutes(self._totals.worked_minutes)
+
+    def calculate_overtime_minutes(self, standard_hours_per_day: int = STANDARD_HOURS_PER_DAY) -> Minutes:
+        if standard_hours_per_day == STANDARD_HOURS_PER_DAY:
+            return Minutes(self._totals.overtime_minutes)
 
-    def calculate_overtime_minutes(self, standard_hours_per_day: int = 8) -> Minutes:
         total_overtime = 0
         standard_minutes = standard_hours_per_day * 60
 
         for entry in self.entries.values():
-            worked = entry.calculate_worked_minutes()
-            if worked and worked.value > standard_minutes:
-                total_overtime += worked.value - standard_minutes
+            worked = entry.worked_minutes
+            if worked and worked > standard_minutes:
+                total_overtime += worked - standard_minutes
 
         return Minutes(total_overtime)
 
+    def _track_entry(self, entry: AttendanceEntry) -> None:
+        entry.observe(self._on_entry_changed)
+        self._on_entry_changed(entry)
+
+    def _on_entry_changed(self, entry: AttendanceEntry) -> None:
+        if self._entry_totals is None:
+            self._entry_totals = {
+                tracked_date: MonthlyTotals.of_entry(tracked)
+                for tracked_date, tracked in self.entries.items()
+            }
+            self._totals = sum(self._entry_totals.values(), _NO_TOTALS)
+            return
+
+        entry_date = entry.date.value
+        new_totals = MonthlyTotals.of_entry(entry)
+        old_totals = self._entry_totals.get(entry_date, _NO_TOTALS)
+        self._entry_totals[entry_date] = new_totals
+        self._totals = self._totals - old_totals + new_totals
+
+    def _ensure_reviewer(self, reviewer_id: EmployeeId) -> None:
+        if reviewer_id == self.employee_id:
+            raise NotTimesheetApproverError("Employees cannot review their own timesheet")
+        if self.approver_id and reviewer_id != self.approver_id:
+            raise NotTimesheetApproverError(
+                f"Timesheet of {self.employee_id} for {self.year_month} "
+                f"is assigned to approver {self.approver_id}"
+            )
+
     def _ensure_editable(self) -> None:
-        if self.status in [TimesheetStatus.SUBMITTED, TimesheetStatus.APPROVED]:
+        if self.status in _READ_ONLY_STATUSES:
             raise TimesheetAlreadySubmittedError(
                 f"Cannot modify timesheet with status {self.status.value}"
             )
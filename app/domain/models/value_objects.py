@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import NewType
+from typing import ClassVar, Dict, NewType, Tuple
 import uuid
 from enum import Enum
 
@@ -10,16 +10,46 @@ TimesheetId = NewType("TimesheetId", str)
 RequestId = NewType("RequestId", str)
 
 
-@dataclass(frozen=True)
-class YearMonth:
+class _ValueObject:
+    """Base for immutable value objects.
+
+    Instances never change, so copies (including the deep copies repositories
+    take of whole aggregates) can share them instead of rebuilding them.
+    """
+    __slots__ = ()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+@dataclass(frozen=True, slots=True, init=False)
+class YearMonth(_ValueObject):
+    """A calendar month. Instances are interned: equal months are the same object."""
     year: int
     month: int
 
-    def __post_init__(self):
-        if not (1 <= self.month <= 12):
-            raise ValueError(f"Invalid month: {self.month}")
-        if self.year < 1900 or self.year > 9999:
-            raise ValueError(f"Invalid year: {self.year}")
+    _interned: ClassVar[Dict[Tuple[int, int], "YearMonth"]] = {}
+
+    def __new__(cls, year: int, month: int) -> "YearMonth":
+        instance = cls._interned.get((year, month))
+        if instance is not None:
+            return instance
+
+        if not (1 <= month <= 12):
+            raise ValueError(f"Invalid month: {month}")
+        if year < 1900 or year > 9999:
+            raise ValueError(f"Invalid year: {year}")
+
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "year", year)
+        object.__setattr__(instance, "month", month)
+        return cls._interned.setdefault((year, month), instance)
+
+    def __reduce__(self):
+        return (YearMonth, (self.year, self.month))
 
     def __str__(self) -> str:
         return f"{self.year:04d}-{self.month:02d}"
@@ -32,8 +62,8 @@ class YearMonth:
         return cls(year=int(parts[0]), month=int(parts[1]))
 
 
-@dataclass(frozen=True)
-class Date:
+@dataclass(frozen=True, slots=True)
+class Date(_ValueObject):
     value: date
 
     def __post_init__(self):
@@ -44,8 +74,8 @@ class Date:
         return self.value.isoformat()
 
 
-@dataclass(frozen=True)
-class DateTime:
+@dataclass(frozen=True, slots=True)
+class DateTime(_ValueObject):
     value: datetime
 
     def __post_init__(self):
@@ -62,8 +92,8 @@ class DateTime:
         return self.value <= other.value
 
 
-@dataclass(frozen=True)
-class Minutes:
+@dataclass(frozen=True, slots=True)
+class Minutes(_ValueObject):
     value: int
 
     def __post_init__(self):
@@ -71,8 +101,8 @@ class Minutes:
             raise ValueError(f"Minutes must be non-negative: {self.value}")
 
 
-@dataclass(frozen=True)
-class DateRange:
+@dataclass(frozen=True, slots=True)
+class DateRange(_ValueObject):
     start_date: Date
     end_date: Date
 
@@ -83,8 +113,8 @@ class DateRange:
             )
 
 
-@dataclass(frozen=True)
-class TimeRange:
+@dataclass(frozen=True, slots=True)
+class TimeRange(_ValueObject):
     start_at: DateTime
     end_at: DateTime
 
@@ -1,9 +1,14 @@
-from .timesheet_repository import TimesheetRepository
+from .timesheet_repository import TimesheetRepository, CommitHandle
+from .async_timesheet_repository import AsyncTimesheetRepository
 from .overtime_request_repository import OvertimeRequestRepository
 from .leave_request_repository import LeaveRequestRepository
+from .async_leave_request_repository import AsyncLeaveRequestRepository
 
 __all__ = [
     "TimesheetRepository",
+    "CommitHandle",
+    "AsyncTimesheetRepository",
     "OvertimeRequestRepository",
     "LeaveRequestRepository",
+    "AsyncLeaveRequestRepository",
 ]
\ No newline at end of file
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from ..models import EmployeeId, Date
+
+
+class AsyncLeaveRequestRepository(ABC):
+    """The part of LeaveRequestRepository the async punch paths need"""
+
+    @abstractmethod
+    async def has_approved_leave_on(self, employee_id: EmployeeId, date: Date) -> bool:
+        """Check whether an approved leave request of the employee covers date"""
+        pass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from ..models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+
+
+class AsyncTimesheetRepository(ABC):
+
+    @abstractmethod
+    async def find_by(self, employee_id: EmployeeId, year_month: YearMonth) -> Optional[Timesheet]:
+        """Find timesheet by employee ID and year-month"""
+        pass
+
+    @abstractmethod
+    async def save(self, timesheet: Timesheet) -> None:
+        """Save or update timesheet, with the same versioning as TimesheetRepository.save"""
+        pass
+
+    @abstractmethod
+    async def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        """Find the timesheets for year-month in the given status, ordered by employee ID"""
+        pass
+
+    @abstractmethod
+    async def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        """Find the employees whose attendance entry for date is in the given state"""
+        pass
\ No newline at end of file
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
-from ..models import EmployeeId, RequestId, RequestStatus
+from ..models import EmployeeId, RequestId, RequestStatus, Date
 from ..models.leave_request import LeaveRequest
 
 
@@ -31,5 +31,10 @@ class LeaveRequestRepository(ABC):
         approver_id: EmployeeId,
         status: Optional[RequestStatus] = None
     ) -> List[LeaveRequest]:
-        """List leave requests for an approver with optional status filter"""
+        """List leave requests assigned to approver_id with optional status filter"""
+        pass
+
+    @abstractmethod
+    def has_approved_leave_on(self, employee_id: EmployeeId, date: Date) -> bool:
+        """Check whether an approved leave request of the employee covers date"""
         pass
\ No newline at end of file
@@ -31,5 +31,5 @@ class OvertimeRequestRepository(ABC):
         approver_id: EmployeeId,
         status: Optional[RequestStatus] = None
     ) -> List[OvertimeRequest]:
-        """List overtime requests for an approver with optional status filter"""
+        """List overtime requests assigned to approver_id with optional status filter"""
         pass
\ No newline at end of file
@@ -1,6 +1,42 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
-from ..models import Timesheet, EmployeeId, YearMonth
+from concurrent.futures import Future
+from typing import Any, Generator, Iterator, List, Optional
+from ..exceptions import ConcurrencyConflictError
+from ..models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+
+
+class CommitHandle:
+    """Completes once a save has been committed by the repository.
+
+    ``result()`` blocks and ``await handle`` suspends until then; both raise
+    the error the save was rejected with, if any.
+    """
+
+    def __init__(self, future: "Future[None]"):
+        self._future = future
+
+    @classmethod
+    def completed(cls) -> "CommitHandle":
+        future: "Future[None]" = Future()
+        future.set_result(None)
+        return cls(future)
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> None:
+        self._future.result(timeout)
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return asyncio.wrap_future(self._future).__await__()
 
 
 class TimesheetRepository(ABC):
@@ -12,5 +48,74 @@ class TimesheetRepository(ABC):
 
     @abstractmethod
     def save(self, timesheet: Timesheet) -> None:
-        """Save or update timesheet"""
+        """Save or update timesheet.
+
+        Raises ConcurrencyConflictError if the stored version differs from
+        timesheet.version, and increments timesheet.version on success.
+        """
+        pass
+
+    def save_deferred(self, timesheet: Timesheet) -> CommitHandle:
+        """Start saving timesheet and return a handle that completes once it is committed.
+
+        Version conflicts found up front are raised here. Repositories that
+        write in the background return before the write, so callers that
+        report success must wait on the handle; the default saves inline.
+        """
+        self.save(timesheet)
+        return CommitHandle.completed()
+
+    def save_all(self, timesheets: List[Timesheet]) -> List[Optional[ConcurrencyConflictError]]:
+        """Save several timesheets, in order, as one unit of work where possible.
+
+        Version conflicts do not abort the batch: the result has one item per
+        timesheet, None when it was saved or the conflict it was rejected with.
+        """
+        results: List[Optional[ConcurrencyConflictError]] = []
+        for timesheet in timesheets:
+            try:
+                self.save(timesheet)
+                results.append(None)
+            except ConcurrencyConflictError as e:
+                results.append(e)
+        return results
+
+    @abstractmethod
+    def find_all_by_year_month(self, year_month: YearMonth) -> Iterator[Timesheet]:
+        """Iterate over the timesheets of every employee for year-month.
+
+        Meant for read-only bulk reports: implementations may yield their
+        stored objects instead of copies, so callers must not modify them.
+        """
+        pass
+
+    @abstractmethod
+    def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        """Find the timesheets for year-month in the given status, ordered by employee ID"""
+        pass
+
+    @abstractmethod
+    def find_by_approver(
+        self,
+        year_month: YearMonth,
+        approver_id: EmployeeId,
+        status: TimesheetStatus,
+        after: Optional[EmployeeId] = None,
+        limit: Optional[int] = None
+    ) -> List[Timesheet]:
+        """Find the timesheets for year-month assigned to approver_id in the given
+        status, ordered by employee ID.
+
+        Pages through the matches when given ``after`` (the last employee ID
+        of the previous page) and ``limit`` (the most timesheets to return).
+        """
+        pass
+
+    @abstractmethod
+    def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        """Find the employees whose attendance entry for date is in the given state"""
         pass
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .payroll_writer import iter_payroll_csv, payroll_parquet_bytes, SUPPORTED_FORMATS
+
+__all__ = ["iter_payroll_csv", "payroll_parquet_bytes", "SUPPORTED_FORMATS"]
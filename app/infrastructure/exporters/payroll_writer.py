@@ -0,0 +1,79 @@
+import csv
+import io
+from typing import Iterator, Sequence
+from ...application.dtos.payroll_dtos import PayrollExport, MinuteColumn
+
+try:
+    import pyarrow  # type: ignore[import-untyped]
+    import pyarrow.parquet  # type: ignore[import-untyped]
+except ImportError:  # Parquet output is optional
+    pyarrow = None
+
+
+CSV = "csv"
+PARQUET = "parquet"
+SUPPORTED_FORMATS = (CSV, PARQUET)
+
+PAYROLL_COLUMNS = [
+    "employee_id",
+    "year_month",
+    "status",
+    "worked_minutes",
+    "break_minutes",
+    "overtime_minutes",
+    "days_present"
+]
+
+# Rows per chunk yielded by iter_payroll_csv
+CSV_CHUNK_ROWS = 5000
+
+
+def iter_payroll_csv(export: PayrollExport) -> Iterator[str]:
+    """Stream the export as CSV text in chunks of CSV_CHUNK_ROWS rows"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(PAYROLL_COLUMNS)
+
+    rows = zip(
+        export.employee_ids,
+        export.statuses,
+        _as_list(export.worked_minutes),
+        _as_list(export.break_minutes),
+        _as_list(export.overtime_minutes),
+        export.days_present
+    )
+    for index, (employee_id, status, worked, breaks, overtime, days) in enumerate(rows, start=1):
+        writer.writerow([employee_id, export.year_month, status, worked, breaks, overtime, days])
+        if index % CSV_CHUNK_ROWS == 0:
+            yield _drain(buffer)
+    yield _drain(buffer)
+
+
+def payroll_parquet_bytes(export: PayrollExport) -> bytes:
+    if pyarrow is None:
+        raise ValueError("Parquet export requires pyarrow to be installed")
+
+    table = pyarrow.table({
+        "employee_id": pyarrow.array(export.employee_ids, type=pyarrow.string()),
+        "year_month": pyarrow.array([export.year_month] * len(export.employee_ids), type=pyarrow.string()),
+        "status": pyarrow.array(export.statuses, type=pyarrow.string()),
+        "worked_minutes": pyarrow.array(export.worked_minutes, type=pyarrow.int64()),
+        "break_minutes": pyarrow.array(export.break_minutes, type=pyarrow.int64()),
+        "overtime_minutes": pyarrow.array(export.overtime_minutes, type=pyarrow.int64()),
+        "days_present": pyarrow.array(export.days_present, type=pyarrow.int64())
+    })
+    sink = pyarrow.BufferOutputStream()
+    pyarrow.parquet.write_table(table, sink)
+    return sink.getvalue().to_pybytes()
+
+
+def _as_list(column: MinuteColumn) -> Sequence[int]:
+    # NumPy scalars format slower than ints, so convert whole columns at once
+    return column.tolist() if hasattr(column, "tolist") else column
+
+
+def _drain(buffer: io.StringIO) -> str:
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
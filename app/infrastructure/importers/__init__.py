@@ -0,0 +1,3 @@
+from .attendance_file_reader import read_attendance_records, SUPPORTED_FORMATS
+
+__all__ = ["read_attendance_records", "SUPPORTED_FORMATS"]
\ No newline at end of file
@@ -0,0 +1,72 @@
+import csv
+import json
+from typing import Iterable, Iterator, List, Optional
+from ...application.dtos.import_dtos import AttendanceImportRecord
+
+
+NDJSON = "ndjson"
+CSV = "csv"
+SUPPORTED_FORMATS = (NDJSON, CSV)
+
+CSV_COLUMNS = ["employee_id", "date", "clock_in_at", "clock_out_at", "breaks", "notes"]
+
+
+def read_attendance_records(lines: Iterable[str], file_format: str) -> Iterator[AttendanceImportRecord]:
+    """Stream attendance rows one line at a time.
+
+    NDJSON lines are objects with the CSV_COLUMNS keys, where ``breaks`` is a
+    list of ``[start_at, end_at]`` pairs. CSV files have a header row and
+    encode ``breaks`` as ``start_at/end_at`` pairs separated by ``;``.
+    """
+    if file_format == NDJSON:
+        return _read_ndjson(lines)
+    if file_format == CSV:
+        return _read_csv(lines)
+    raise ValueError(f"Unsupported import format: {file_format}")
+
+
+def _read_ndjson(lines: Iterable[str]) -> Iterator[AttendanceImportRecord]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            fields = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield AttendanceImportRecord(line_number=line_number, error=f"Invalid JSON: {e}")
+            continue
+        if not isinstance(fields, dict):
+            yield AttendanceImportRecord(line_number=line_number, error="Expected a JSON object")
+            continue
+        yield AttendanceImportRecord(line_number=line_number, fields=fields)
+
+
+def _read_csv(lines: Iterable[str]) -> Iterator[AttendanceImportRecord]:
+    reader = csv.DictReader(lines)
+    for row in reader:
+        line_number = reader.line_num
+        try:
+            breaks = _parse_csv_breaks(row.get("breaks") or "")
+        except ValueError as e:
+            yield AttendanceImportRecord(line_number=line_number, error=str(e))
+            continue
+        yield AttendanceImportRecord(
+            line_number=line_number,
+            fields={
+                "employee_id": row.get("employee_id"),
+                "date": row.get("date"),
+                "clock_in_at": row.get("clock_in_at") or None,
+                "clock_out_at": row.get("clock_out_at") or None,
+                "breaks": breaks,
+                "notes": row.get("notes") or ""
+            }
+        )
+
+
+def _parse_csv_breaks(value: str) -> List[List[Optional[str]]]:
+    breaks: List[List[Optional[str]]] = []
+    for pair in filter(None, (part.strip() for part in value.split(";"))):
+        start, separator, end = pair.partition("/")
+        if not separator:
+            raise ValueError(f"Invalid break interval: {pair}")
+        breaks.append([start, end or None])
+    return breaks
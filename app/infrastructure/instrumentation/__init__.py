@@ -0,0 +1,22 @@
+from .metrics import (
+    Histogram,
+    RequestTimings,
+    render_metrics,
+    start_request,
+    end_request,
+    current_request,
+    timed_stage
+)
+from .profiler import RequestProfiler, ProfileReport
+
+__all__ = [
+    "Histogram",
+    "RequestTimings",
+    "render_metrics",
+    "start_request",
+    "end_request",
+    "current_request",
+    "timed_stage",
+    "RequestProfiler",
+    "ProfileReport",
+]
@@ -0,0 +1,134 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import ContextManager, Dict, List, Optional, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Histogram:
+    """Cumulative-bucket histogram rendered in the Prometheus text format"""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels -> (per-bucket counts with a final +Inf slot, sum)
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[labels] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = sorted(
+                (labels, list(counts), total[0]) for labels, (counts, total) in self._series.items()
+            )
+
+        for labels, counts, total in series:
+            label_text = ",".join(
+                f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels)
+            )
+            separator = "," if label_text else ""
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(bound)
+                lines.append(f'{self.name}_bucket{{{label_text}{separator}le="{le}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {total!r}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+        return lines
+
+
+def render_metrics(histograms: Sequence[Histogram]) -> str:
+    return "\n".join(line for histogram in histograms for line in histogram.render()) + "\n"
+
+
+class RequestTimings:
+    """Stage timings of the request being handled in the current context"""
+
+    __slots__ = ("histogram", "route", "endpoint_started", "dependency_seconds")
+
+    def __init__(self, histogram: Histogram, route: str):
+        self.histogram = histogram
+        self.route = route
+        self.endpoint_started: Optional[float] = None
+        # Dependencies timed as stages of their own, so parsing can be
+        # told apart from them
+        self.dependency_seconds = 0.0
+
+    def observe(self, stage: str, seconds: float) -> None:
+        self.histogram.observe((self.route, stage), seconds)
+
+    def observe_dependency(self, stage: str, seconds: float) -> None:
+        self.dependency_seconds += seconds
+        self.observe(stage, seconds)
+
+
+_current_request: ContextVar[Optional[RequestTimings]] = ContextVar("current_request", default=None)
+_NOT_TIMED = nullcontext()
+
+
+def start_request(timings: RequestTimings):
+    return _current_request.set(timings)
+
+
+def end_request(token) -> None:
+    _current_request.reset(token)
+
+
+def current_request() -> Optional[RequestTimings]:
+    return _current_request.get()
+
+
+def timed_stage(stage: str) -> ContextManager[None]:
+    """Time a block as ``stage`` of the current request; free outside one"""
+    timings = _current_request.get()
+    if timings is None:
+        return _NOT_TIMED
+    return _StageTimer(timings, stage)
+
+
+class _StageTimer:
+    __slots__ = ("_timings", "_stage", "_started")
+
+    def __init__(self, timings: RequestTimings, stage: str):
+        self._timings = timings
+        self._stage = stage
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._timings.observe(self._stage, time.perf_counter() - self._started)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
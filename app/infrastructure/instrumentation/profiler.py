@@ -0,0 +1,81 @@
+import cProfile
+import io
+import pstats
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ProfileReport:
+    captured_at: str
+    requests: int
+    text: str
+
+
+class RequestProfiler:
+    """Capture a cProfile report covering the next N requests.
+
+    arm(n) makes the next n requests start (or join) a capture; the profiler
+    stops once all of them have finished. cProfile sees the event loop
+    thread, so requests that overlap the window are included too, while
+    work offloaded to worker threads (blocking repositories) is not.
+    """
+
+    def __init__(self, top: int = 60):
+        self._top = top
+        self._lock = threading.Lock()
+        self._armed = 0
+        self._in_flight = 0
+        self._captured = 0
+        self._profile: Optional[cProfile.Profile] = None
+        self._last_report: Optional[ProfileReport] = None
+
+    def arm(self, requests: int) -> None:
+        if requests < 1:
+            raise ValueError("requests must be at least 1")
+        with self._lock:
+            if self._armed or self._profile is not None:
+                raise ValueError("A profile capture is already in progress")
+            self._armed = requests
+
+    def request_started(self) -> bool:
+        """Whether this request is part of a capture; pair with request_finished"""
+        with self._lock:
+            if not self._armed:
+                return False
+            self._armed -= 1
+            self._in_flight += 1
+            self._captured += 1
+            if self._profile is None:
+                self._profile = cProfile.Profile()
+                self._profile.enable()
+            return True
+
+    def request_finished(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if self._in_flight or self._armed or self._profile is None:
+                return
+            profile, self._profile = self._profile, None
+            profile.disable()
+            captured, self._captured = self._captured, 0
+
+        stream = io.StringIO()
+        pstats.Stats(profile, stream=stream).sort_stats("cumulative").print_stats(self._top)
+        report = ProfileReport(
+            captured_at=datetime.now(timezone.utc).isoformat(),
+            requests=captured,
+            text=stream.getvalue()
+        )
+        with self._lock:
+            self._last_report = report
+
+    def pending_requests(self) -> int:
+        with self._lock:
+            return self._armed
+
+    def last_report(self) -> Optional[ProfileReport]:
+        with self._lock:
+            return self._last_report
@@ -0,0 +1,21 @@
+from .outbox import Outbox, OutboxMessage
+from .in_memory_outbox import InMemoryOutbox
+from .sqlite_outbox import SQLiteOutbox
+from .event_messages import timesheet_event_messages, leave_request_event_messages
+from .sinks import EventSink, JsonLinesFileSink, TcpSink, create_sink
+from .dispatcher import OutboxDispatcher, DispatcherStats
+
+__all__ = [
+    "Outbox",
+    "OutboxMessage",
+    "InMemoryOutbox",
+    "SQLiteOutbox",
+    "timesheet_event_messages",
+    "leave_request_event_messages",
+    "EventSink",
+    "JsonLinesFileSink",
+    "TcpSink",
+    "create_sink",
+    "OutboxDispatcher",
+    "DispatcherStats",
+]
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from anyio import to_thread
+from .outbox import Outbox
+from .sinks import EventSink
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DispatcherStats:
+    delivered: int
+    failures: int
+    last_error: Optional[str]
+
+
+class OutboxDispatcher:
+    """Background task that drains outboxes into the sinks in batches.
+
+    Each batch is delivered to every sink and then acknowledged, so a failed
+    sink makes the whole batch retry after ``retry_delay_seconds`` (at-least-
+    once delivery, in commit order per outbox). Only the holder of an
+    outbox's lease dispatches it, so several worker processes can each run a
+    dispatcher. Outboxes and sinks block, so they are driven from a worker
+    thread and the event loop only waits.
+    """
+
+    def __init__(
+        self,
+        outboxes: List[Outbox],
+        sinks: List[EventSink],
+        batch_size: int = 500,
+        poll_interval_seconds: float = 0.2,
+        retry_delay_seconds: float = 1.0,
+        lease_seconds: float = 10.0
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._outboxes = outboxes
+        self._sinks = sinks
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._retry_delay_seconds = retry_delay_seconds
+        self._lease_seconds = lease_seconds
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # Serializes dispatch_once() between the task and a final drain
+        self._dispatch_lock = threading.Lock()
+        # outbox index -> (lease held, when it was last claimed or checked)
+        self._leases: Dict[int, Tuple[bool, float]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._delivered = 0
+        self._failures = 0
+        self._last_error: Optional[str] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the task, then deliver what is already committed"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            while await to_thread.run_sync(self.dispatch_once):
+                pass
+        except Exception as e:
+            # Whatever is left stays in a persistent outbox for the next start
+            self._record_failure(e)
+        for sink in self._sinks:
+            sink.close()
+
+    def dispatch_once(self) -> int:
+        """Deliver one batch from each outbox whose lease is held; returns the count"""
+        delivered = 0
+        with self._dispatch_lock:
+            for index, outbox in enumerate(self._outboxes):
+                if not self._holds_lease(index, outbox):
+                    continue
+                messages = outbox.fetch(self._batch_size)
+                if not messages:
+                    continue
+                for sink in self._sinks:
+                    sink.deliver(messages)
+                outbox.acknowledge([message.message_id for message in messages])
+                delivered += len(messages)
+        self._delivered += delivered
+        return delivered
+
+    def stats(self) -> DispatcherStats:
+        return DispatcherStats(
+            delivered=self._delivered,
+            failures=self._failures,
+            last_error=self._last_error
+        )
+
+    def _holds_lease(self, index: int, outbox: Outbox) -> bool:
+        # Claiming the lease writes to the database, so it is renewed (or
+        # retried by the processes without it) a few times per lease period
+        # rather than on every poll
+        now = time.monotonic()
+        held, checked_at = self._leases.get(index, (False, float("-inf")))
+        if now - checked_at < self._lease_seconds / 3:
+            return held
+        held = outbox.try_lease(self._owner, self._lease_seconds)
+        self._leases[index] = (held, now)
+        return held
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                delivered = await to_thread.run_sync(self.dispatch_once)
+            except Exception as e:
+                self._record_failure(e)
+                await asyncio.sleep(self._retry_delay_seconds)
+                continue
+            if delivered < self._batch_size:
+                await asyncio.sleep(self._poll_interval_seconds)
+
+    def _record_failure(self, error: Exception) -> None:
+        self._failures += 1
+        self._last_error = f"{type(error).__name__}: {error}"
+        logger.warning("Outbox dispatch failed: %s", self._last_error)
@@ -0,0 +1,54 @@
+import json
+from dataclasses import fields
+from enum import Enum
+from typing import Any, Dict, List
+from .outbox import OutboxMessage
+from ...domain.events import DomainEvent
+from ...domain.models import Timesheet, Date, DateTime, DateRange
+from ...domain.models.leave_request import LeaveRequest
+
+
+def timesheet_event_messages(timesheet: Timesheet) -> List[OutboxMessage]:
+    """Outbox messages for the timesheet's pending events, keyed by employee.
+
+    Built before the save, so ``version`` is the version being written.
+    """
+    events = timesheet.pending_events()
+    if not events:
+        return []
+    context = {
+        "employee_id": timesheet.employee_id,
+        "year_month": str(timesheet.year_month),
+        "timesheet_id": timesheet.timesheet_id,
+        "version": timesheet.version + 1
+    }
+    return [_message(event, timesheet.employee_id, context) for event in events]
+
+
+def leave_request_event_messages(request: LeaveRequest) -> List[OutboxMessage]:
+    return [_message(event, request.employee_id, {}) for event in request.pending_events()]
+
+
+def _message(event: DomainEvent, key: str, context: Dict[str, Any]) -> OutboxMessage:
+    topic = type(event).__name__
+    payload: Dict[str, Any] = {"type": topic, **context}
+    for event_field in fields(event):
+        payload[event_field.name] = _plain(getattr(event, event_field.name))
+    return OutboxMessage(
+        topic=topic,
+        key=key,
+        payload=json.dumps(payload, separators=(",", ":"))
+    )
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, (Date, DateTime)):
+        return value.value.isoformat()
+    if isinstance(value, DateRange):
+        return {
+            "start_date": value.start_date.value.isoformat(),
+            "end_date": value.end_date.value.isoformat()
+        }
+    if isinstance(value, Enum):
+        return value.value
+    return value
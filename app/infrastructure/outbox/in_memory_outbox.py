@@ -0,0 +1,39 @@
+import threading
+from collections import deque
+from typing import Deque, List
+from .outbox import Outbox, OutboxMessage
+
+
+class InMemoryOutbox(Outbox):
+    """Outbox for the in-memory repositories, which commit under their own locks"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._messages: Deque[OutboxMessage] = deque()
+        self._next_id = 1
+
+    def append(self, messages: List[OutboxMessage]) -> None:
+        with self._lock:
+            for message in messages:
+                self._messages.append(OutboxMessage(
+                    topic=message.topic,
+                    key=message.key,
+                    payload=message.payload,
+                    message_id=self._next_id
+                ))
+                self._next_id += 1
+
+    def fetch(self, limit: int) -> List[OutboxMessage]:
+        with self._lock:
+            return [self._messages[i] for i in range(min(limit, len(self._messages)))]
+
+    def acknowledge(self, message_ids: List[int]) -> None:
+        acknowledged = set(message_ids)
+        with self._lock:
+            # Messages are acknowledged oldest first
+            while self._messages and self._messages[0].message_id in acknowledged:
+                self._messages.popleft()
+
+    def try_lease(self, owner: str, seconds: float) -> bool:
+        # Only the process that holds the repositories can see this outbox
+        return True
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """A domain event waiting to be delivered; message_id is set by the outbox"""
+    topic: str
+    key: str
+    payload: str
+    message_id: int = 0
+
+
+class Outbox(ABC):
+    """Domain events committed together with the aggregates that raised them.
+
+    Messages are read in the order they were committed and stay in the
+    outbox until acknowledged, so delivery is at least once.
+    """
+
+    @abstractmethod
+    def fetch(self, limit: int) -> List[OutboxMessage]:
+        """The oldest unacknowledged messages, at most limit of them"""
+        pass
+
+    @abstractmethod
+    def acknowledge(self, message_ids: List[int]) -> None:
+        """Remove delivered messages"""
+        pass
+
+    @abstractmethod
+    def try_lease(self, owner: str, seconds: float) -> bool:
+        """Claim or renew the right to dispatch for seconds; only one owner holds it"""
+        pass
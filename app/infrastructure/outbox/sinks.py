@@ -0,0 +1,111 @@
+import json
+import os
+import socket
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Optional
+from .outbox import OutboxMessage
+
+
+class EventSink(ABC):
+    """Downstream consumer of outbox messages; deliver() may block"""
+
+    @abstractmethod
+    def deliver(self, messages: List[OutboxMessage]) -> None:
+        """Deliver messages in order, or raise to have the batch retried"""
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class JsonLinesFileSink(EventSink):
+    """Appends one JSON line per message and fsyncs each batch"""
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "ab")
+
+    def deliver(self, messages: List[OutboxMessage]) -> None:
+        self._file.write(b"".join(_json_line(message) for message in messages))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class TcpSink(EventSink):
+    """Streams JSON lines to host:port and waits for the consumer's ack.
+
+    Once the consumer has stored a batch it replies with the id of the
+    batch's last message on a line of its own; only then does deliver()
+    return and the batch get acknowledged in the outbox. Any failure,
+    including no or a wrong ack within ``timeout_seconds``, drops the
+    connection, so a batch cut off mid-line is resent from a line boundary
+    on a new one. Consumers discard an unterminated last line when a
+    connection closes.
+    """
+
+    def __init__(self, host: str, port: int, timeout_seconds: float = 5.0):
+        self._address = (host, port)
+        self._timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._socket: Optional[socket.socket] = None
+        self._received = b""
+
+    def deliver(self, messages: List[OutboxMessage]) -> None:
+        with self._lock:
+            if self._socket is None:
+                self._socket = socket.create_connection(self._address, self._timeout_seconds)
+                self._received = b""
+            try:
+                self._socket.sendall(b"".join(_json_line(message) for message in messages))
+                ack = self._read_line(self._socket)
+                expected = str(messages[-1].message_id).encode()
+                if ack != expected:
+                    raise ConnectionError(
+                        f"Event consumer acknowledged {ack!r}, expected {expected!r}"
+                    )
+            except OSError:
+                self._disconnect()
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _read_line(self, connection: socket.socket) -> bytes:
+        while b"\n" not in self._received:
+            chunk = connection.recv(4096)
+            if not chunk:
+                raise ConnectionError("Event consumer closed the connection before acknowledging")
+            self._received += chunk
+        line, _, self._received = self._received.partition(b"\n")
+        return line.strip()
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+def create_sink(spec: str) -> EventSink:
+    """Sink for ``file:<path>`` or ``tcp:<host>:<port>``"""
+    kind, _, target = spec.partition(":")
+    if kind == "file" and target:
+        return JsonLinesFileSink(target)
+    if kind == "tcp" and target:
+        host, _, port = target.rpartition(":")
+        if host and port.isdigit():
+            return TcpSink(host, int(port))
+    raise ValueError(f"Unknown event sink: {spec!r} (expected file:<path> or tcp:<host>:<port>)")
+
+
+def _json_line(message: OutboxMessage) -> bytes:
+    # The payload is already JSON. Delivery is at least once: consumers
+    # drop repeats by the event's employee, type and timesheet version (or
+    # leave request id); message ids only order one database's outbox
+    header = json.dumps({"id": message.message_id, "topic": message.topic, "key": message.key})
+    return f'{header[:-1]}, "event": {message.payload}}}\n'.encode()
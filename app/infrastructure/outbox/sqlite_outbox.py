@@ -0,0 +1,75 @@
+import sqlite3
+import time
+from typing import List, Optional
+from .outbox import Outbox, OutboxMessage
+from ..repositories.sqlite_connection_pool import SQLiteConnectionPool
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox_messages (
+    message_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS outbox_lease (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_INSERT = "INSERT INTO outbox_messages (topic, key, payload) VALUES (?, ?, ?)"
+_SELECT_OLDEST = (
+    "SELECT message_id, topic, key, payload FROM outbox_messages "
+    "ORDER BY message_id LIMIT ?"
+)
+_DELETE = "DELETE FROM outbox_messages WHERE message_id = ?"
+_TAKE_LEASE = (
+    "INSERT INTO outbox_lease (name, owner, expires_at) VALUES ('dispatcher', ?, ?) "
+    "ON CONFLICT (name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+    "WHERE outbox_lease.owner = excluded.owner OR outbox_lease.expires_at < ?"
+)
+_SELECT_LEASE_OWNER = "SELECT owner FROM outbox_lease WHERE name = 'dispatcher'"
+
+
+class SQLiteOutbox(Outbox):
+    """Outbox table inside a repository's SQLite database.
+
+    Repositories given this outbox call append() with the connection of their
+    save transaction, so an aggregate and its events commit or roll back
+    together. Worker processes sharing the database take turns through a
+    lease, which keeps a single dispatcher and the commit order.
+    """
+
+    def __init__(self, path: str, pool: Optional[SQLiteConnectionPool] = None):
+        self._pool = pool or SQLiteConnectionPool(path)
+        self._pool.connection().executescript(_SCHEMA)
+
+    def append(self, connection: sqlite3.Connection, messages: List[OutboxMessage]) -> None:
+        """Insert messages within the caller's open transaction"""
+        connection.executemany(
+            _INSERT, [(message.topic, message.key, message.payload) for message in messages]
+        )
+
+    def fetch(self, limit: int) -> List[OutboxMessage]:
+        rows = self._pool.connection().execute(_SELECT_OLDEST, (limit,))
+        return [
+            OutboxMessage(topic=topic, key=key, payload=payload, message_id=message_id)
+            for message_id, topic, key, payload in rows
+        ]
+
+    def acknowledge(self, message_ids: List[int]) -> None:
+        with self._pool.transaction() as connection:
+            connection.executemany(_DELETE, [(message_id,) for message_id in message_ids])
+
+    def try_lease(self, owner: str, seconds: float) -> bool:
+        now = time.time()
+        with self._pool.transaction() as connection:
+            connection.execute(_TAKE_LEASE, (owner, now + seconds, now))
+            row = connection.execute(_SELECT_LEASE_OWNER).fetchone()
+        return row is not None and row[0] == owner
+
+    def close(self) -> None:
+        self._pool.close()
@@ -0,0 +1,3 @@
+from .presence_bus import PresenceBus, PresenceSubscription, PresenceUpdate
+
+__all__ = ["PresenceBus", "PresenceSubscription", "PresenceUpdate"]
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set
+from ...application.dtos.presence_dtos import PresenceEvent, PresenceSnapshot
+from ...application.usecases.presence_publisher import PresencePublisher
+
+
+_CLOCKED_OUT = "clocked_out"
+
+
+@dataclass
+class PresenceUpdate:
+    """What a subscriber receives next: a snapshot or the events since the last update"""
+    snapshot: Optional[PresenceSnapshot] = None
+    events: List[PresenceEvent] = field(default_factory=list)
+
+
+class PresenceBus(PresencePublisher):
+    """In-process fan-out of attendance state transitions to live subscribers.
+
+    The bus also keeps the latest event of every employee who is clocked in
+    or on break, which new subscribers receive as their first update. It only
+    knows about punches handled by this process since it started.
+
+    Each subscriber has a bounded queue. A subscriber that falls
+    max_queue_size events behind has its queue dropped and gets a fresh
+    snapshot instead, so a slow consumer costs bounded memory and never
+    holds up publish() or the other subscribers.
+    """
+
+    def __init__(self, max_queue_size: int = 256):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        self._max_queue_size = max_queue_size
+        self._lock = threading.Lock()
+        # site -> subscriptions; None holds the unfiltered subscriptions
+        self._subscriptions: Dict[Optional[str], Set["PresenceSubscription"]] = {}
+        self._present: Dict[str, PresenceEvent] = {}
+
+    def publish(self, event: PresenceEvent) -> None:
+        with self._lock:
+            if event.current_state == _CLOCKED_OUT:
+                self._present.pop(event.employee_id, None)
+            else:
+                self._present[event.employee_id] = event
+            targets = list(self._subscriptions.get(None, ()))
+            if event.site_id is not None:
+                targets.extend(self._subscriptions.get(event.site_id, ()))
+
+        for subscription in targets:
+            subscription._offer(event)
+
+    def snapshot(self, site_id: Optional[str] = None) -> PresenceSnapshot:
+        with self._lock:
+            present = [
+                event for event in self._present.values()
+                if site_id is None or event.site_id == site_id
+            ]
+        present.sort(key=lambda event: event.employee_id)
+        return PresenceSnapshot(present=present)
+
+    def subscribe(self, site_id: Optional[str] = None) -> "PresenceSubscription":
+        """Subscribe from the event loop that will consume the updates"""
+        subscription = PresenceSubscription(
+            self, site_id, asyncio.get_running_loop(), self._max_queue_size
+        )
+        with self._lock:
+            self._subscriptions.setdefault(site_id, set()).add(subscription)
+        return subscription
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def _unsubscribe(self, subscription: "PresenceSubscription") -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.site_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.site_id]
+
+
+class PresenceSubscription:
+    """Updates for one subscriber; close() it when the subscriber goes away"""
+
+    def __init__(
+        self,
+        bus: PresenceBus,
+        site_id: Optional[str],
+        loop: asyncio.AbstractEventLoop,
+        max_queue_size: int
+    ):
+        self.site_id = site_id
+        self._bus = bus
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._max_queue_size = max_queue_size
+        self._queue: Deque[PresenceEvent] = deque()
+        self._ready = asyncio.Event()
+        # Starts behind, so the first update is a snapshot
+        self._needs_snapshot = True
+        self._ready.set()
+        self._closed = False
+        self.dropped = 0
+
+    async def receive(self) -> PresenceUpdate:
+        await self._ready.wait()
+        self._ready.clear()
+
+        if self._needs_snapshot:
+            # Anything still queued is covered by the snapshot
+            self._needs_snapshot = False
+            self._queue.clear()
+            return PresenceUpdate(snapshot=self._bus.snapshot(self.site_id))
+
+        events = list(self._queue)
+        self._queue.clear()
+        return PresenceUpdate(events=events)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._bus._unsubscribe(self)
+
+    def _offer(self, event: PresenceEvent) -> None:
+        if threading.get_ident() == self._loop_thread:
+            self._enqueue(event)
+            return
+        # Published from a worker thread (a blocking use case)
+        try:
+            self._loop.call_soon_threadsafe(self._enqueue, event)
+        except RuntimeError:
+            # The subscriber's loop has shut down
+            self.close()
+
+    def _enqueue(self, event: PresenceEvent) -> None:
+        if self._closed or self._needs_snapshot:
+            # A pending snapshot will include this event
+            return
+        if len(self._queue) >= self._max_queue_size:
+            self.dropped += len(self._queue)
+            self._queue.clear()
+            self._needs_snapshot = True
+        else:
+            self._queue.append(event)
+        self._ready.set()
@@ -1,3 +1,41 @@
 from .in_memory_timesheet_repository import InMemoryTimesheetRepository
+from .event_log_timesheet_repository import EventLogTimesheetRepository
+from .sqlite_timesheet_repository import SQLiteTimesheetRepository
+from .async_timesheet_repository_adapter import AsyncTimesheetRepositoryAdapter
+from .caching_timesheet_repository import CachingTimesheetRepository, CacheStats
+from .write_behind_timesheet_repository import WriteBehindTimesheetRepository, CommitHandle
+from .sharded_timesheet_repository import (
+    ShardedTimesheetRepository,
+    RebalanceStats,
+    rebalance_timesheets
+)
+from .consistent_hash_ring import ConsistentHashRing
+from .instrumented_timesheet_repository import InstrumentedTimesheetRepository
+from .in_memory_overtime_request_repository import InMemoryOvertimeRequestRepository
+from .in_memory_leave_request_repository import InMemoryLeaveRequestRepository
+from .sqlite_overtime_request_repository import SQLiteOvertimeRequestRepository
+from .sqlite_leave_request_repository import SQLiteLeaveRequestRepository
+from .async_leave_request_repository_adapter import AsyncLeaveRequestRepositoryAdapter
+from .sqlite_connection_pool import SQLiteConnectionPool
 
-__all__ = ["InMemoryTimesheetRepository"]
\ No newline at end of file
+__all__ = [
+    "InMemoryTimesheetRepository",
+    "EventLogTimesheetRepository",
+    "SQLiteTimesheetRepository",
+    "AsyncTimesheetRepositoryAdapter",
+    "CachingTimesheetRepository",
+    "CacheStats",
+    "WriteBehindTimesheetRepository",
+    "CommitHandle",
+    "ShardedTimesheetRepository",
+    "RebalanceStats",
+    "rebalance_timesheets",
+    "ConsistentHashRing",
+    "InstrumentedTimesheetRepository",
+    "InMemoryOvertimeRequestRepository",
+    "InMemoryLeaveRequestRepository",
+    "SQLiteOvertimeRequestRepository",
+    "SQLiteLeaveRequestRepository",
+    "AsyncLeaveRequestRepositoryAdapter",
+    "SQLiteConnectionPool",
+]
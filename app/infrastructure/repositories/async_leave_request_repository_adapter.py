@@ -0,0 +1,27 @@
+from anyio import to_thread
+from ...domain.repositories.leave_request_repository import LeaveRequestRepository
+from ...domain.repositories.async_leave_request_repository import AsyncLeaveRequestRepository
+from ...domain.models import EmployeeId, Date
+
+
+class AsyncLeaveRequestRepositoryAdapter(AsyncLeaveRequestRepository):
+    """Expose a sync LeaveRequestRepository through the async port.
+
+    Same threading rule as AsyncTimesheetRepositoryAdapter: ``run_in_thread``
+    for blocking backends, inline calls otherwise.
+    """
+
+    def __init__(self, repository: LeaveRequestRepository, run_in_thread: bool = False):
+        self._repository = repository
+        self._run_in_thread = run_in_thread
+
+    @property
+    def repository(self) -> LeaveRequestRepository:
+        return self._repository
+
+    async def has_approved_leave_on(self, employee_id: EmployeeId, date: Date) -> bool:
+        if self._run_in_thread:
+            return await to_thread.run_sync(
+                self._repository.has_approved_leave_on, employee_id, date
+            )
+        return self._repository.has_approved_leave_on(employee_id, date)
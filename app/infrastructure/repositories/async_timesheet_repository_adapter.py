@@ -0,0 +1,58 @@
+from typing import List, Optional
+from anyio import to_thread
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
+from ...domain.models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+
+
+class AsyncTimesheetRepositoryAdapter(AsyncTimesheetRepository):
+    """Expose a sync TimesheetRepository through the async port.
+
+    Non-blocking backends (in-memory) are called inline on the event loop;
+    blocking ones are offloaded to a worker thread with ``run_in_thread``.
+    """
+
+    def __init__(self, repository: TimesheetRepository, run_in_thread: bool = False):
+        self._repository = repository
+        self._run_in_thread = run_in_thread
+
+    @property
+    def repository(self) -> TimesheetRepository:
+        return self._repository
+
+    async def find_by(self, employee_id: EmployeeId, year_month: YearMonth) -> Optional[Timesheet]:
+        if self._run_in_thread:
+            return await to_thread.run_sync(self._repository.find_by, employee_id, year_month)
+        return self._repository.find_by(employee_id, year_month)
+
+    async def save(self, timesheet: Timesheet) -> None:
+        # Wait for the commit without holding a worker thread, so a
+        # write-behind repository's batch delay is spent on the event loop
+        if self._run_in_thread:
+            handle = await to_thread.run_sync(self._repository.save_deferred, timesheet)
+        else:
+            handle = self._repository.save_deferred(timesheet)
+        await handle
+
+    async def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        if self._run_in_thread:
+            return await to_thread.run_sync(self._repository.find_by_status, year_month, status)
+        return self._repository.find_by_status(year_month, status)
+
+    async def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        if self._run_in_thread:
+            return await to_thread.run_sync(
+                self._repository.find_employee_ids_by_attendance_state, date, state
+            )
+        return self._repository.find_employee_ids_by_attendance_state(date, state)
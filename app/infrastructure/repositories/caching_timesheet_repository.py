@@ -0,0 +1,164 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+from ...domain.exceptions import ConcurrencyConflictError
+from .timesheet_serializer import copy_timesheet
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class CachingTimesheetRepository(TimesheetRepository):
+    """Read-through, write-through LRU cache in front of another repository.
+
+    Punches load and save the same current-month timesheets all day, so
+    find_by is served from the cache and save() writes through to the
+    backend and then refreshes the cached copy. At most ``max_entries``
+    timesheets are held; the least recently used one is evicted first.
+
+    The backend's version check still guards every save. If another process
+    wrote the timesheet, save() raises ConcurrencyConflictError, the stale
+    entry is dropped, and the caller's retry reloads from the backend. Plain
+    reads are not checked, so with several processes on one database a
+    cached read can lag behind the other processes' writes.
+    """
+
+    def __init__(self, repository: TimesheetRepository, max_entries: int = 10_000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._repository = repository
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[Tuple[str, str], Timesheet] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def repository(self) -> TimesheetRepository:
+        return self._repository
+
+    def find_by(self, employee_id: EmployeeId, year_month: YearMonth) -> Optional[Timesheet]:
+        key = self._create_key(employee_id, year_month)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if cached is not None:
+            return copy_timesheet(cached)
+
+        timesheet = self._repository.find_by(employee_id, year_month)
+        if timesheet is not None:
+            self._store(key, copy_timesheet(timesheet))
+        return timesheet
+
+    def save(self, timesheet: Timesheet) -> None:
+        key = self._create_key(timesheet.employee_id, timesheet.year_month)
+        try:
+            self._repository.save(timesheet)
+        except BaseException:
+            # On a conflict the cached copy is stale; on any other failure
+            # the backend may or may not have written. Either way, drop it
+            self.invalidate(timesheet.employee_id, timesheet.year_month)
+            raise
+        self._store(key, copy_timesheet(timesheet))
+
+    def save_all(self, timesheets: List[Timesheet]) -> List[Optional[ConcurrencyConflictError]]:
+        try:
+            results = self._repository.save_all(timesheets)
+        except BaseException:
+            for timesheet in timesheets:
+                self.invalidate(timesheet.employee_id, timesheet.year_month)
+            raise
+
+        for timesheet, error in zip(timesheets, results):
+            if error is None:
+                key = self._create_key(timesheet.employee_id, timesheet.year_month)
+                self._store(key, copy_timesheet(timesheet))
+            else:
+                self.invalidate(timesheet.employee_id, timesheet.year_month)
+        return results
+
+    def find_all_by_year_month(self, year_month: YearMonth) -> Iterator[Timesheet]:
+        return self._repository.find_all_by_year_month(year_month)
+
+    def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        return self._repository.find_by_status(year_month, status)
+
+    def find_by_approver(
+        self,
+        year_month: YearMonth,
+        approver_id: EmployeeId,
+        status: TimesheetStatus,
+        after: Optional[EmployeeId] = None,
+        limit: Optional[int] = None
+    ) -> List[Timesheet]:
+        return self._repository.find_by_approver(year_month, approver_id, status, after, limit)
+
+    def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        return self._repository.find_employee_ids_by_attendance_state(date, state)
+
+    def invalidate(self, employee_id: EmployeeId, year_month: YearMonth) -> None:
+        with self._lock:
+            self._cache.pop(self._create_key(employee_id, year_month), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                size=len(self._cache),
+                max_entries=self._max_entries,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions
+            )
+
+    def close(self) -> None:
+        self.clear()
+        close = getattr(self._repository, "close", None)
+        if close:
+            close()
+
+    def _store(self, key: Tuple[str, str], timesheet: Timesheet) -> None:
+        with self._lock:
+            cached = self._cache.get(key)
+            # A concurrent find_by may bring back an older version than a
+            # save that finished first; keep the newest one
+            if cached is not None and cached.version > timesheet.version:
+                return
+            self._cache[key] = timesheet
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def _create_key(self, employee_id: EmployeeId, year_month: YearMonth) -> Tuple[str, str]:
+        year_month_str = f"{year_month.year:04d}-{year_month.month:02d}"
+        return (employee_id, year_month_str)
@@ -0,0 +1,45 @@
+import bisect
+import hashlib
+from typing import Iterable, List, Tuple
+
+
+class ConsistentHashRing:
+    """Map keys onto named shards so that adding a shard moves few keys.
+
+    Each shard is placed on a 64-bit ring at ``virtual_nodes`` points and a
+    key belongs to the first point at or after its own hash. Adding a shard
+    to N existing ones moves about 1/(N+1) of the keys, all to the new
+    shard. Placement only depends on the shard names, so every process
+    configured with the same names routes keys the same way.
+    """
+
+    def __init__(self, shard_names: Iterable[str], virtual_nodes: int = 128):
+        names = list(dict.fromkeys(shard_names))
+        if not names:
+            raise ValueError("A hash ring needs at least one shard")
+        if virtual_nodes < 1:
+            raise ValueError("virtual_nodes must be at least 1")
+
+        points: List[Tuple[int, str]] = sorted(
+            (_hash(f"{name}#{replica}"), name)
+            for name in names
+            for replica in range(virtual_nodes)
+        )
+        self._names = names
+        self._hashes = [point for point, _ in points]
+        self._owners = [name for _, name in points]
+
+    @property
+    def shard_names(self) -> List[str]:
+        return list(self._names)
+
+    def shard_for(self, key: str) -> str:
+        index = bisect.bisect_left(self._hashes, _hash(key))
+        if index == len(self._hashes):
+            index = 0
+        return self._owners[index]
+
+
+def _hash(value: str) -> int:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
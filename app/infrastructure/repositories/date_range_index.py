@@ -0,0 +1,60 @@
+import threading
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, List, Tuple
+
+
+class DateRangeIndex:
+    """Inclusive date ranges per owner, answering "is this date covered?".
+
+    Each owner's ranges are merged into sorted, disjoint intervals whenever
+    they change, so contains() is one bisect over the interval starts. Ranges
+    change rarely (on approval) and are looked up on every clock in.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ranges: Dict[str, Dict[str, Tuple[date, date]]] = {}
+        self._merged: Dict[str, Tuple[List[date], List[date]]] = {}
+
+    def add(self, owner: str, range_id: str, start: date, end: date) -> None:
+        with self._lock:
+            ranges = self._ranges.setdefault(owner, {})
+            if ranges.get(range_id) == (start, end):
+                return
+            ranges[range_id] = (start, end)
+            self._merge(owner)
+
+    def remove(self, owner: str, range_id: str) -> None:
+        with self._lock:
+            ranges = self._ranges.get(owner)
+            if not ranges or range_id not in ranges:
+                return
+            del ranges[range_id]
+            self._merge(owner)
+
+    def contains(self, owner: str, day: date) -> bool:
+        merged = self._merged.get(owner)
+        if merged is None:
+            return False
+        starts, ends = merged
+        position = bisect_right(starts, day) - 1
+        return position >= 0 and day <= ends[position]
+
+    def _merge(self, owner: str) -> None:
+        ranges = self._ranges[owner]
+        if not ranges:
+            del self._ranges[owner]
+            self._merged.pop(owner, None)
+            return
+
+        starts: List[date] = []
+        ends: List[date] = []
+        for start, end in sorted(ranges.values()):
+            if ends and start.toordinal() <= ends[-1].toordinal() + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        # Replace both lists at once so lock-free readers never see a mix
+        self._merged[owner] = (starts, ends)
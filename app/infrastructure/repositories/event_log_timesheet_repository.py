@@ -0,0 +1,459 @@
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+from ...domain.exceptions import ConcurrencyConflictError
+from .timesheet_serializer import (
+    serialize_timesheet,
+    deserialize_timesheet,
+    serialize_totals,
+    empty_entry_data
+)
+from .timesheet_index import TimesheetIndex, IndexedFields
+
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_PREFIX = "segment-"
+_SNAPSHOT_PREFIX = "snapshot-"
+
+_STATUS_OPS = {
+    "submitted": "submit",
+    "approved": "approve",
+    "rejected": "reject",
+    "draft": "reopen",
+}
+_OP_STATUSES = {op: status for status, op in _STATUS_OPS.items()}
+
+
+class EventLogTimesheetRepository(TimesheetRepository):
+    """Append-only, segmented log of timesheet state changes.
+
+    Each save() appends one compact record per change (clock_in, start_break,
+    end_break, clock_out, submit, ...) instead of rewriting the aggregate.
+    Records are folded into plain state dicts as the log is replayed at
+    startup, and Timesheet aggregates are only built from them on find_by.
+    Replay stays eager because the status, approver and attendance-state
+    indexes and every save's version check need the state of each timesheet,
+    so a lazy fold would still have to read the whole log up front. The log
+    is compacted into a snapshot every ``snapshot_every_records`` records so
+    that startup replay stays bounded. Compaction writes the snapshot on a
+    background thread, and a flusher thread fsyncs the open segment at least
+    every ``fsync_interval_seconds`` while writes are pending.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        fsync_batch_size: int = 64,
+        fsync_interval_seconds: float = 0.05,
+        snapshot_every_records: int = 100_000
+    ):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._segment_max_bytes = segment_max_bytes
+        self._fsync_batch_size = fsync_batch_size
+        self._fsync_interval_seconds = fsync_interval_seconds
+        self._snapshot_every_records = snapshot_every_records
+
+        self._lock = threading.Lock()
+        self._states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._index = TimesheetIndex()
+        self._records_since_snapshot = 0
+        self._unsynced_writes = 0
+        self._last_sync = time.monotonic()
+        self._compaction: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+
+        self._segment_seq = self._recover()
+        for key, state in self._states.items():
+            if "totals" not in state:
+                # Replayed records change entries without their totals
+                state["totals"] = serialize_totals(deserialize_timesheet(state).monthly_totals())
+            self._index.update(key, IndexedFields.of_state(state))
+        self._segment = self._open_segment(self._segment_seq)
+
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="event-log-fsync", daemon=True
+        )
+        self._flusher.start()
+
+    def find_by(self, employee_id: EmployeeId, year_month: YearMonth) -> Optional[Timesheet]:
+        state = self._states.get(self._create_key(employee_id, year_month))
+        if state is None:
+            return None
+        return deserialize_timesheet(state)
+
+    def save(self, timesheet: Timesheet) -> None:
+        error = self.save_all([timesheet])[0]
+        if error is not None:
+            raise error
+
+    def save_all(self, timesheets: List[Timesheet]) -> List[Optional[ConcurrencyConflictError]]:
+        prepared = []
+        for timesheet in timesheets:
+            new_state = serialize_timesheet(timesheet)
+            new_state["version"] = timesheet.version + 1
+            prepared.append((timesheet, self._create_key(timesheet.employee_id, timesheet.year_month), new_state))
+
+        results: List[Optional[ConcurrencyConflictError]] = []
+        with self._lock:
+            # Later saves of the same timesheet in the batch build on the
+            # earlier ones, so check versions against the staged states
+            staged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            records: List[Dict[str, Any]] = []
+            accepted: List[Timesheet] = []
+            for timesheet, key, new_state in prepared:
+                old_state = staged[key] if key in staged else self._states.get(key)
+                stored_version = old_state["version"] if old_state else 0
+                if timesheet.version != stored_version:
+                    results.append(ConcurrencyConflictError(
+                        f"Timesheet {key} was modified concurrently "
+                        f"(expected version {timesheet.version}, found {stored_version})"
+                    ))
+                    continue
+
+                records.extend(_diff_states(key, old_state, new_state))
+                staged[key] = new_state
+                accepted.append(timesheet)
+                results.append(None)
+
+            if records:
+                self._append(records)
+            for key, new_state in staged.items():
+                self._states[key] = new_state
+                self._index.update(key, IndexedFields.of_state(new_state))
+            for timesheet in accepted:
+                timesheet.version += 1
+                # Compaction drops old segments, so this log cannot double as
+                # an outbox; events are only kept by the other backends
+                timesheet.clear_events()
+            self._records_since_snapshot += len(records)
+
+            if (
+                self._records_since_snapshot >= self._snapshot_every_records and
+                self._compaction is None
+            ):
+                self._start_compaction()
+        return results
+
+    def find_all_by_year_month(self, year_month: YearMonth) -> Iterator[Timesheet]:
+        keys = self._index.keys_by_year_month(str(year_month))
+        for key in keys:
+            yield deserialize_timesheet(self._states[key])
+
+    def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        keys = self._index.keys_by_status(str(year_month), status.value)
+        return [deserialize_timesheet(self._states[key]) for key in keys]
+
+    def find_by_approver(
+        self,
+        year_month: YearMonth,
+        approver_id: EmployeeId,
+        status: TimesheetStatus,
+        after: Optional[EmployeeId] = None,
+        limit: Optional[int] = None
+    ) -> List[Timesheet]:
+        keys = self._index.keys_by_approver(
+            str(year_month), approver_id, status.value, after, limit
+        )
+        return [deserialize_timesheet(self._states[key]) for key in keys]
+
+    def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        keys = self._index.keys_by_entry_state(date.value.isoformat(), state.value)
+        return [EmployeeId(employee_id) for employee_id, _ in keys]
+
+    def sync(self) -> None:
+        with self._lock:
+            self._fsync()
+
+    def close(self) -> None:
+        self._closed.set()
+        self._flusher.join()
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self._lock:
+            self._fsync()
+            self._segment.close()
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        data = "".join(
+            json.dumps(record, separators=(",", ":")) + "\n" for record in records
+        ).encode("utf-8")
+        self._segment.write(data)
+        self._segment.flush()
+        self._unsynced_writes += 1
+
+        # The flusher thread covers fsync_interval_seconds between batches
+        if self._unsynced_writes >= self._fsync_batch_size:
+            self._fsync()
+
+        if self._segment.tell() >= self._segment_max_bytes:
+            self._rotate()
+
+    def _fsync(self) -> None:
+        if self._unsynced_writes:
+            os.fsync(self._segment.fileno())
+            self._unsynced_writes = 0
+        self._last_sync = time.monotonic()
+
+    def _flush_periodically(self) -> None:
+        interval = max(self._fsync_interval_seconds, 0.001)
+        while not self._closed.wait(interval):
+            with self._lock:
+                if self._closed.is_set():
+                    return
+                if time.monotonic() - self._last_sync >= self._fsync_interval_seconds:
+                    self._fsync()
+
+    def _rotate(self) -> None:
+        self._fsync()
+        self._segment.close()
+        self._segment_seq += 1
+        self._segment = self._open_segment(self._segment_seq)
+
+    def _start_compaction(self) -> None:
+        # Saves replace states rather than mutate them, so a shallow copy
+        # taken right at a segment boundary is a point-in-time snapshot
+        self._rotate()
+        seq = self._segment_seq
+        states = dict(self._states)
+        self._records_since_snapshot = 0
+
+        self._compaction = threading.Thread(
+            target=self._compact, args=(seq, states), name="event-log-compaction", daemon=True
+        )
+        self._compaction.start()
+
+    def _compact(self, seq: int, states: Dict[Tuple[str, str], Dict[str, Any]]) -> None:
+        try:
+            snapshot = {
+                "timesheets": [
+                    {"key": list(key), "state": state} for key, state in states.items()
+                ]
+            }
+            snapshot_path = self._directory / f"{_SNAPSHOT_PREFIX}{seq:08d}.json"
+            tmp_path = snapshot_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, snapshot_path)
+
+            # Only once the snapshot is durable do the segments it covers go
+            for path in self._directory.iterdir():
+                file_seq = _parse_seq(path.name)
+                if file_seq is not None and file_seq < seq:
+                    path.unlink()
+        except Exception:
+            # The older snapshot and segments are still intact; the next
+            # compaction covers this one's records as well
+            logger.exception("Compacting the event log into snapshot %d failed", seq)
+        finally:
+            with self._lock:
+                self._compaction = None
+
+    def _recover(self) -> int:
+        snapshot_seqs = self._list_seqs(_SNAPSHOT_PREFIX)
+        segment_seqs = self._list_seqs(_SEGMENT_PREFIX)
+
+        start_seq = 0
+        if snapshot_seqs:
+            start_seq = snapshot_seqs[-1]
+            snapshot_path = self._directory / f"{_SNAPSHOT_PREFIX}{start_seq:08d}.json"
+            with open(snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            for item in snapshot["timesheets"]:
+                self._states[tuple(item["key"])] = item["state"]
+
+        for seq in segment_seqs:
+            if seq < start_seq:
+                continue
+            segment_path = self._directory / f"{_SEGMENT_PREFIX}{seq:08d}.log"
+            with open(segment_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write at the tail of a segment after a crash
+                        break
+                    _apply_record(self._states, record)
+                    self._records_since_snapshot += 1
+
+        return max([start_seq, *segment_seqs]) + 1
+
+    def _list_seqs(self, prefix: str) -> List[int]:
+        seqs = []
+        for path in self._directory.iterdir():
+            if path.name.startswith(prefix):
+                seq = _parse_seq(path.name)
+                if seq is not None:
+                    seqs.append(seq)
+        return sorted(seqs)
+
+    def _open_segment(self, seq: int):
+        return open(self._directory / f"{_SEGMENT_PREFIX}{seq:08d}.log", "ab")
+
+    def _create_key(self, employee_id: EmployeeId, year_month: YearMonth) -> Tuple[str, str]:
+        year_month_str = f"{year_month.year:04d}-{year_month.month:02d}"
+        return (employee_id, year_month_str)
+
+
+def _parse_seq(name: str) -> Optional[int]:
+    for prefix, suffix in ((_SEGMENT_PREFIX, ".log"), (_SNAPSHOT_PREFIX, ".json")):
+        if name.startswith(prefix) and name.endswith(suffix):
+            digits = name[len(prefix):-len(suffix)]
+            if digits.isdigit():
+                return int(digits)
+    return None
+
+
+def _diff_states(
+    key: Tuple[str, str],
+    old: Optional[Dict[str, Any]],
+    new: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    employee_id, year_month = key
+    records: List[Dict[str, Any]] = []
+
+    def record(op: str, **fields: Any) -> None:
+        records.append(
+            {"e": employee_id, "m": year_month, "ver": new["version"], "op": op, **fields}
+        )
+
+    if old is None or old["timesheet_id"] != new["timesheet_id"]:
+        record("create", id=new["timesheet_id"], s=new["status"])
+        old = {"status": new["status"], "approver_id": None, "entries": {}}
+
+    for entry_date, new_entry in new["entries"].items():
+        old_entry = old["entries"].get(entry_date)
+        if old_entry == new_entry:
+            continue
+        ops = _diff_entry(old_entry or empty_entry_data(), new_entry)
+        if ops is None:
+            record("entry", d=entry_date, v=new_entry)
+        else:
+            for op, at in ops:
+                record(op, d=entry_date, t=at)
+
+    for entry_date in old["entries"].keys() - new["entries"].keys():
+        record("entry", d=entry_date, v=None)
+
+    if old.get("approver_id") != new["approver_id"]:
+        record("assign", a=new["approver_id"])
+    if old["status"] != new["status"]:
+        record(_STATUS_OPS[new["status"]])
+
+    if not records:
+        # Nothing changed, but the version still moves on like any save
+        record("touch")
+
+    return records
+
+
+def _diff_entry(
+    old: Dict[str, Any],
+    new: Dict[str, Any]
+) -> Optional[List[Tuple[str, str]]]:
+    """Express the change as punch operations, or None if it is not one"""
+    ops: List[Tuple[str, str]] = []
+
+    if old["clock_in_at"] is None and new["clock_in_at"] is not None:
+        ops.append(("clock_in", new["clock_in_at"]))
+
+    old_breaks = old["breaks"]
+    new_breaks = new["breaks"]
+    if len(new_breaks) < len(old_breaks):
+        return None
+    for i, (start, end) in enumerate(new_breaks):
+        if i < len(old_breaks):
+            old_start, old_end = old_breaks[i]
+            if old_start != start or (old_end is not None and old_end != end):
+                return None
+        else:
+            ops.append(("start_break", start))
+            old_end = None
+        if old_end is None and end is not None:
+            ops.append(("end_break", end))
+
+    if old["clock_out_at"] is None and new["clock_out_at"] is not None:
+        ops.append(("clock_out", new["clock_out_at"]))
+
+    replayed = copy.deepcopy(old)
+    for op, at in ops:
+        _apply_entry_op(replayed, op, at)
+    if replayed != new:
+        return None
+    return ops
+
+
+def _apply_record(states: Dict[Tuple[str, str], Dict[str, Any]], record: Dict[str, Any]) -> None:
+    key = (record["e"], record["m"])
+    op = record["op"]
+
+    if op == "create":
+        states[key] = {
+            "timesheet_id": record["id"],
+            "employee_id": record["e"],
+            "year_month": record["m"],
+            "status": record["s"],
+            "version": record["ver"],
+            "approver_id": None,
+            "entries": {}
+        }
+        return
+
+    state = states[key]
+    state["version"] = record["ver"]
+    if op == "touch":
+        return
+    if op in _OP_STATUSES:
+        state["status"] = _OP_STATUSES[op]
+    elif op == "assign":
+        state["approver_id"] = record["a"]
+    elif op == "entry":
+        state.pop("totals", None)
+        if record["v"] is None:
+            state["entries"].pop(record["d"], None)
+        else:
+            state["entries"][record["d"]] = record["v"]
+    else:
+        state.pop("totals", None)
+        entry = state["entries"].setdefault(record["d"], empty_entry_data())
+        _apply_entry_op(entry, op, record["t"])
+
+
+def _apply_entry_op(entry: Dict[str, Any], op: str, at: str) -> None:
+    if op == "clock_in":
+        entry["clock_in_at"] = at
+        entry["state"] = AttendanceState.CLOCKED_IN.value
+    elif op == "start_break":
+        entry["breaks"].append([at, None])
+        entry["state"] = AttendanceState.ON_BREAK.value
+    elif op == "end_break":
+        entry["breaks"][-1][1] = at
+        entry["state"] = AttendanceState.CLOCKED_IN.value
+    elif op == "clock_out":
+        entry["clock_out_at"] = at
+        entry["state"] = AttendanceState.CLOCKED_OUT.value
+    else:
+        raise ValueError(f"Unknown timesheet log operation: {op}")
@@ -0,0 +1,55 @@
+import threading
+from typing import List, Optional
+from ...domain.repositories.leave_request_repository import LeaveRequestRepository
+from ...domain.models import EmployeeId, RequestId, RequestStatus, Date
+from ...domain.models.leave_request import LeaveRequest
+from .request_index import InMemoryRequestStore
+from .date_range_index import DateRangeIndex
+from ..outbox.in_memory_outbox import InMemoryOutbox
+from ..outbox.event_messages import leave_request_event_messages
+
+
+class InMemoryLeaveRequestRepository(LeaveRequestRepository):
+    def __init__(self, outbox: Optional[InMemoryOutbox] = None):
+        self._outbox = outbox
+        self._store: InMemoryRequestStore[LeaveRequest] = InMemoryRequestStore()
+        self._approved_leave = DateRangeIndex()
+        # Held across the outbox append and both index updates, so a request's
+        # messages and its stored state change together
+        self._lock = threading.Lock()
+
+    def find_by_id(self, request_id: RequestId) -> Optional[LeaveRequest]:
+        return self._store.find_by_id(request_id)
+
+    def save(self, request: LeaveRequest) -> None:
+        with self._lock:
+            if self._outbox:
+                self._outbox.append(leave_request_event_messages(request))
+            request.clear_events()
+            self._store.save(request)
+            if request.status == RequestStatus.APPROVED:
+                self._approved_leave.add(
+                    request.employee_id,
+                    request.request_id,
+                    request.date_range.start_date.value,
+                    request.date_range.end_date.value
+                )
+            else:
+                self._approved_leave.remove(request.employee_id, request.request_id)
+
+    def list_by_employee(
+        self,
+        employee_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[LeaveRequest]:
+        return self._store.list_by_employee(employee_id, status)
+
+    def list_for_approver(
+        self,
+        approver_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[LeaveRequest]:
+        return self._store.list_for_approver(approver_id, status)
+
+    def has_approved_leave_on(self, employee_id: EmployeeId, date: Date) -> bool:
+        return self._approved_leave.contains(employee_id, date.value)
@@ -0,0 +1,30 @@
+from typing import List, Optional
+from ...domain.repositories.overtime_request_repository import OvertimeRequestRepository
+from ...domain.models import EmployeeId, RequestId, RequestStatus
+from ...domain.models.overtime_request import OvertimeRequest
+from .request_index import InMemoryRequestStore
+
+
+class InMemoryOvertimeRequestRepository(OvertimeRequestRepository):
+    def __init__(self):
+        self._store: InMemoryRequestStore[OvertimeRequest] = InMemoryRequestStore()
+
+    def find_by_id(self, request_id: RequestId) -> Optional[OvertimeRequest]:
+        return self._store.find_by_id(request_id)
+
+    def save(self, request: OvertimeRequest) -> None:
+        self._store.save(request)
+
+    def list_by_employee(
+        self,
+        employee_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[OvertimeRequest]:
+        return self._store.list_by_employee(employee_id, status)
+
+    def list_for_approver(
+        self,
+        approver_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[OvertimeRequest]:
+        return self._store.list_for_approver(approver_id, status)
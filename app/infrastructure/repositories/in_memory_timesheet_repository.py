@@ -1,20 +1,81 @@
-from typing import Optional, Dict, Tuple
+import threading
+from typing import Iterator, List, Optional, Dict, Tuple
 from ...domain.repositories.timesheet_repository import TimesheetRepository
-from ...domain.models import Timesheet, EmployeeId, YearMonth
+from ...domain.models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+from ...domain.exceptions import ConcurrencyConflictError
+from .timesheet_index import TimesheetIndex, IndexedFields
+from .timesheet_serializer import copy_timesheet
+from ..outbox.in_memory_outbox import InMemoryOutbox
+from ..outbox.event_messages import timesheet_event_messages
 
 
 class InMemoryTimesheetRepository(TimesheetRepository):
-    def __init__(self):
+    def __init__(self, outbox: Optional[InMemoryOutbox] = None):
+        self._outbox = outbox
         self._storage: Dict[Tuple[str, str], Timesheet] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._index = TimesheetIndex()
 
     def find_by(self, employee_id: EmployeeId, year_month: YearMonth) -> Optional[Timesheet]:
         key = self._create_key(employee_id, year_month)
-        return self._storage.get(key)
+        timesheet = self._storage.get(key)
+        return copy_timesheet(timesheet) if timesheet else None
 
     def save(self, timesheet: Timesheet) -> None:
         key = self._create_key(timesheet.employee_id, timesheet.year_month)
-        self._storage[key] = timesheet
+        with self._locks.setdefault(key, threading.Lock()):
+            stored = self._storage.get(key)
+            stored_version = stored.version if stored else 0
+            if timesheet.version != stored_version:
+                raise ConcurrencyConflictError(
+                    f"Timesheet {key} was modified concurrently "
+                    f"(expected version {timesheet.version}, found {stored_version})"
+                )
+            if self._outbox:
+                self._outbox.append(timesheet_event_messages(timesheet))
+            timesheet.version += 1
+            timesheet.clear_events()
+            self._storage[key] = copy_timesheet(timesheet)
+            self._index.update(key, IndexedFields.of_timesheet(timesheet))
+
+    def find_all_by_year_month(self, year_month: YearMonth) -> Iterator[Timesheet]:
+        # save() replaces stored objects rather than mutating them, so they
+        # are safe to hand out without copying
+        for key in self._index.keys_by_year_month(str(year_month)):
+            yield self._storage[key]
+
+    def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        keys = self._index.keys_by_status(str(year_month), status.value)
+        return [copy_timesheet(self._storage[key]) for key in keys]
+
+    def find_by_approver(
+        self,
+        year_month: YearMonth,
+        approver_id: EmployeeId,
+        status: TimesheetStatus,
+        after: Optional[EmployeeId] = None,
+        limit: Optional[int] = None
+    ) -> List[Timesheet]:
+        keys = self._index.keys_by_approver(
+            str(year_month), approver_id, status.value, after, limit
+        )
+        return [copy_timesheet(self._storage[key]) for key in keys]
+
+    def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        keys = self._index.keys_by_entry_state(date.value.isoformat(), state.value)
+        return [EmployeeId(employee_id) for employee_id, _ in keys]
 
     def _create_key(self, employee_id: EmployeeId, year_month: YearMonth) -> Tuple[str, str]:
         year_month_str = f"{year_month.year:04d}-{year_month.month:02d}"
-        return (employee_id, year_month_str)
\ No newline at end of file
+        return (employee_id, year_month_str)
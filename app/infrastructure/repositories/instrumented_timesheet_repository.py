@@ -0,0 +1,77 @@
+from typing import Iterator, List, Optional
+from ...domain.repositories.timesheet_repository import TimesheetRepository, CommitHandle
+from ...domain.models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+from ...domain.exceptions import ConcurrencyConflictError
+from ..instrumentation import timed_stage
+
+
+class InstrumentedTimesheetRepository(TimesheetRepository):
+    """Time each call into another repository as a ``repository.<method>`` stage.
+
+    Only calls made while an instrumented request is being handled are
+    recorded. find_all_by_year_month streams its results, so it is passed
+    through untimed.
+    """
+
+    def __init__(self, repository: TimesheetRepository):
+        self._repository = repository
+
+    @property
+    def repository(self) -> TimesheetRepository:
+        return self._repository
+
+    def find_by(self, employee_id: EmployeeId, year_month: YearMonth) -> Optional[Timesheet]:
+        with timed_stage("repository.find_by"):
+            return self._repository.find_by(employee_id, year_month)
+
+    def save(self, timesheet: Timesheet) -> None:
+        with timed_stage("repository.save"):
+            self._repository.save(timesheet)
+
+    def save_deferred(self, timesheet: Timesheet) -> CommitHandle:
+        with timed_stage("repository.save"):
+            return self._repository.save_deferred(timesheet)
+
+    def save_all(self, timesheets: List[Timesheet]) -> List[Optional[ConcurrencyConflictError]]:
+        with timed_stage("repository.save_all"):
+            return self._repository.save_all(timesheets)
+
+    def find_all_by_year_month(self, year_month: YearMonth) -> Iterator[Timesheet]:
+        return self._repository.find_all_by_year_month(year_month)
+
+    def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        with timed_stage("repository.find_by_status"):
+            return self._repository.find_by_status(year_month, status)
+
+    def find_by_approver(
+        self,
+        year_month: YearMonth,
+        approver_id: EmployeeId,
+        status: TimesheetStatus,
+        after: Optional[EmployeeId] = None,
+        limit: Optional[int] = None
+    ) -> List[Timesheet]:
+        with timed_stage("repository.find_by_approver"):
+            return self._repository.find_by_approver(
+                year_month, approver_id, status, after, limit
+            )
+
+    def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        with timed_stage("repository.find_employee_ids_by_attendance_state"):
+            return self._repository.find_employee_ids_by_attendance_state(date, state)
+
+    def close(self) -> None:
+        close = getattr(self._repository, "close", None)
+        if close:
+            close()
@@ -0,0 +1,111 @@
+import copy
+import threading
+from typing import Dict, Generic, List, Optional, Protocol, TypeVar
+from ...domain.models import EmployeeId, RequestId, RequestStatus
+
+
+class _Request(Protocol):
+    request_id: RequestId
+    employee_id: EmployeeId
+    approver_id: Optional[EmployeeId]
+    status: RequestStatus
+
+
+RequestT = TypeVar("RequestT", bound=_Request)
+
+
+class StatusPartitionedIndex:
+    """Request IDs grouped by owner, then partitioned by status.
+
+    Each partition maps request ID to filing sequence, so listing one owner's
+    requests in one status costs time proportional to the result, and the
+    result can be put back in filing order.
+    """
+
+    def __init__(self):
+        self._owners: Dict[str, Dict[RequestStatus, Dict[RequestId, int]]] = {}
+
+    def add(self, owner: str, status: RequestStatus, request_id: RequestId, seq: int) -> None:
+        partitions = self._owners.setdefault(owner, {})
+        partitions.setdefault(status, {})[request_id] = seq
+
+    def remove(self, owner: str, status: RequestStatus, request_id: RequestId) -> None:
+        partitions = self._owners.get(owner)
+        if not partitions:
+            return
+        partition = partitions.get(status)
+        if partition is None:
+            return
+        partition.pop(request_id, None)
+        if not partition:
+            del partitions[status]
+        if not partitions:
+            del self._owners[owner]
+
+    def ids(self, owner: str, status: Optional[RequestStatus] = None) -> List[RequestId]:
+        partitions = self._owners.get(owner, {})
+        if status is not None:
+            selected = [partitions.get(status, {})]
+        else:
+            selected = list(partitions.values())
+        items = [item for partition in selected for item in partition.items()]
+        items.sort(key=lambda item: item[1])
+        return [request_id for request_id, _ in items]
+
+
+class InMemoryRequestStore(Generic[RequestT]):
+    """Storage shared by the in-memory overtime and leave request repositories.
+
+    Requests are indexed by employee and by assigned approver, each
+    partitioned by status; save() moves a request between partitions when
+    approve() or reject() changed its status. Lists come back in filing
+    order, like the SQLite repositories' rowid order.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Dict[RequestId, RequestT] = {}
+        self._filing_seqs: Dict[RequestId, int] = {}
+        self._by_employee = StatusPartitionedIndex()
+        self._by_approver = StatusPartitionedIndex()
+
+    def find_by_id(self, request_id: RequestId) -> Optional[RequestT]:
+        request = self._requests.get(request_id)
+        return copy.deepcopy(request) if request else None
+
+    def save(self, request: RequestT) -> None:
+        with self._lock:
+            stored = self._requests.get(request.request_id)
+            if stored is not None:
+                self._by_employee.remove(stored.employee_id, stored.status, stored.request_id)
+                if stored.approver_id:
+                    self._by_approver.remove(stored.approver_id, stored.status, stored.request_id)
+
+            seq = self._filing_seqs.setdefault(request.request_id, len(self._filing_seqs))
+            self._requests[request.request_id] = copy.deepcopy(request)
+            self._by_employee.add(request.employee_id, request.status, request.request_id, seq)
+            if request.approver_id:
+                self._by_approver.add(
+                    request.approver_id, request.status, request.request_id, seq
+                )
+
+    def list_by_employee(
+        self,
+        employee_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[RequestT]:
+        with self._lock:
+            request_ids = self._by_employee.ids(employee_id, status)
+        return self._load(request_ids)
+
+    def list_for_approver(
+        self,
+        approver_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[RequestT]:
+        with self._lock:
+            request_ids = self._by_approver.ids(approver_id, status)
+        return self._load(request_ids)
+
+    def _load(self, request_ids: List[RequestId]) -> List[RequestT]:
+        return [copy.deepcopy(self._requests[request_id]) for request_id in request_ids]
@@ -0,0 +1,208 @@
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+from ...domain.exceptions import ConcurrencyConflictError
+from .consistent_hash_ring import ConsistentHashRing
+from .timesheet_serializer import copy_timesheet
+
+
+T = TypeVar("T")
+
+
+class ShardedTimesheetRepository(TimesheetRepository):
+    """Spread timesheets over several repositories by employee.
+
+    Each employee's timesheets live on the shard the consistent hash ring
+    picks for their EmployeeId, so find_by/save touch one shard and a save
+    never spans shards. Month-wide queries fan out to every shard in
+    parallel and merge the results back into employee order.
+
+    A shard only answers for the employees the ring assigns to it. After
+    rebalance_timesheets() has copied moved timesheets to their new shard,
+    the old copies are left behind but no longer show up in any query.
+    """
+
+    def __init__(self, shards: Dict[str, TimesheetRepository], virtual_nodes: int = 128):
+        self._shards = dict(shards)
+        self._ring = ConsistentHashRing(self._shards, virtual_nodes=virtual_nodes)
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._shards),
+            thread_name_prefix="timesheet-shard"
+        )
+
+    @property
+    def shards(self) -> Dict[str, TimesheetRepository]:
+        return dict(self._shards)
+
+    def shard_for(self, employee_id: EmployeeId) -> str:
+        return self._ring.shard_for(employee_id)
+
+    def find_by(self, employee_id: EmployeeId, year_month: YearMonth) -> Optional[Timesheet]:
+        return self._shards[self.shard_for(employee_id)].find_by(employee_id, year_month)
+
+    def save(self, timesheet: Timesheet) -> None:
+        self._shards[self.shard_for(timesheet.employee_id)].save(timesheet)
+
+    def save_all(self, timesheets: List[Timesheet]) -> List[Optional[ConcurrencyConflictError]]:
+        positions: Dict[str, List[int]] = {}
+        for position, timesheet in enumerate(timesheets):
+            positions.setdefault(self.shard_for(timesheet.employee_id), []).append(position)
+
+        def save_shard(name: str) -> List[Optional[ConcurrencyConflictError]]:
+            return self._shards[name].save_all([timesheets[p] for p in positions[name]])
+
+        results: List[Optional[ConcurrencyConflictError]] = [None] * len(timesheets)
+        for name, shard_results in zip(positions, self._executor.map(save_shard, positions)):
+            for position, error in zip(positions[name], shard_results):
+                results[position] = error
+        return results
+
+    def find_all_by_year_month(self, year_month: YearMonth) -> Iterator[Timesheet]:
+        # Every shard yields in employee order, so a lazy merge keeps the
+        # month out of memory just like a single backend
+        return heapq.merge(
+            *(
+                self._owned(name, shard.find_all_by_year_month(year_month), _timesheet_owner)
+                for name, shard in self._shards.items()
+            ),
+            key=_timesheet_owner
+        )
+
+    def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        return self._fan_out(
+            lambda shard: shard.find_by_status(year_month, status),
+            _timesheet_owner
+        )
+
+    def find_by_approver(
+        self,
+        year_month: YearMonth,
+        approver_id: EmployeeId,
+        status: TimesheetStatus,
+        after: Optional[EmployeeId] = None,
+        limit: Optional[int] = None
+    ) -> List[Timesheet]:
+        if limit is None:
+            return self._fan_out(
+                lambda shard: shard.find_by_approver(year_month, approver_id, status, after),
+                _timesheet_owner
+            )
+
+        names = list(self._shards)
+        while True:
+            pages = list(self._executor.map(
+                lambda name: self._shards[name].find_by_approver(
+                    year_month, approver_id, status, after, limit
+                ),
+                names
+            ))
+            # A shard with a full page may have more timesheets after its last
+            # one, so the merged page must stop there or the next page would
+            # skip them
+            full_page_ends = [
+                page[-1].employee_id for page in pages if page and len(page) == limit
+            ]
+            end = min(full_page_ends, default=None)
+            merged = heapq.merge(
+                *(self._owned(name, page, _timesheet_owner) for name, page in zip(names, pages)),
+                key=_timesheet_owner
+            )
+            timesheets = list(itertools.islice(
+                (timesheet for timesheet in merged if end is None or timesheet.employee_id <= end),
+                limit
+            ))
+            # Pages of only left-behind copies are skipped, not mistaken for the end
+            if timesheets or end is None:
+                return timesheets
+            after = end
+
+    def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        return self._fan_out(
+            lambda shard: shard.find_employee_ids_by_attendance_state(date, state),
+            EmployeeId
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        for shard in self._shards.values():
+            close = getattr(shard, "close", None)
+            if close:
+                close()
+
+    def _fan_out(
+        self,
+        query: Callable[[TimesheetRepository], List[T]],
+        owner: Callable[[T], EmployeeId]
+    ) -> List[T]:
+        names = list(self._shards)
+        shard_results = self._executor.map(lambda name: query(self._shards[name]), names)
+        return list(heapq.merge(
+            *(
+                self._owned(name, results, owner)
+                for name, results in zip(names, shard_results)
+            ),
+            key=owner
+        ))
+
+    def _owned(self, name: str, items: Iterable[T], owner: Callable[[T], EmployeeId]) -> Iterator[T]:
+        return (item for item in items if self.shard_for(owner(item)) == name)
+
+
+@dataclass
+class RebalanceStats:
+    examined: int = 0
+    moved: int = 0
+
+
+def rebalance_timesheets(
+    source: ShardedTimesheetRepository,
+    target: ShardedTimesheetRepository,
+    year_months: Iterable[YearMonth]
+) -> RebalanceStats:
+    """Copy every timesheet whose shard differs between source and target.
+
+    ``target`` is the new layout, normally built from the same repository
+    objects as ``source`` plus or minus some shards. A copy replaces any
+    older copy already on its new shard, and its version continues from
+    that copy's, so run this while the API is stopped and then switch the
+    configuration over to the new layout.
+    """
+    stats = RebalanceStats()
+    target_shards = target.shards
+    for year_month in year_months:
+        for name, shard in source.shards.items():
+            for timesheet in shard.find_all_by_year_month(year_month):
+                if source.shard_for(timesheet.employee_id) != name:
+                    continue
+                stats.examined += 1
+
+                target_name = target.shard_for(timesheet.employee_id)
+                target_shard = target_shards[target_name]
+                if target_shard is shard:
+                    continue
+
+                moved = copy_timesheet(timesheet)
+                existing = target_shard.find_by(timesheet.employee_id, year_month)
+                moved.version = existing.version if existing else 0
+                target_shard.save(moved)
+                stats.moved += 1
+    return stats
+
+
+def _timesheet_owner(timesheet: Timesheet) -> EmployeeId:
+    return timesheet.employee_id
@@ -0,0 +1,85 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
+
+
+class SQLiteConnectionPool:
+    """One connection per thread, opened lazily, all sharing a WAL database.
+
+    Statements are cached per connection by sqlite3 (``cached_statements``),
+    so repositories should pass constant SQL strings to keep them prepared.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        busy_timeout_ms: int = 5000,
+        cached_statements: int = 256
+    ):
+        if path == ":memory:":
+            raise ValueError("SQLiteConnectionPool requires a file-backed database")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = self._connect()
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self.connection()
+        # Take the write lock up front so concurrent writers wait on
+        # busy_timeout instead of failing on a read-to-write upgrade
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+            connection.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT (e.g. SQLITE_BUSY) leaves the transaction open
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Read-only transaction, so several SELECTs see the same WAL snapshot"""
+        connection = self.connection()
+        connection.execute("BEGIN DEFERRED")
+        try:
+            yield connection
+        finally:
+            connection.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self._cached_statements
+        )
+        connection.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA foreign_keys = ON")
+        with self._lock:
+            self._connections.append(connection)
+        return connection
@@ -0,0 +1,163 @@
+from datetime import date
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from ...domain.repositories.leave_request_repository import LeaveRequestRepository
+from ...domain.models import EmployeeId, RequestId, RequestStatus, Date, DateRange, LeaveType
+from ...domain.models.leave_request import LeaveRequest
+from .sqlite_connection_pool import SQLiteConnectionPool
+from ..outbox.event_messages import leave_request_event_messages
+
+if TYPE_CHECKING:
+    # The outbox package builds on this one's connection pool
+    from ..outbox.sqlite_outbox import SQLiteOutbox
+
+
+# Same layout as overtime_requests: filing order is rowid order and the
+# status indexes end in rowid
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leave_requests (
+    request_id TEXT NOT NULL UNIQUE,
+    employee_id TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    leave_type TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    status TEXT NOT NULL,
+    reviewer_id TEXT,
+    review_comment TEXT,
+    approver_id TEXT
+);
+
+CREATE INDEX IF NOT EXISTS leave_requests_by_employee
+    ON leave_requests (employee_id, status);
+CREATE INDEX IF NOT EXISTS leave_requests_by_approver
+    ON leave_requests (approver_id, status);
+CREATE INDEX IF NOT EXISTS leave_requests_by_dates
+    ON leave_requests (employee_id, status, start_date, end_date);
+"""
+
+_COLUMNS = (
+    "request_id, employee_id, start_date, end_date, leave_type, reason, status, "
+    "reviewer_id, review_comment, approver_id"
+)
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM leave_requests WHERE request_id = ?"
+_SELECT_BY_EMPLOYEE = (
+    f"SELECT {_COLUMNS} FROM leave_requests WHERE employee_id = ? ORDER BY rowid"
+)
+_SELECT_BY_EMPLOYEE_AND_STATUS = (
+    f"SELECT {_COLUMNS} FROM leave_requests "
+    "WHERE employee_id = ? AND status = ? ORDER BY rowid"
+)
+_SELECT_FOR_APPROVER = (
+    f"SELECT {_COLUMNS} FROM leave_requests WHERE approver_id = ? ORDER BY rowid"
+)
+_SELECT_FOR_APPROVER_AND_STATUS = (
+    f"SELECT {_COLUMNS} FROM leave_requests "
+    "WHERE approver_id = ? AND status = ? ORDER BY rowid"
+)
+_SELECT_LEAVE_ON = (
+    "SELECT 1 FROM leave_requests "
+    "WHERE employee_id = ? AND status = 'approved' AND start_date <= ? AND end_date >= ? "
+    "LIMIT 1"
+)
+_UPSERT = (
+    f"INSERT INTO leave_requests ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (request_id) DO UPDATE SET "
+    "employee_id = excluded.employee_id, start_date = excluded.start_date, "
+    "end_date = excluded.end_date, leave_type = excluded.leave_type, "
+    "reason = excluded.reason, status = excluded.status, "
+    "reviewer_id = excluded.reviewer_id, review_comment = excluded.review_comment, "
+    "approver_id = excluded.approver_id"
+)
+
+
+class SQLiteLeaveRequestRepository(LeaveRequestRepository):
+    def __init__(
+        self,
+        path: str,
+        pool: Optional[SQLiteConnectionPool] = None,
+        outbox: Optional["SQLiteOutbox"] = None
+    ):
+        self._pool = pool or SQLiteConnectionPool(path)
+        self._outbox = outbox
+        self._pool.connection().executescript(_SCHEMA)
+
+    def find_by_id(self, request_id: RequestId) -> Optional[LeaveRequest]:
+        row = self._pool.connection().execute(_SELECT_BY_ID, (request_id,)).fetchone()
+        return _from_row(row) if row else None
+
+    def save(self, request: LeaveRequest) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute(_UPSERT, _to_row(request))
+            if self._outbox:
+                self._outbox.append(connection, leave_request_event_messages(request))
+        request.clear_events()
+
+    def list_by_employee(
+        self,
+        employee_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[LeaveRequest]:
+        if status is None:
+            rows = self._pool.connection().execute(_SELECT_BY_EMPLOYEE, (employee_id,))
+        else:
+            rows = self._pool.connection().execute(
+                _SELECT_BY_EMPLOYEE_AND_STATUS, (employee_id, status.value)
+            )
+        return [_from_row(row) for row in rows]
+
+    def list_for_approver(
+        self,
+        approver_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[LeaveRequest]:
+        if status is None:
+            rows = self._pool.connection().execute(_SELECT_FOR_APPROVER, (approver_id,))
+        else:
+            rows = self._pool.connection().execute(
+                _SELECT_FOR_APPROVER_AND_STATUS, (approver_id, status.value)
+            )
+        return [_from_row(row) for row in rows]
+
+    def has_approved_leave_on(self, employee_id: EmployeeId, date: Date) -> bool:
+        day = date.value.isoformat()
+        row = self._pool.connection().execute(
+            _SELECT_LEAVE_ON, (employee_id, day, day)
+        ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+def _to_row(request: LeaveRequest) -> Tuple[Any, ...]:
+    return (
+        request.request_id,
+        request.employee_id,
+        request.date_range.start_date.value.isoformat(),
+        request.date_range.end_date.value.isoformat(),
+        request.leave_type.value,
+        request.reason,
+        request.status.value,
+        request.reviewer_id,
+        request.review_comment,
+        request.approver_id
+    )
+
+
+def _from_row(row: Tuple[Any, ...]) -> LeaveRequest:
+    (request_id, employee_id, start_date, end_date, leave_type, reason, status,
+     reviewer_id, review_comment, approver_id) = row
+    return LeaveRequest(
+        request_id=RequestId(request_id),
+        employee_id=EmployeeId(employee_id),
+        date_range=DateRange(
+            start_date=Date(date.fromisoformat(start_date)),
+            end_date=Date(date.fromisoformat(end_date))
+        ),
+        leave_type=LeaveType(leave_type),
+        reason=reason,
+        status=RequestStatus(status),
+        reviewer_id=EmployeeId(reviewer_id) if reviewer_id else None,
+        review_comment=review_comment,
+        approver_id=EmployeeId(approver_id) if approver_id else None
+    )
@@ -0,0 +1,130 @@
+from datetime import date
+from typing import Any, List, Optional, Tuple
+from ...domain.repositories.overtime_request_repository import OvertimeRequestRepository
+from ...domain.models import EmployeeId, RequestId, RequestStatus, Date, Minutes
+from ...domain.models.overtime_request import OvertimeRequest
+from .sqlite_connection_pool import SQLiteConnectionPool
+
+
+# Rows keep their rowid across upserts, so ORDER BY rowid is filing order.
+# The status indexes end in rowid, which lets a pending queue be read
+# straight off the index without touching other partitions.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS overtime_requests (
+    request_id TEXT NOT NULL UNIQUE,
+    employee_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    minutes INTEGER NOT NULL,
+    reason TEXT NOT NULL,
+    status TEXT NOT NULL,
+    reviewer_id TEXT,
+    review_comment TEXT,
+    approver_id TEXT
+);
+
+CREATE INDEX IF NOT EXISTS overtime_requests_by_employee
+    ON overtime_requests (employee_id, status);
+CREATE INDEX IF NOT EXISTS overtime_requests_by_approver
+    ON overtime_requests (approver_id, status);
+"""
+
+_COLUMNS = (
+    "request_id, employee_id, date, minutes, reason, status, "
+    "reviewer_id, review_comment, approver_id"
+)
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM overtime_requests WHERE request_id = ?"
+_SELECT_BY_EMPLOYEE = (
+    f"SELECT {_COLUMNS} FROM overtime_requests WHERE employee_id = ? ORDER BY rowid"
+)
+_SELECT_BY_EMPLOYEE_AND_STATUS = (
+    f"SELECT {_COLUMNS} FROM overtime_requests "
+    "WHERE employee_id = ? AND status = ? ORDER BY rowid"
+)
+_SELECT_FOR_APPROVER = (
+    f"SELECT {_COLUMNS} FROM overtime_requests WHERE approver_id = ? ORDER BY rowid"
+)
+_SELECT_FOR_APPROVER_AND_STATUS = (
+    f"SELECT {_COLUMNS} FROM overtime_requests "
+    "WHERE approver_id = ? AND status = ? ORDER BY rowid"
+)
+_UPSERT = (
+    f"INSERT INTO overtime_requests ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (request_id) DO UPDATE SET "
+    "employee_id = excluded.employee_id, date = excluded.date, "
+    "minutes = excluded.minutes, reason = excluded.reason, status = excluded.status, "
+    "reviewer_id = excluded.reviewer_id, review_comment = excluded.review_comment, "
+    "approver_id = excluded.approver_id"
+)
+
+
+class SQLiteOvertimeRequestRepository(OvertimeRequestRepository):
+    def __init__(self, path: str, pool: Optional[SQLiteConnectionPool] = None):
+        self._pool = pool or SQLiteConnectionPool(path)
+        self._pool.connection().executescript(_SCHEMA)
+
+    def find_by_id(self, request_id: RequestId) -> Optional[OvertimeRequest]:
+        row = self._pool.connection().execute(_SELECT_BY_ID, (request_id,)).fetchone()
+        return _from_row(row) if row else None
+
+    def save(self, request: OvertimeRequest) -> None:
+        with self._pool.transaction() as connection:
+            connection.execute(_UPSERT, _to_row(request))
+
+    def list_by_employee(
+        self,
+        employee_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[OvertimeRequest]:
+        if status is None:
+            rows = self._pool.connection().execute(_SELECT_BY_EMPLOYEE, (employee_id,))
+        else:
+            rows = self._pool.connection().execute(
+                _SELECT_BY_EMPLOYEE_AND_STATUS, (employee_id, status.value)
+            )
+        return [_from_row(row) for row in rows]
+
+    def list_for_approver(
+        self,
+        approver_id: EmployeeId,
+        status: Optional[RequestStatus] = None
+    ) -> List[OvertimeRequest]:
+        if status is None:
+            rows = self._pool.connection().execute(_SELECT_FOR_APPROVER, (approver_id,))
+        else:
+            rows = self._pool.connection().execute(
+                _SELECT_FOR_APPROVER_AND_STATUS, (approver_id, status.value)
+            )
+        return [_from_row(row) for row in rows]
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+def _to_row(request: OvertimeRequest) -> Tuple[Any, ...]:
+    return (
+        request.request_id,
+        request.employee_id,
+        request.date.value.isoformat(),
+        request.minutes.value,
+        request.reason,
+        request.status.value,
+        request.reviewer_id,
+        request.review_comment,
+        request.approver_id
+    )
+
+
+def _from_row(row: Tuple[Any, ...]) -> OvertimeRequest:
+    (request_id, employee_id, request_date, minutes, reason, status,
+     reviewer_id, review_comment, approver_id) = row
+    return OvertimeRequest(
+        request_id=RequestId(request_id),
+        employee_id=EmployeeId(employee_id),
+        date=Date(date.fromisoformat(request_date)),
+        minutes=Minutes(minutes),
+        reason=reason,
+        status=RequestStatus(status),
+        reviewer_id=EmployeeId(reviewer_id) if reviewer_id else None,
+        review_comment=review_comment,
+        approver_id=EmployeeId(approver_id) if approver_id else None
+    )
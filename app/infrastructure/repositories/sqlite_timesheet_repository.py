@@ -0,0 +1,528 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import sqlite3
+import threading
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+from ...domain.exceptions import ConcurrencyConflictError
+from .sqlite_connection_pool import SQLiteConnectionPool
+from .timesheet_serializer import serialize_timesheet, deserialize_timesheet
+from ..outbox.outbox import OutboxMessage
+from ..outbox.event_messages import timesheet_event_messages
+
+if TYPE_CHECKING:
+    # The outbox package builds on this one's connection pool
+    from ..outbox.sqlite_outbox import SQLiteOutbox
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS timesheets (
+    employee_id TEXT NOT NULL,
+    year_month TEXT NOT NULL,
+    timesheet_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    approver_id TEXT,
+    worked_minutes INTEGER,
+    break_minutes INTEGER,
+    overtime_minutes INTEGER,
+    days_present INTEGER,
+    PRIMARY KEY (employee_id, year_month)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS attendance_entries (
+    employee_id TEXT NOT NULL,
+    year_month TEXT NOT NULL,
+    date TEXT NOT NULL,
+    state TEXT NOT NULL,
+    clock_in_at TEXT,
+    clock_out_at TEXT,
+    notes TEXT NOT NULL,
+    PRIMARY KEY (employee_id, year_month, date),
+    FOREIGN KEY (employee_id, year_month)
+        REFERENCES timesheets (employee_id, year_month) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS break_intervals (
+    employee_id TEXT NOT NULL,
+    year_month TEXT NOT NULL,
+    date TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    start_at TEXT NOT NULL,
+    end_at TEXT,
+    PRIMARY KEY (employee_id, year_month, date, seq),
+    FOREIGN KEY (employee_id, year_month, date)
+        REFERENCES attendance_entries (employee_id, year_month, date) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS timesheets_by_year_month
+    ON timesheets (year_month, employee_id);
+CREATE INDEX IF NOT EXISTS attendance_entries_by_year_month
+    ON attendance_entries (year_month, employee_id, date);
+CREATE INDEX IF NOT EXISTS break_intervals_by_year_month
+    ON break_intervals (year_month, employee_id, date, seq);
+CREATE INDEX IF NOT EXISTS timesheets_by_status
+    ON timesheets (year_month, status, employee_id);
+CREATE INDEX IF NOT EXISTS attendance_entries_by_state
+    ON attendance_entries (date, state, employee_id);
+"""
+
+# Columns added to timesheets since it was first created; older databases
+# get them from _add_missing_columns(). Rows written before the month totals
+# were stored leave them NULL, and their totals are computed on load
+_ADDED_COLUMNS = (
+    ("approver_id", "TEXT"),
+    ("worked_minutes", "INTEGER"),
+    ("break_minutes", "INTEGER"),
+    ("overtime_minutes", "INTEGER"),
+    ("days_present", "INTEGER")
+)
+
+# Databases created before timesheets had approvers lack the column, so its
+# index is created after _add_missing_columns()
+_APPROVER_INDEX = """
+CREATE INDEX IF NOT EXISTS timesheets_by_approver
+    ON timesheets (year_month, approver_id, status, employee_id);
+"""
+
+_SELECT_TIMESHEET = (
+    "SELECT timesheet_id, status, version, approver_id, "
+    "worked_minutes, break_minutes, overtime_minutes, days_present FROM timesheets "
+    "WHERE employee_id = ? AND year_month = ?"
+)
+_SELECT_ENTRIES = (
+    "SELECT date, state, clock_in_at, clock_out_at, notes FROM attendance_entries "
+    "WHERE employee_id = ? AND year_month = ? ORDER BY date"
+)
+_SELECT_BREAKS = (
+    "SELECT date, start_at, end_at FROM break_intervals "
+    "WHERE employee_id = ? AND year_month = ? ORDER BY date, seq"
+)
+
+
+def _filtered_month_queries(condition: str) -> Tuple[str, str, str]:
+    """Month queries restricted to the timesheets matching ``condition``"""
+    # CROSS JOIN keeps the matching timesheets as the outer loop, so SQLite
+    # looks up only their rows instead of scanning the month. The unary plus
+    # stops a range on t.employee_id from replacing that lookup by a range
+    return (
+        "SELECT employee_id, timesheet_id, status, version, approver_id, "
+        "worked_minutes, break_minutes, overtime_minutes, days_present FROM timesheets t "
+        f"WHERE {condition} ORDER BY employee_id",
+        "SELECT e.employee_id, e.date, e.state, e.clock_in_at, e.clock_out_at, e.notes "
+        "FROM timesheets t CROSS JOIN attendance_entries e "
+        "ON e.employee_id = +t.employee_id AND e.year_month = t.year_month "
+        f"WHERE {condition} ORDER BY t.employee_id, e.date",
+        "SELECT b.employee_id, b.date, b.start_at, b.end_at "
+        "FROM timesheets t CROSS JOIN break_intervals b "
+        "ON b.employee_id = +t.employee_id AND b.year_month = t.year_month "
+        f"WHERE {condition} ORDER BY t.employee_id, b.date, b.seq"
+    )
+
+
+# find_all_by_year_month reads the month this many timesheets at a time
+_MONTH_PAGE_SIZE = 500
+_MONTH_PAGE_QUERIES = _filtered_month_queries(
+    "t.year_month = ? AND t.employee_id > ? AND t.employee_id <= ?"
+)
+_SELECT_MONTH_PAGE_END = (
+    "SELECT max(employee_id) FROM ("
+    "SELECT employee_id FROM timesheets "
+    "WHERE year_month = ? AND employee_id > ? "
+    "ORDER BY employee_id LIMIT ?)"
+)
+_STATUS_QUERIES = _filtered_month_queries("t.year_month = ? AND t.status = ?")
+# One page of an approver's timesheets: the employees after the previous
+# page up to the one _SELECT_APPROVER_PAGE_END finds
+_APPROVER_QUERIES = _filtered_month_queries(
+    "t.year_month = ? AND t.approver_id = ? AND t.status = ? "
+    "AND t.employee_id > ? AND t.employee_id <= ?"
+)
+_SELECT_APPROVER_PAGE_END = (
+    "SELECT max(employee_id) FROM ("
+    "SELECT employee_id FROM timesheets "
+    "WHERE year_month = ? AND approver_id = ? AND status = ? AND employee_id > ? "
+    "ORDER BY employee_id LIMIT ?)"
+)
+
+_SELECT_EMPLOYEES_BY_ENTRY_STATE = (
+    "SELECT employee_id FROM attendance_entries "
+    "WHERE date = ? AND state = ? ORDER BY employee_id"
+)
+_SELECT_VERSION = (
+    "SELECT version FROM timesheets WHERE employee_id = ? AND year_month = ?"
+)
+_UPSERT_TIMESHEET = (
+    "INSERT INTO timesheets "
+    "(employee_id, year_month, timesheet_id, status, version, approver_id, "
+    "worked_minutes, break_minutes, overtime_minutes, days_present) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (employee_id, year_month) DO UPDATE SET "
+    "timesheet_id = excluded.timesheet_id, status = excluded.status, "
+    "version = excluded.version, approver_id = excluded.approver_id, "
+    "worked_minutes = excluded.worked_minutes, break_minutes = excluded.break_minutes, "
+    "overtime_minutes = excluded.overtime_minutes, days_present = excluded.days_present"
+)
+_UPSERT_ENTRY = (
+    "INSERT INTO attendance_entries "
+    "(employee_id, year_month, date, state, clock_in_at, clock_out_at, notes) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (employee_id, year_month, date) DO UPDATE SET "
+    "state = excluded.state, clock_in_at = excluded.clock_in_at, "
+    "clock_out_at = excluded.clock_out_at, notes = excluded.notes"
+)
+_DELETE_ENTRY = (
+    "DELETE FROM attendance_entries "
+    "WHERE employee_id = ? AND year_month = ? AND date = ?"
+)
+_UPSERT_BREAK = (
+    "INSERT INTO break_intervals (employee_id, year_month, date, seq, start_at, end_at) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (employee_id, year_month, date, seq) DO UPDATE SET "
+    "start_at = excluded.start_at, end_at = excluded.end_at"
+)
+_TRIM_BREAKS = (
+    "DELETE FROM break_intervals "
+    "WHERE employee_id = ? AND year_month = ? AND date = ? AND seq >= ?"
+)
+
+
+class SQLiteTimesheetRepository(TimesheetRepository):
+    """Timesheets stored in normalized SQLite tables.
+
+    The last loaded or saved row state of up to ``max_known_states``
+    aggregates is remembered, so save() only writes the attendance entry and
+    break rows that changed; a forgotten one is reloaded inside the save. The
+    version check and the row writes share one BEGIN IMMEDIATE transaction,
+    as do the timesheet's pending domain events when an outbox on the same
+    database is given.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        pool: Optional[SQLiteConnectionPool] = None,
+        outbox: Optional["SQLiteOutbox"] = None,
+        max_known_states: int = 10_000
+    ):
+        self._pool = pool or SQLiteConnectionPool(path)
+        self._outbox = outbox
+        self._max_known_states = max_known_states
+        self._known_states_lock = threading.Lock()
+        self._known_states: OrderedDict[Tuple[str, str], Dict[str, Any]] = OrderedDict()
+        self._pool.connection().executescript(_SCHEMA)
+        self._add_missing_columns()
+        self._pool.connection().executescript(_APPROVER_INDEX)
+
+    def find_by(self, employee_id: EmployeeId, year_month: YearMonth) -> Optional[Timesheet]:
+        key = self._create_key(employee_id, year_month)
+        with self._pool.snapshot() as connection:
+            state = self._load_state(connection, key)
+        if state is None:
+            self._forget_state(key)
+            return None
+
+        self._remember_state(key, state)
+        return deserialize_timesheet(state)
+
+    def save(self, timesheet: Timesheet) -> None:
+        error = self.save_all([timesheet])[0]
+        if error is not None:
+            raise error
+
+    def save_all(self, timesheets: List[Timesheet]) -> List[Optional[ConcurrencyConflictError]]:
+        results: List[Optional[ConcurrencyConflictError]] = []
+        written: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        accepted: List[Timesheet] = []
+        messages: List[OutboxMessage] = []
+
+        with self._pool.transaction() as connection:
+            for timesheet in timesheets:
+                key = self._create_key(timesheet.employee_id, timesheet.year_month)
+                new_state = serialize_timesheet(timesheet)
+                new_state["version"] = timesheet.version + 1
+
+                row = connection.execute(_SELECT_VERSION, key).fetchone()
+                stored_version = row[0] if row else 0
+                if timesheet.version != stored_version:
+                    self._forget_state(key)
+                    results.append(ConcurrencyConflictError(
+                        f"Timesheet {key} was modified concurrently "
+                        f"(expected version {timesheet.version}, found {stored_version})"
+                    ))
+                    continue
+
+                old_state = written.get(key) or self._known_state(key)
+                if old_state is None or old_state["version"] != stored_version:
+                    old_state = self._load_state(connection, key)
+                self._write_diff(connection, key, old_state, new_state)
+                if self._outbox:
+                    messages.extend(timesheet_event_messages(timesheet))
+                written[key] = new_state
+                accepted.append(timesheet)
+                results.append(None)
+
+            if messages and self._outbox is not None:
+                self._outbox.append(connection, messages)
+
+        for key, new_state in written.items():
+            self._remember_state(key, new_state)
+        for timesheet in accepted:
+            timesheet.version += 1
+            timesheet.clear_events()
+        return results
+
+    def find_all_by_year_month(self, year_month: YearMonth) -> Iterator[Timesheet]:
+        # Each page is read in its own snapshot and yielded after it ends, so
+        # a slow or abandoned consumer never holds a read transaction open
+        after = ""
+        while True:
+            with self._pool.snapshot() as connection:
+                (last_employee_id,) = connection.execute(
+                    _SELECT_MONTH_PAGE_END, (str(year_month), after, _MONTH_PAGE_SIZE)
+                ).fetchone()
+                if last_employee_id is None:
+                    return
+                params = (str(year_month), after, last_employee_id)
+                # Keep the page as plain rows, which are cheaper to hold
+                # than the timesheets built from them
+                timesheet_rows, entry_rows, break_rows = (
+                    connection.execute(sql, params).fetchall() for sql in _MONTH_PAGE_QUERIES
+                )
+            yield from _assemble_timesheets(str(year_month), timesheet_rows, entry_rows, break_rows)
+            after = last_employee_id
+
+    def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        with self._pool.snapshot() as connection:
+            return list(self._read_timesheets(
+                connection, _STATUS_QUERIES, (str(year_month), status.value)
+            ))
+
+    def find_by_approver(
+        self,
+        year_month: YearMonth,
+        approver_id: EmployeeId,
+        status: TimesheetStatus,
+        after: Optional[EmployeeId] = None,
+        limit: Optional[int] = None
+    ) -> List[Timesheet]:
+        params = (str(year_month), approver_id, status.value, after or "")
+        with self._pool.snapshot() as connection:
+            (last_employee_id,) = connection.execute(
+                _SELECT_APPROVER_PAGE_END, (*params, limit if limit is not None else -1)
+            ).fetchone()
+            if last_employee_id is None:
+                return []
+            return list(self._read_timesheets(
+                connection, _APPROVER_QUERIES, (*params, last_employee_id)
+            ))
+
+    def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        rows = self._pool.connection().execute(
+            _SELECT_EMPLOYEES_BY_ENTRY_STATE, (date.value.isoformat(), state.value)
+        )
+        return [EmployeeId(employee_id) for (employee_id,) in rows]
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _read_timesheets(
+        self,
+        connection: sqlite3.Connection,
+        queries: Tuple[str, str, str],
+        params: Tuple[str, ...]
+    ) -> Iterator[Timesheet]:
+        timesheets_sql, entries_sql, breaks_sql = queries
+        return _assemble_timesheets(
+            params[0],
+            connection.execute(timesheets_sql, params),
+            connection.execute(entries_sql, params),
+            connection.execute(breaks_sql, params)
+        )
+
+    def _known_state(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        with self._known_states_lock:
+            return self._known_states.get(key)
+
+    def _remember_state(self, key: Tuple[str, str], state: Dict[str, Any]) -> None:
+        with self._known_states_lock:
+            self._known_states[key] = state
+            self._known_states.move_to_end(key)
+            while len(self._known_states) > self._max_known_states:
+                self._known_states.popitem(last=False)
+
+    def _forget_state(self, key: Tuple[str, str]) -> None:
+        with self._known_states_lock:
+            self._known_states.pop(key, None)
+
+    def _add_missing_columns(self) -> None:
+        # Checked under the write lock, so workers starting together do not
+        # both try to add them
+        with self._pool.transaction() as connection:
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(timesheets)")}
+            for name, column_type in _ADDED_COLUMNS:
+                if name not in columns:
+                    connection.execute(f"ALTER TABLE timesheets ADD COLUMN {name} {column_type}")
+
+    def _load_state(
+        self,
+        connection: sqlite3.Connection,
+        key: Tuple[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        row = connection.execute(_SELECT_TIMESHEET, key).fetchone()
+        if row is None:
+            return None
+
+        timesheet_id, status, version, approver_id, *totals = row
+        entries: Dict[str, Dict[str, Any]] = {}
+        for entry_date, state, clock_in_at, clock_out_at, notes in connection.execute(
+            _SELECT_ENTRIES, key
+        ):
+            entries[entry_date] = {
+                "state": state,
+                "clock_in_at": clock_in_at,
+                "clock_out_at": clock_out_at,
+                "breaks": [],
+                "notes": notes
+            }
+        for entry_date, start_at, end_at in connection.execute(_SELECT_BREAKS, key):
+            entries[entry_date]["breaks"].append([start_at, end_at])
+
+        return {
+            "timesheet_id": timesheet_id,
+            "employee_id": key[0],
+            "year_month": key[1],
+            "status": status,
+            "version": version,
+            "approver_id": approver_id,
+            "entries": entries,
+            "totals": _stored_totals(totals)
+        }
+
+    def _write_diff(
+        self,
+        connection: sqlite3.Connection,
+        key: Tuple[str, str],
+        old_state: Optional[Dict[str, Any]],
+        new_state: Dict[str, Any]
+    ) -> None:
+        employee_id, year_month = key
+
+        connection.execute(
+            _UPSERT_TIMESHEET,
+            (
+                employee_id,
+                year_month,
+                new_state["timesheet_id"],
+                new_state["status"],
+                new_state["version"],
+                new_state["approver_id"],
+                *new_state["totals"]
+            )
+        )
+
+        old_entries = old_state["entries"] if old_state else {}
+        for entry_date, entry in new_state["entries"].items():
+            old_entry = old_entries.get(entry_date)
+            if old_entry == entry:
+                continue
+
+            if old_entry is None or self._entry_row(old_entry) != self._entry_row(entry):
+                connection.execute(
+                    _UPSERT_ENTRY,
+                    (employee_id, year_month, entry_date, *self._entry_row(entry))
+                )
+
+            old_breaks: List[List[Optional[str]]] = old_entry["breaks"] if old_entry else []
+            new_breaks = entry["breaks"]
+            connection.executemany(
+                _UPSERT_BREAK,
+                [
+                    (employee_id, year_month, entry_date, seq, start_at, end_at)
+                    for seq, (start_at, end_at) in enumerate(new_breaks)
+                    if seq >= len(old_breaks) or old_breaks[seq] != [start_at, end_at]
+                ]
+            )
+            if len(old_breaks) > len(new_breaks):
+                connection.execute(
+                    _TRIM_BREAKS, (employee_id, year_month, entry_date, len(new_breaks))
+                )
+
+        for entry_date in old_entries.keys() - new_state["entries"].keys():
+            connection.execute(_DELETE_ENTRY, (employee_id, year_month, entry_date))
+
+    def _entry_row(self, entry: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (entry["state"], entry["clock_in_at"], entry["clock_out_at"], entry["notes"])
+
+    def _create_key(self, employee_id: EmployeeId, year_month: YearMonth) -> Tuple[str, str]:
+        year_month_str = f"{year_month.year:04d}-{year_month.month:02d}"
+        return (employee_id, year_month_str)
+
+
+def _assemble_timesheets(
+    year_month: str,
+    timesheet_rows: Iterable[Tuple[Any, ...]],
+    entry_rows: Iterable[Tuple[Any, ...]],
+    break_rows: Iterable[Tuple[Any, ...]]
+) -> Iterator[Timesheet]:
+    # The three row sources are ordered by employee, so each timesheet is
+    # assembled by a merge join without holding the month in memory
+    entries = _PeekableRows(entry_rows)
+    breaks = _PeekableRows(break_rows)
+    for employee_id, timesheet_id, status, version, approver_id, *totals in timesheet_rows:
+        entry_states: Dict[str, Dict[str, Any]] = {}
+        for _, entry_date, state, clock_in_at, clock_out_at, notes in entries.take(employee_id):
+            entry_states[entry_date] = {
+                "state": state,
+                "clock_in_at": clock_in_at,
+                "clock_out_at": clock_out_at,
+                "breaks": [],
+                "notes": notes
+            }
+        for _, entry_date, start_at, end_at in breaks.take(employee_id):
+            entry_states[entry_date]["breaks"].append([start_at, end_at])
+
+        yield deserialize_timesheet({
+            "timesheet_id": timesheet_id,
+            "employee_id": employee_id,
+            "year_month": year_month,
+            "status": status,
+            "version": version,
+            "approver_id": approver_id,
+            "entries": entry_states,
+            "totals": _stored_totals(totals)
+        })
+
+
+def _stored_totals(columns: List[Optional[int]]) -> Optional[List[int]]:
+    # All four are written together, so one NULL means a row from before they were
+    if columns[0] is None:
+        return None
+    return [value or 0 for value in columns]
+
+
+class _PeekableRows:
+    """Rows ordered by employee_id, consumed one employee at a time"""
+
+    def __init__(self, rows: Iterable[Tuple[Any, ...]]):
+        self._rows = iter(rows)
+        self._next = next(self._rows, None)
+
+    def take(self, employee_id: str) -> Iterator[Tuple[Any, ...]]:
+        while self._next is not None and self._next[0] < employee_id:
+            self._next = next(self._rows, None)
+        while self._next is not None and self._next[0] == employee_id:
+            row = self._next
+            self._next = next(self._rows, None)
+            yield row
@@ -0,0 +1,128 @@
+import bisect
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from ...domain.models import Timesheet
+
+
+_Key = Tuple[str, str]
+
+
+class IndexedFields(NamedTuple):
+    """The parts of a stored timesheet that TimesheetIndex looks up by"""
+    status: str
+    approver_id: Optional[str]
+    entry_states: Dict[str, str]
+
+    @classmethod
+    def of_timesheet(cls, timesheet: Timesheet) -> "IndexedFields":
+        return cls(
+            status=timesheet.status.value,
+            approver_id=timesheet.approver_id,
+            entry_states={
+                entry_date.isoformat(): entry.state.value
+                for entry_date, entry in timesheet.entries.items()
+            }
+        )
+
+    @classmethod
+    def of_state(cls, state: Dict[str, Any]) -> "IndexedFields":
+        return cls(
+            status=state["status"],
+            approver_id=state.get("approver_id"),
+            entry_states={
+                entry_date: entry["state"] for entry_date, entry in state["entries"].items()
+            }
+        )
+
+
+class TimesheetIndex:
+    """Secondary indexes over stored timesheets keyed by (employee_id, "YYYY-MM").
+
+    Keys are indexed by year-month, by (year-month, status) and by
+    (entry date, attendance state). The last indexed fields of every key are
+    kept, so update() only touches the postings whose value changed: saving
+    one punch moves one key between two postings. Postings are kept sorted,
+    so lookups copy a slice instead of sorting.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fields: Dict[_Key, IndexedFields] = {}
+        self._by_year_month: Dict[str, List[_Key]] = {}
+        self._by_status: Dict[Tuple[str, str], List[_Key]] = {}
+        self._by_approver: Dict[Tuple[str, str, str], List[_Key]] = {}
+        self._by_entry_state: Dict[Tuple[str, str], List[_Key]] = {}
+
+    def update(self, key: _Key, new: IndexedFields) -> None:
+        year_month = key[1]
+        with self._lock:
+            old = self._fields.get(key)
+            self._fields[key] = new
+            if old is None:
+                _add(self._by_year_month, year_month, key)
+
+            if old is None or old.status != new.status:
+                if old is not None:
+                    _discard(self._by_status, (year_month, old.status), key)
+                _add(self._by_status, (year_month, new.status), key)
+
+            if old is None or (old.approver_id, old.status) != (new.approver_id, new.status):
+                if old is not None and old.approver_id:
+                    _discard(self._by_approver, (year_month, old.approver_id, old.status), key)
+                if new.approver_id:
+                    _add(self._by_approver, (year_month, new.approver_id, new.status), key)
+
+            old_states = old.entry_states if old is not None else {}
+            for entry_date, state in old_states.items():
+                if new.entry_states.get(entry_date) != state:
+                    _discard(self._by_entry_state, (entry_date, state), key)
+            for entry_date, state in new.entry_states.items():
+                if old_states.get(entry_date) != state:
+                    _add(self._by_entry_state, (entry_date, state), key)
+
+    def keys_by_year_month(self, year_month: str) -> List[_Key]:
+        return self._sorted_keys(self._by_year_month, year_month)
+
+    def keys_by_status(self, year_month: str, status: str) -> List[_Key]:
+        return self._sorted_keys(self._by_status, (year_month, status))
+
+    def keys_by_approver(
+        self,
+        year_month: str,
+        approver_id: str,
+        status: str,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[_Key]:
+        with self._lock:
+            keys = self._by_approver.get((year_month, approver_id, status), [])
+            start = bisect.bisect_right(keys, (after, year_month)) if after is not None else 0
+            return keys[start:start + limit] if limit is not None else keys[start:]
+
+    def keys_by_entry_state(self, entry_date: str, state: str) -> List[_Key]:
+        return self._sorted_keys(self._by_entry_state, (entry_date, state))
+
+    def _sorted_keys(self, index: Dict[Any, List[_Key]], value: Any) -> List[_Key]:
+        with self._lock:
+            return list(index.get(value, ()))
+
+
+def _add(index: Dict[Any, List[_Key]], value: Any, key: _Key) -> None:
+    postings = index.get(value)
+    if postings is None:
+        index[value] = [key]
+        return
+    position = bisect.bisect_left(postings, key)
+    if position == len(postings) or postings[position] != key:
+        postings.insert(position, key)
+
+
+def _discard(index: Dict[Any, List[_Key]], value: Any, key: _Key) -> None:
+    postings = index.get(value)
+    if postings is None:
+        return
+    position = bisect.bisect_left(postings, key)
+    if position < len(postings) and postings[position] == key:
+        del postings[position]
+    if not postings:
+        del index[value]
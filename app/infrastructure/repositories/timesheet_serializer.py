@@ -0,0 +1,159 @@
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from ...domain.models import (
+    Timesheet,
+    MonthlyTotals,
+    TimesheetId,
+    EmployeeId,
+    YearMonth,
+    Date,
+    DateTime,
+    AttendanceEntry,
+    AttendanceState,
+    BreakInterval,
+    TimesheetStatus
+)
+
+
+def serialize_timesheet(timesheet: Timesheet) -> Dict[str, Any]:
+    return {
+        "timesheet_id": timesheet.timesheet_id,
+        "employee_id": timesheet.employee_id,
+        "year_month": str(timesheet.year_month),
+        "status": timesheet.status.value,
+        "version": timesheet.version,
+        "approver_id": timesheet.approver_id,
+        "entries": {
+            entry_date.isoformat(): serialize_entry(entry)
+            for entry_date, entry in timesheet.entries.items()
+        },
+        "totals": serialize_totals(timesheet.monthly_totals())
+    }
+
+
+def serialize_entry(entry: AttendanceEntry) -> Dict[str, Any]:
+    return {
+        "state": entry.state.value,
+        "clock_in_at": _format_datetime(entry.clock_in_at),
+        "clock_out_at": _format_datetime(entry.clock_out_at),
+        "breaks": [
+            [_format_datetime(b.start_at), _format_datetime(b.end_at)]
+            for b in entry.breaks
+        ],
+        "notes": entry.notes
+    }
+
+
+def deserialize_timesheet(data: Dict[str, Any]) -> Timesheet:
+    entries = {}
+    for entry_date, entry_data in data["entries"].items():
+        entry = deserialize_entry(entry_date, entry_data)
+        entries[entry.date.value] = entry
+
+    return Timesheet(
+        timesheet_id=TimesheetId(data["timesheet_id"]),
+        employee_id=EmployeeId(data["employee_id"]),
+        year_month=YearMonth.from_string(data["year_month"]),
+        entries=entries,
+        status=TimesheetStatus(data["status"]),
+        version=data["version"],
+        # Absent from states written before approvers were assigned
+        approver_id=_parse_employee_id(data.get("approver_id")),
+        # Absent from states written before totals were stored, or whose
+        # entries changed without them
+        totals=deserialize_totals(data.get("totals"))
+    )
+
+
+def deserialize_entry(entry_date: str, data: Dict[str, Any]) -> AttendanceEntry:
+    breaks: List[BreakInterval] = [
+        BreakInterval(start_at=_parse_required_datetime(start), end_at=_parse_datetime(end))
+        for start, end in data["breaks"]
+    ]
+    return AttendanceEntry(
+        date=Date(date.fromisoformat(entry_date)),
+        state=AttendanceState(data["state"]),
+        clock_in_at=_parse_datetime(data["clock_in_at"]),
+        clock_out_at=_parse_datetime(data["clock_out_at"]),
+        breaks=breaks,
+        notes=data["notes"]
+    )
+
+
+def copy_timesheet(timesheet: Timesheet) -> Timesheet:
+    """Independent copy of a timesheet.
+
+    Value objects are immutable and shared; only the mutable entries and
+    breaks are rebuilt, which is several times cheaper than copy.deepcopy.
+    """
+    entries = {
+        entry_date: AttendanceEntry(
+            date=entry.date,
+            state=entry.state,
+            clock_in_at=entry.clock_in_at,
+            clock_out_at=entry.clock_out_at,
+            breaks=[
+                BreakInterval(start_at=break_interval.start_at, end_at=break_interval.end_at)
+                for break_interval in entry.breaks
+            ],
+            notes=entry.notes
+        )
+        for entry_date, entry in timesheet.entries.items()
+    }
+    return Timesheet(
+        timesheet_id=timesheet.timesheet_id,
+        employee_id=timesheet.employee_id,
+        year_month=timesheet.year_month,
+        entries=entries,
+        status=timesheet.status,
+        version=timesheet.version,
+        approver_id=timesheet.approver_id,
+        totals=timesheet.monthly_totals()
+    )
+
+
+def serialize_totals(totals: MonthlyTotals) -> List[int]:
+    return [
+        totals.worked_minutes,
+        totals.break_minutes,
+        totals.overtime_minutes,
+        totals.days_present
+    ]
+
+
+def deserialize_totals(data: Optional[List[int]]) -> Optional[MonthlyTotals]:
+    if data is None:
+        return None
+    worked_minutes, break_minutes, overtime_minutes, days_present = data
+    return MonthlyTotals(
+        worked_minutes=worked_minutes,
+        break_minutes=break_minutes,
+        overtime_minutes=overtime_minutes,
+        days_present=days_present
+    )
+
+
+def empty_entry_data() -> Dict[str, Any]:
+    return {
+        "state": AttendanceState.CLOCKED_OUT.value,
+        "clock_in_at": None,
+        "clock_out_at": None,
+        "breaks": [],
+        "notes": ""
+    }
+
+
+def _format_datetime(value: DateTime | None) -> str | None:
+    return value.value.isoformat() if value else None
+
+
+def _parse_employee_id(value: str | None) -> EmployeeId | None:
+    return EmployeeId(value) if value else None
+
+
+def _parse_datetime(value: str | None) -> DateTime | None:
+    return DateTime(datetime.fromisoformat(value)) if value else None
+
+
+def _parse_required_datetime(value: str) -> DateTime:
+    return DateTime(datetime.fromisoformat(value))
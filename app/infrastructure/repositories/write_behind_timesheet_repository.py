@@ -0,0 +1,258 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+from ...domain.repositories.timesheet_repository import TimesheetRepository, CommitHandle
+from ...domain.models import (
+    Timesheet,
+    EmployeeId,
+    YearMonth,
+    Date,
+    TimesheetStatus,
+    AttendanceState
+)
+from ...domain.exceptions import ConcurrencyConflictError
+from .timesheet_serializer import copy_timesheet
+
+
+_Key = Tuple[str, str]
+_Queued = Tuple[_Key, Timesheet, "Future[None]"]
+
+
+class WriteBehindTimesheetRepository(TimesheetRepository):
+    """Buffer saves and write them to another repository in groups.
+
+    save_deferred() only snapshots the timesheet and queues it. A background
+    thread hands the queue to the backend's save_all() once ``max_batch_size``
+    saves are waiting or the oldest has waited ``max_delay_seconds``, so a
+    burst of punches costs one transaction per batch instead of one each.
+    save() and save_all() queue the same way but return only once their
+    batch is committed, so concurrent callers still share transactions.
+
+    Until its batch is committed, find_by() returns the buffered snapshot.
+    Versions are checked when a save is queued against the last version
+    saved through this wrapper, and again by the backend when the batch is
+    written; a save the backend rejects there fails its CommitHandle and the
+    buffered state is dropped, so the next find_by() reloads.
+    """
+
+    def __init__(
+        self,
+        repository: TimesheetRepository,
+        max_batch_size: int = 256,
+        max_delay_seconds: float = 0.01,
+        max_tracked_versions: int = 10_000
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._repository = repository
+        self._max_batch_size = max_batch_size
+        self._max_delay_seconds = max_delay_seconds
+        self._max_tracked_versions = max_tracked_versions
+
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        # Held while a batch is taken off the queue and written, so batches
+        # reach the backend in the order they were queued
+        self._write_lock = threading.Lock()
+        self._queue: Deque[_Queued] = deque()
+        self._oldest_queued_at = 0.0
+        # Latest buffered snapshot of each timesheet and its version once saved
+        self._pending: Dict[_Key, Tuple[Timesheet, int]] = {}
+        self._pending_futures: Dict[_Key, "Future[None]"] = {}
+        self._versions: OrderedDict[_Key, int] = OrderedDict()
+        self._closed = False
+
+        self._flusher = threading.Thread(
+            target=self._run_flusher,
+            name="timesheet-write-behind",
+            daemon=True
+        )
+        self._flusher.start()
+
+    @property
+    def repository(self) -> TimesheetRepository:
+        return self._repository
+
+    def find_by(self, employee_id: EmployeeId, year_month: YearMonth) -> Optional[Timesheet]:
+        key = self._create_key(employee_id, year_month)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                snapshot, version = pending
+                timesheet = copy_timesheet(snapshot)
+                timesheet.version = version
+                return timesheet
+        return self._repository.find_by(employee_id, year_month)
+
+    def save(self, timesheet: Timesheet) -> None:
+        self.save_deferred(timesheet).result()
+
+    def save_all(self, timesheets: List[Timesheet]) -> List[Optional[ConcurrencyConflictError]]:
+        queued: List[Tuple[int, CommitHandle]] = []
+        results: List[Optional[ConcurrencyConflictError]] = []
+        for timesheet in timesheets:
+            try:
+                queued.append((len(results), self.save_deferred(timesheet)))
+            except ConcurrencyConflictError as e:
+                results.append(e)
+                continue
+            results.append(None)
+        for index, handle in queued:
+            try:
+                handle.result()
+            except ConcurrencyConflictError as e:
+                results[index] = e
+        return results
+
+    def save_deferred(self, timesheet: Timesheet) -> CommitHandle:
+        """Queue a save and return a handle that completes when it is committed"""
+        key = self._create_key(timesheet.employee_id, timesheet.year_month)
+        future: "Future[None]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write-behind repository is closed")
+            pending = self._pending.get(key)
+            expected_version = pending[1] if pending else self._versions.get(key)
+            if expected_version is not None and timesheet.version != expected_version:
+                raise ConcurrencyConflictError(
+                    f"Timesheet {key} was modified concurrently "
+                    f"(expected version {timesheet.version}, found {expected_version})"
+                )
+
+            snapshot = copy_timesheet(timesheet)
+            # The snapshot is what gets saved, so it carries the domain events
+            for event in timesheet.pending_events():
+                snapshot.record_event(event)
+            if not self._queue:
+                self._oldest_queued_at = time.monotonic()
+            self._queue.append((key, snapshot, future))
+            self._pending[key] = (snapshot, timesheet.version + 1)
+            self._pending_futures[key] = future
+            self._track_version(key, timesheet.version + 1)
+            if len(self._queue) == 1 or len(self._queue) >= self._max_batch_size:
+                self._ready.notify()
+
+        timesheet.version += 1
+        timesheet.clear_events()
+        return CommitHandle(future)
+
+    def committed(self, employee_id: EmployeeId, year_month: YearMonth) -> CommitHandle:
+        """Handle for the last queued save of a timesheet; done if none is pending"""
+        key = self._create_key(employee_id, year_month)
+        with self._lock:
+            future = self._pending_futures.get(key)
+        if future is None:
+            return CommitHandle.completed()
+        return CommitHandle(future)
+
+    def find_all_by_year_month(self, year_month: YearMonth) -> Iterator[Timesheet]:
+        self.flush()
+        return self._repository.find_all_by_year_month(year_month)
+
+    def find_by_status(self, year_month: YearMonth, status: TimesheetStatus) -> List[Timesheet]:
+        self.flush()
+        return self._repository.find_by_status(year_month, status)
+
+    def find_by_approver(
+        self,
+        year_month: YearMonth,
+        approver_id: EmployeeId,
+        status: TimesheetStatus,
+        after: Optional[EmployeeId] = None,
+        limit: Optional[int] = None
+    ) -> List[Timesheet]:
+        self.flush()
+        return self._repository.find_by_approver(year_month, approver_id, status, after, limit)
+
+    def find_employee_ids_by_attendance_state(
+        self,
+        date: Date,
+        state: AttendanceState
+    ) -> List[EmployeeId]:
+        self.flush()
+        return self._repository.find_employee_ids_by_attendance_state(date, state)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def flush(self) -> None:
+        """Write every queued save before returning"""
+        with self._write_lock:
+            while self._write_next_batch():
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._ready.notify()
+        self._flusher.join()
+        self.flush()
+        close = getattr(self._repository, "close", None)
+        if close:
+            close()
+
+    def _run_flusher(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._ready.wait()
+                if not self._queue:
+                    return
+                while len(self._queue) < self._max_batch_size and not self._closed:
+                    remaining = self._oldest_queued_at + self._max_delay_seconds - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._ready.wait(remaining)
+            self.flush()
+
+    def _write_next_batch(self) -> bool:
+        with self._lock:
+            if not self._queue:
+                return False
+            batch = [
+                self._queue.popleft()
+                for _ in range(min(self._max_batch_size, len(self._queue)))
+            ]
+
+        try:
+            errors: List[Optional[BaseException]] = list(
+                self._repository.save_all([snapshot for _, snapshot, _ in batch])
+            )
+        except Exception as e:
+            errors = [e] * len(batch)
+
+        with self._lock:
+            for (key, snapshot, future), error in zip(batch, errors):
+                if self._pending_futures.get(key) is future:
+                    del self._pending_futures[key]
+                if error is None:
+                    pending = self._pending.get(key)
+                    if pending is not None and pending[0] is snapshot:
+                        del self._pending[key]
+                else:
+                    # Later saves of this timesheet were built on the rejected
+                    # one; forget it all so the next find_by reloads
+                    self._pending.pop(key, None)
+                    self._versions.pop(key, None)
+
+        for (_, _, future), error in zip(batch, errors):
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+        return True
+
+    def _track_version(self, key: _Key, version: int) -> None:
+        # Only a bounded number of versions are remembered; saves of
+        # forgotten timesheets are left to the backend's version check
+        self._versions[key] = version
+        self._versions.move_to_end(key)
+        while len(self._versions) > self._max_tracked_versions:
+            self._versions.popitem(last=False)
+
+    def _create_key(self, employee_id: EmployeeId, year_month: YearMonth) -> _Key:
+        year_month_str = f"{year_month.year:04d}-{year_month.month:02d}"
+        return (employee_id, year_month_str)
@@ -1,13 +1,41 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from .presentation.routers import attendance_router
+from .presentation.routers import (
+    attendance_router,
+    timesheet_router,
+    payroll_router,
+    presence_router,
+    admin_router
+)
+from .presentation.dependencies import close_repositories, get_event_dispatcher
+from .presentation.instrumentation import METRICS_ENABLED
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    dispatcher = get_event_dispatcher()
+    if dispatcher:
+        dispatcher.start()
+    yield
+    # Drains any buffered timesheet saves, so the dispatcher's final drain
+    # also delivers the events they commit
+    close_repositories()
+    if dispatcher:
+        await dispatcher.stop()
 
 
 app = FastAPI(
     title="Attendance Management API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.include_router(attendance_router.router)
+app.include_router(timesheet_router.router)
+app.include_router(payroll_router.router)
+app.include_router(presence_router.router)
+if METRICS_ENABLED:
+    app.include_router(admin_router.router)
 
 
 @app.get("/ping")
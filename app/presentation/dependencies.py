@@ -1,17 +1,231 @@
-from typing import Annotated
+import hmac
+import os
+from typing import Annotated, List, Optional
 from fastapi import Depends, Header, HTTPException
-from ..infrastructure.repositories import InMemoryTimesheetRepository
+from ..infrastructure.repositories import (
+    InMemoryTimesheetRepository,
+    EventLogTimesheetRepository,
+    SQLiteTimesheetRepository,
+    AsyncTimesheetRepositoryAdapter,
+    CachingTimesheetRepository,
+    WriteBehindTimesheetRepository,
+    ShardedTimesheetRepository,
+    InMemoryOvertimeRequestRepository,
+    InMemoryLeaveRequestRepository,
+    SQLiteOvertimeRequestRepository,
+    SQLiteLeaveRequestRepository,
+    AsyncLeaveRequestRepositoryAdapter,
+    SQLiteConnectionPool,
+    InstrumentedTimesheetRepository
+)
+from ..infrastructure.presence import PresenceBus
+from ..infrastructure.outbox import (
+    Outbox,
+    InMemoryOutbox,
+    SQLiteOutbox,
+    OutboxDispatcher,
+    create_sink
+)
+from .instrumentation import METRICS_ENABLED, timed_dependency
 from ..domain.repositories.timesheet_repository import TimesheetRepository
+from ..domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
+from ..domain.repositories.overtime_request_repository import OvertimeRequestRepository
+from ..domain.repositories.leave_request_repository import LeaveRequestRepository
+from ..domain.repositories.async_leave_request_repository import AsyncLeaveRequestRepository
+from ..application.usecases.presence_publisher import PresencePublisher
 
 
-_timesheet_repository = InMemoryTimesheetRepository()
+_backend = os.environ.get("TIMESHEET_REPOSITORY", "memory")
+_sqlite_path = os.environ.get("TIMESHEET_SQLITE_PATH", "data/attendance.db")
+# Number of server processes (set by run.py --workers). The in-memory and
+# event log backends keep their state in process memory, so only SQLite
+# can be shared between workers
+_workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+if _workers > 1 and _backend != "sqlite":
+    raise ValueError(
+        f"TIMESHEET_REPOSITORY={_backend} cannot be shared by {_workers} worker processes; "
+        "use TIMESHEET_REPOSITORY=sqlite"
+    )
+# Timesheets and requests share one database, and so one connection pool
+_sqlite_pool = SQLiteConnectionPool(_sqlite_path) if _backend == "sqlite" else None
+
+# ATTENDANCE_EVENT_SINKS lists where domain events go (file:<path> or
+# tcp:<host>:<port>, comma-separated). Events are written to an outbox in
+# the same transaction as the aggregate and dispatched in the background;
+# without sinks no outbox is kept
+_event_sink_specs = [spec for spec in os.environ.get("ATTENDANCE_EVENT_SINKS", "").split(",") if spec]
+if _event_sink_specs and _backend == "event_log":
+    raise ValueError(
+        "ATTENDANCE_EVENT_SINKS needs an outbox in the timesheet store; "
+        "use TIMESHEET_REPOSITORY=memory or sqlite"
+    )
+# One outbox per database; the requests share the main database's outbox
+_outboxes: List[Outbox] = []
+_sqlite_outbox: Optional[SQLiteOutbox] = None
+_memory_outbox: Optional[InMemoryOutbox] = None
+if _event_sink_specs:
+    if _sqlite_pool:
+        _sqlite_outbox = SQLiteOutbox(_sqlite_path, pool=_sqlite_pool)
+        _outboxes.append(_sqlite_outbox)
+    else:
+        _memory_outbox = InMemoryOutbox()
+        _outboxes.append(_memory_outbox)
+
+
+def _create_timesheet_repository(backend: str) -> TimesheetRepository:
+    # TIMESHEET_SHARDS lists the SQLite files or event log directories to
+    # spread timesheets over; changing it requires rebalance_timesheets.py
+    shards = [location for location in os.environ.get("TIMESHEET_SHARDS", "").split(",") if location]
+    if shards:
+        if backend == "memory":
+            raise ValueError("TIMESHEET_SHARDS requires a persistent TIMESHEET_REPOSITORY")
+        return ShardedTimesheetRepository({
+            location: _create_timesheet_shard(backend, location) for location in shards
+        })
+
+    if backend == "event_log":
+        return _create_timesheet_shard(
+            backend, os.environ.get("TIMESHEET_EVENT_LOG_DIR", "data/timesheets")
+        )
+    if backend == "sqlite":
+        return _create_timesheet_shard(backend, _sqlite_path)
+    if backend != "memory":
+        raise ValueError(f"Unknown TIMESHEET_REPOSITORY backend: {backend}")
+    return InMemoryTimesheetRepository(outbox=_memory_outbox)
+
+
+def _create_timesheet_shard(backend: str, location: str) -> TimesheetRepository:
+    if backend == "event_log":
+        return EventLogTimesheetRepository(location)
+    if backend == "sqlite":
+        # The main database keeps sharing its pool (and outbox) with the
+        # request repositories
+        if location == _sqlite_path:
+            return SQLiteTimesheetRepository(location, pool=_sqlite_pool, outbox=_sqlite_outbox)
+        pool = SQLiteConnectionPool(location)
+        outbox: Optional[SQLiteOutbox] = None
+        if _event_sink_specs:
+            outbox = SQLiteOutbox(location, pool=pool)
+            _outboxes.append(outbox)
+        return SQLiteTimesheetRepository(location, pool=pool, outbox=outbox)
+    raise ValueError(f"Unknown TIMESHEET_REPOSITORY backend: {backend}")
+
+
+def _with_cache(repository: TimesheetRepository, backend: str) -> TimesheetRepository:
+    # Persistent backends get a read-through cache of hot timesheets;
+    # TIMESHEET_CACHE_SIZE=0 turns it off. Saves are version-checked either
+    # way, but with several workers a cached read could miss another
+    # worker's write, so the cache is off there unless asked for
+    default_size = "10000" if _workers == 1 else "0"
+    max_entries = int(os.environ.get("TIMESHEET_CACHE_SIZE", default_size))
+    if backend == "memory" or max_entries <= 0:
+        return repository
+    return CachingTimesheetRepository(repository, max_entries=max_entries)
+
+
+def _with_write_behind(repository: TimesheetRepository, backend: str) -> TimesheetRepository:
+    # Opt-in group commit for persistent backends: saves are buffered and
+    # written in batches, and whatever is still queued is drained by
+    # close_repositories() at shutdown
+    if backend == "memory" or os.environ.get("TIMESHEET_WRITE_BEHIND", "0") != "1":
+        return repository
+    if _workers > 1:
+        raise ValueError(
+            "TIMESHEET_WRITE_BEHIND buffers saves per process and cannot be used with "
+            f"{_workers} worker processes"
+        )
+    return WriteBehindTimesheetRepository(
+        repository,
+        max_batch_size=int(os.environ.get("TIMESHEET_WRITE_BEHIND_BATCH", "256")),
+        max_delay_seconds=int(os.environ.get("TIMESHEET_WRITE_BEHIND_DELAY_MS", "10")) / 1000
+    )
+
+
+_timesheet_repository = _with_write_behind(
+    _with_cache(_create_timesheet_repository(_backend), _backend),
+    _backend
+)
+if METRICS_ENABLED:
+    _timesheet_repository = InstrumentedTimesheetRepository(_timesheet_repository)
+_async_timesheet_repository = AsyncTimesheetRepositoryAdapter(
+    _timesheet_repository,
+    run_in_thread=_backend != "memory"
+)
+
+# Requests live in SQLite with the sqlite backend and in memory otherwise;
+# the event log only covers timesheets
+_overtime_request_repository: OvertimeRequestRepository = (
+    SQLiteOvertimeRequestRepository(_sqlite_path, pool=_sqlite_pool)
+    if _sqlite_pool else InMemoryOvertimeRequestRepository()
+)
+_leave_request_repository: LeaveRequestRepository = (
+    SQLiteLeaveRequestRepository(_sqlite_path, pool=_sqlite_pool, outbox=_sqlite_outbox)
+    if _sqlite_pool else InMemoryLeaveRequestRepository(outbox=_memory_outbox)
+)
+_async_leave_request_repository = AsyncLeaveRequestRepositoryAdapter(
+    _leave_request_repository,
+    run_in_thread=_sqlite_pool is not None
+)
+
+# Live presence feed. Each worker process has its own bus, so with several
+# workers a subscriber only sees the punches its own worker handled
+_presence_bus = PresenceBus(
+    max_queue_size=int(os.environ.get("PRESENCE_QUEUE_SIZE", "256"))
+)
+
+_event_dispatcher = OutboxDispatcher(
+    _outboxes,
+    [create_sink(spec) for spec in _event_sink_specs],
+    batch_size=int(os.environ.get("ATTENDANCE_EVENT_BATCH_SIZE", "500")),
+    poll_interval_seconds=int(os.environ.get("ATTENDANCE_EVENT_POLL_MS", "200")) / 1000
+) if _event_sink_specs else None
 
 
 def get_timesheet_repository() -> TimesheetRepository:
     return _timesheet_repository
 
 
-def get_current_employee_id(
+async def get_async_timesheet_repository() -> AsyncTimesheetRepository:
+    return _async_timesheet_repository
+
+
+def get_overtime_request_repository() -> OvertimeRequestRepository:
+    return _overtime_request_repository
+
+
+def get_leave_request_repository() -> LeaveRequestRepository:
+    return _leave_request_repository
+
+
+async def get_async_leave_request_repository() -> AsyncLeaveRequestRepository:
+    return _async_leave_request_repository
+
+
+async def get_presence_bus() -> PresenceBus:
+    return _presence_bus
+
+
+async def get_presence_publisher() -> PresencePublisher:
+    return _presence_bus
+
+
+def get_event_dispatcher() -> Optional[OutboxDispatcher]:
+    return _event_dispatcher
+
+
+def close_repositories() -> None:
+    for repository in (
+        _timesheet_repository,
+        _overtime_request_repository,
+        _leave_request_repository
+    ):
+        close = getattr(repository, "close", None)
+        if close:
+            close()
+
+
+@timed_dependency("get_current_employee_id")
+async def get_current_employee_id(
     x_employee_id: Annotated[str | None, Header()] = None
 ) -> str:
     if not x_employee_id:
@@ -19,4 +233,30 @@ def get_current_employee_id(
             status_code=400,
             detail="X-Employee-ID header is required"
         )
-    return x_employee_id
\ No newline at end of file
+    return x_employee_id
+
+
+async def get_current_site_id(
+    x_site_id: Annotated[str | None, Header()] = None
+) -> str | None:
+    # Optional: lets presence subscribers filter punches by site
+    return x_site_id or None
+
+
+_admin_token = os.environ.get("ATTENDANCE_ADMIN_TOKEN", "")
+
+
+async def require_admin_token(
+    x_admin_token: Annotated[str | None, Header()] = None
+) -> None:
+    # The admin routes stay closed until a token is configured
+    if not _admin_token:
+        raise HTTPException(
+            status_code=403,
+            detail="Set ATTENDANCE_ADMIN_TOKEN to use the admin routes"
+        )
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, _admin_token):
+        raise HTTPException(
+            status_code=403,
+            detail="A valid X-Admin-Token header is required"
+        )
\ No newline at end of file
@@ -0,0 +1,124 @@
+import functools
+import inspect
+import os
+import time
+from typing import Any, Callable
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from ..infrastructure.instrumentation import (
+    Histogram,
+    RequestProfiler,
+    RequestTimings,
+    start_request,
+    end_request,
+    current_request,
+    timed_stage
+)
+
+
+# ATTENDANCE_METRICS=1 times every request stage and serves /metrics and
+# the profiler routes; otherwise none of the hooks below are installed
+METRICS_ENABLED = os.environ.get("ATTENDANCE_METRICS", "0") == "1"
+
+stage_seconds = Histogram(
+    "attendance_request_stage_seconds",
+    "Time spent in each stage of an API request",
+    ("route", "stage")
+)
+request_profiler = RequestProfiler()
+
+__all__ = [
+    "METRICS_ENABLED",
+    "stage_seconds",
+    "request_profiler",
+    "InstrumentedRoute",
+    "timed_dependency",
+    "timed_stage",
+]
+
+
+class InstrumentedRoute(APIRoute):
+    """API route that records per-stage timings when metrics are enabled.
+
+    Stages: ``request`` (the whole handler), ``parse`` (request validation
+    and dependency wiring up to the route function, less dependencies timed
+    on their own), timed dependencies such as ``get_current_employee_id``,
+    and the stages the route and its collaborators time with timed_stage()
+    (``use_case``, ``repository.<method>``, ``encode``). Nested stages are
+    also counted in the stages around them.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        if METRICS_ENABLED:
+            endpoint = _mark_endpoint_start(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+        if not METRICS_ENABLED:
+            return handler
+        route = self.path_format
+
+        async def instrumented_handler(request: Request) -> Response:
+            timings = RequestTimings(stage_seconds, route)
+            token = start_request(timings)
+            profiled = request_profiler.request_started()
+            started = time.perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                finished = time.perf_counter()
+                if profiled:
+                    request_profiler.request_finished()
+                end_request(token)
+                timings.observe("request", finished - started)
+                if timings.endpoint_started is not None:
+                    timings.observe(
+                        "parse",
+                        timings.endpoint_started - started - timings.dependency_seconds
+                    )
+
+        return instrumented_handler
+
+
+def timed_dependency(stage: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Record the time of an async FastAPI dependency as ``stage``"""
+    def decorate(dependency: Callable[..., Any]) -> Callable[..., Any]:
+        if not METRICS_ENABLED:
+            return dependency
+
+        @functools.wraps(dependency)
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            timings = current_request()
+            started = time.perf_counter()
+            try:
+                return await dependency(*args, **kwargs)
+            finally:
+                if timings is not None:
+                    timings.observe_dependency(stage, time.perf_counter() - started)
+
+        return timed
+
+    return decorate
+
+
+def _mark_endpoint_start(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    # FastAPI reads the signature through __wrapped__, so the wrapper keeps
+    # the route's parameters and response annotation
+    def mark() -> None:
+        timings = current_request()
+        if timings is not None:
+            timings.endpoint_started = time.perf_counter()
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def marked_async(*args: Any, **kwargs: Any) -> Any:
+            mark()
+            return await endpoint(*args, **kwargs)
+        return marked_async
+
+    @functools.wraps(endpoint)
+    def marked(*args: Any, **kwargs: Any) -> Any:
+        mark()
+        return endpoint(*args, **kwargs)
+    return marked
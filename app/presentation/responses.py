@@ -0,0 +1,48 @@
+from typing import Any, Callable, Dict, Mapping, Optional
+from fastapi import Response
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from ..infrastructure.instrumentation import timed_stage
+
+
+class DataclassJSONResponse(Response):
+    """JSON response rendered straight from an application DTO dataclass.
+
+    Routes that return one skip building the pydantic response model and
+    FastAPI's second validation pass: the DTO is serialized to bytes by a
+    pydantic-core encoder compiled once per DTO type. Keep the route's
+    ``response_model`` so the OpenAPI schema still documents the payload;
+    the DTOs have the same fields as the response schemas.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None
+    ):
+        super().__init__(content, status_code, headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        with timed_stage("encode"):
+            return dump_dataclass_json(content)
+
+
+def dump_dataclass_json(content: Any) -> bytes:
+    """JSON bytes of a DTO dataclass, with the encoder DataclassJSONResponse uses"""
+    return _encoder(type(content))(content)
+
+
+# One compiled encoder per DTO class; a race only compiles one twice
+_encoders: Dict[type, Callable[[Any], bytes]] = {}
+
+
+def _encoder(dto_type: type) -> Callable[[Any], bytes]:
+    encoder = _encoders.get(dto_type)
+    if encoder is None:
+        encoder = TypeAdapter(dto_type).dump_json
+        _encoders[dto_type] = encoder
+    return encoder
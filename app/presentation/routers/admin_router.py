@@ -0,0 +1,43 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from ..dependencies import require_admin_token
+from ..instrumentation import stage_seconds, request_profiler
+from ...infrastructure.instrumentation import render_metrics
+
+# Only mounted with ATTENDANCE_METRICS=1, and kept out of the OpenAPI schema
+router = APIRouter(
+    tags=["admin"],
+    include_in_schema=False
+)
+
+
+@router.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        render_metrics([stage_seconds]),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
+@router.post("/admin/profile", status_code=202, dependencies=[Depends(require_admin_token)])
+async def start_profile(
+    requests: Annotated[int, Query(ge=1, le=10_000)] = 10
+) -> dict:
+    try:
+        request_profiler.arm(requests)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"message": f"Profiling the next {requests} requests"}
+
+
+@router.get("/admin/profile", dependencies=[Depends(require_admin_token)])
+async def get_profile() -> PlainTextResponse:
+    report = request_profiler.last_report()
+    if report is None:
+        pending = request_profiler.pending_requests()
+        detail = f"Waiting for {pending} more requests" if pending else "No profile has been captured"
+        raise HTTPException(status_code=404, detail=detail)
+    return PlainTextResponse(
+        f"# {report.requests} requests captured at {report.captured_at}\n{report.text}"
+    )
@@ -1,134 +1,209 @@
-from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException
+import io
+import tempfile
+from typing import Annotated, Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from ..schemas.attendance_schemas import (
     ClockInRequest, ClockInResponse,
     ClockOutRequest, ClockOutResponse,
     StartBreakRequest, StartBreakResponse,
-    EndBreakRequest, EndBreakResponse
+    EndBreakRequest, EndBreakResponse,
+    AttendanceEventsBatchRequest, AttendanceEventsBatchResponse,
+    ImportAttendanceResponse
+)
+from ..responses import DataclassJSONResponse
+from ..instrumentation import InstrumentedRoute, timed_stage
+from ..dependencies import (
+    get_timesheet_repository,
+    get_async_timesheet_repository,
+    get_async_leave_request_repository,
+    get_presence_publisher,
+    get_current_employee_id,
+    get_current_site_id,
+    require_admin_token
 )
-from ..dependencies import get_timesheet_repository, get_current_employee_id
 from ...domain.repositories.timesheet_repository import TimesheetRepository
-from ...application.usecases import ClockInUseCase
-from ...application.usecases.clock_out_usecase import ClockOutUseCase
-from ...application.usecases.start_break_usecase import StartBreakUseCase
-from ...application.usecases.end_break_usecase import EndBreakUseCase
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
+from ...domain.repositories.async_leave_request_repository import AsyncLeaveRequestRepository
+from ...application.usecases import AsyncClockInUseCase
+from ...application.usecases.presence_publisher import PresencePublisher
+from ...application.usecases.clock_out_usecase import AsyncClockOutUseCase
+from ...application.usecases.start_break_usecase import AsyncStartBreakUseCase
+from ...application.usecases.end_break_usecase import AsyncEndBreakUseCase
+from ...application.usecases.process_attendance_events_batch_usecase import (
+    AsyncProcessAttendanceEventsBatchUseCase
+)
+from ...application.usecases.import_attendance_usecase import ImportAttendanceUseCase
 from ...application.dtos import attendance_dtos
+from ...infrastructure.importers import read_attendance_records
+
+# Uploads larger than this are spooled to a temporary file instead of memory
+IMPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
 
 router = APIRouter(
     prefix="/v1/attendance",
-    tags=["attendance"]
+    tags=["attendance"],
+    route_class=InstrumentedRoute
 )
 
 
 @router.post("/clock-in", response_model=ClockInResponse)
-def clock_in(
+async def clock_in(
     request: ClockInRequest,
     employee_id: Annotated[str, Depends(get_current_employee_id)],
-    repository: Annotated[TimesheetRepository, Depends(get_timesheet_repository)]
-) -> ClockInResponse:
-    use_case = ClockInUseCase(repository)
+    repository: Annotated[AsyncTimesheetRepository, Depends(get_async_timesheet_repository)],
+    leave_repository: Annotated[
+        AsyncLeaveRequestRepository, Depends(get_async_leave_request_repository)
+    ],
+    site_id: Annotated[str | None, Depends(get_current_site_id)],
+    presence: Annotated[PresencePublisher, Depends(get_presence_publisher)]
+) -> DataclassJSONResponse:
+    use_case = AsyncClockInUseCase(repository, leave_repository, presence)
 
     dto_request = attendance_dtos.ClockInRequest(
         employee_id=employee_id,
-        clock_in_time=request.clock_in_time
+        clock_in_time=request.clock_in_time,
+        site_id=site_id
     )
 
-    dto_response = use_case.execute(dto_request)
+    with timed_stage("use_case"):
+        dto_response = await use_case.execute(dto_request)
 
     if not dto_response.success:
         raise HTTPException(status_code=400, detail=dto_response.message)
 
-    return ClockInResponse(
-        success=dto_response.success,
-        message=dto_response.message,
-        employee_id=dto_response.employee_id,
-        date=dto_response.date,
-        clock_in_time=dto_response.clock_in_time,
-        current_state=dto_response.current_state
-    )
+    return DataclassJSONResponse(dto_response)
 
 
 @router.post("/clock-out", response_model=ClockOutResponse)
-def clock_out(
+async def clock_out(
     request: ClockOutRequest,
     employee_id: Annotated[str, Depends(get_current_employee_id)],
-    repository: Annotated[TimesheetRepository, Depends(get_timesheet_repository)]
-) -> ClockOutResponse:
-    use_case = ClockOutUseCase(repository)
+    repository: Annotated[AsyncTimesheetRepository, Depends(get_async_timesheet_repository)],
+    site_id: Annotated[str | None, Depends(get_current_site_id)],
+    presence: Annotated[PresencePublisher, Depends(get_presence_publisher)]
+) -> DataclassJSONResponse:
+    use_case = AsyncClockOutUseCase(repository, presence)
 
     dto_request = attendance_dtos.ClockOutRequest(
         employee_id=employee_id,
-        clock_out_time=request.clock_out_time
+        clock_out_time=request.clock_out_time,
+        site_id=site_id
     )
 
-    dto_response = use_case.execute(dto_request)
+    with timed_stage("use_case"):
+        dto_response = await use_case.execute(dto_request)
 
     if not dto_response.success:
         raise HTTPException(status_code=400, detail=dto_response.message)
 
-    return ClockOutResponse(
-        success=dto_response.success,
-        message=dto_response.message,
-        employee_id=dto_response.employee_id,
-        date=dto_response.date,
-        clock_out_time=dto_response.clock_out_time,
-        current_state=dto_response.current_state,
-        worked_minutes=dto_response.worked_minutes
-    )
+    return DataclassJSONResponse(dto_response)
 
 
 @router.post("/start-break", response_model=StartBreakResponse)
-def start_break(
+async def start_break(
     request: StartBreakRequest,
     employee_id: Annotated[str, Depends(get_current_employee_id)],
-    repository: Annotated[TimesheetRepository, Depends(get_timesheet_repository)]
-) -> StartBreakResponse:
-    use_case = StartBreakUseCase(repository)
+    repository: Annotated[AsyncTimesheetRepository, Depends(get_async_timesheet_repository)],
+    site_id: Annotated[str | None, Depends(get_current_site_id)],
+    presence: Annotated[PresencePublisher, Depends(get_presence_publisher)]
+) -> DataclassJSONResponse:
+    use_case = AsyncStartBreakUseCase(repository, presence)
 
     dto_request = attendance_dtos.StartBreakRequest(
         employee_id=employee_id,
-        break_start_time=request.break_start_time
+        break_start_time=request.break_start_time,
+        site_id=site_id
     )
 
-    dto_response = use_case.execute(dto_request)
+    with timed_stage("use_case"):
+        dto_response = await use_case.execute(dto_request)
 
     if not dto_response.success:
         raise HTTPException(status_code=400, detail=dto_response.message)
 
-    return StartBreakResponse(
-        success=dto_response.success,
-        message=dto_response.message,
-        employee_id=dto_response.employee_id,
-        date=dto_response.date,
-        break_start_time=dto_response.break_start_time,
-        current_state=dto_response.current_state
-    )
+    return DataclassJSONResponse(dto_response)
 
 
 @router.post("/end-break", response_model=EndBreakResponse)
-def end_break(
+async def end_break(
     request: EndBreakRequest,
     employee_id: Annotated[str, Depends(get_current_employee_id)],
-    repository: Annotated[TimesheetRepository, Depends(get_timesheet_repository)]
-) -> EndBreakResponse:
-    use_case = EndBreakUseCase(repository)
+    repository: Annotated[AsyncTimesheetRepository, Depends(get_async_timesheet_repository)],
+    site_id: Annotated[str | None, Depends(get_current_site_id)],
+    presence: Annotated[PresencePublisher, Depends(get_presence_publisher)]
+) -> DataclassJSONResponse:
+    use_case = AsyncEndBreakUseCase(repository, presence)
 
     dto_request = attendance_dtos.EndBreakRequest(
         employee_id=employee_id,
-        break_end_time=request.break_end_time
+        break_end_time=request.break_end_time,
+        site_id=site_id
     )
 
-    dto_response = use_case.execute(dto_request)
+    with timed_stage("use_case"):
+        dto_response = await use_case.execute(dto_request)
 
     if not dto_response.success:
         raise HTTPException(status_code=400, detail=dto_response.message)
 
-    return EndBreakResponse(
-        success=dto_response.success,
-        message=dto_response.message,
-        employee_id=dto_response.employee_id,
-        date=dto_response.date,
-        break_end_time=dto_response.break_end_time,
-        current_state=dto_response.current_state,
-        break_duration_minutes=dto_response.break_duration_minutes
-    )
\ No newline at end of file
+    return DataclassJSONResponse(dto_response)
+
+
+@router.post("/events:batch", response_model=AttendanceEventsBatchResponse)
+async def process_events_batch(
+    request: AttendanceEventsBatchRequest,
+    repository: Annotated[AsyncTimesheetRepository, Depends(get_async_timesheet_repository)],
+    leave_repository: Annotated[
+        AsyncLeaveRequestRepository, Depends(get_async_leave_request_repository)
+    ],
+    presence: Annotated[PresencePublisher, Depends(get_presence_publisher)]
+) -> DataclassJSONResponse:
+    use_case = AsyncProcessAttendanceEventsBatchUseCase(repository, leave_repository, presence)
+
+    dto_request = attendance_dtos.AttendanceEventsBatchRequest(
+        events=[
+            attendance_dtos.AttendanceEvent(
+                employee_id=event.employee_id,
+                event_type=event.event_type,
+                occurred_at=event.occurred_at,
+                site_id=event.site_id
+            )
+            for event in request.events
+        ]
+    )
+
+    with timed_stage("use_case"):
+        dto_response = await use_case.execute(dto_request)
+
+    return DataclassJSONResponse(dto_response)
+
+
+@router.post(
+    "/import",
+    response_model=ImportAttendanceResponse,
+    dependencies=[Depends(require_admin_token)]
+)
+async def import_attendance(
+    request: Request,
+    repository: Annotated[TimesheetRepository, Depends(get_timesheet_repository)],
+    file_format: Annotated[Literal["ndjson", "csv"], Query(alias="format")] = "ndjson"
+) -> DataclassJSONResponse:
+    use_case = ImportAttendanceUseCase(repository)
+
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+
+        def run_import():
+            lines = io.TextIOWrapper(spool, encoding="utf-8", newline="")
+            try:
+                return use_case.execute(read_attendance_records(lines, file_format))
+            finally:
+                lines.detach()
+
+        with timed_stage("use_case"):
+            dto_response = await run_in_threadpool(run_import)
+
+    return DataclassJSONResponse(dto_response)
\ No newline at end of file
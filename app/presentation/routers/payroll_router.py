@@ -0,0 +1,44 @@
+from typing import Annotated, Literal
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from ..dependencies import get_timesheet_repository
+from ..instrumentation import InstrumentedRoute, timed_stage
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...application.usecases.export_payroll_usecase import ExportPayrollUseCase
+from ...application.dtos import payroll_dtos
+from ...infrastructure.exporters import iter_payroll_csv, payroll_parquet_bytes
+
+router = APIRouter(
+    prefix="/v1/payroll",
+    tags=["payroll"],
+    route_class=InstrumentedRoute
+)
+
+
+@router.get("/{year_month}/export")
+async def export_payroll(
+    year_month: str,
+    repository: Annotated[TimesheetRepository, Depends(get_timesheet_repository)],
+    file_format: Annotated[Literal["csv", "parquet"], Query(alias="format")] = "csv"
+) -> Response:
+    use_case = ExportPayrollUseCase(repository)
+    dto_request = payroll_dtos.ExportPayrollRequest(year_month=year_month)
+
+    try:
+        with timed_stage("use_case"):
+            export = await run_in_threadpool(use_case.execute, dto_request)
+        filename = f"payroll-{export.year_month}.{file_format}"
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+        if file_format == "parquet":
+            content = await run_in_threadpool(payroll_parquet_bytes, export)
+            return Response(
+                content=content,
+                media_type="application/vnd.apache.parquet",
+                headers=headers
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(iter_payroll_csv(export), media_type="text/csv", headers=headers)
@@ -0,0 +1,109 @@
+from typing import Annotated, AsyncIterator, List, Optional
+import anyio
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from ..schemas.presence_schemas import PresenceSnapshotResponse
+from ..responses import DataclassJSONResponse, dump_dataclass_json
+from ..dependencies import get_presence_bus
+from ...infrastructure.presence import PresenceBus, PresenceSubscription, PresenceUpdate
+
+# Streams stay open for as long as the subscriber does, so these routes are
+# not instrumented: their durations would swamp the request stage metrics
+router = APIRouter(
+    prefix="/v1/presence",
+    tags=["presence"]
+)
+
+# Idle streams send a keepalive this often, which also notices subscribers
+# that went away without closing the connection
+KEEPALIVE_SECONDS = 15.0
+
+SiteQuery = Annotated[Optional[str], Query(alias="site", description="Only punches from this X-Site-ID")]
+
+
+@router.get("", response_model=PresenceSnapshotResponse)
+async def get_presence(
+    bus: Annotated[PresenceBus, Depends(get_presence_bus)],
+    site_id: SiteQuery = None
+) -> DataclassJSONResponse:
+    return DataclassJSONResponse(bus.snapshot(site_id))
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_presence(
+    bus: Annotated[PresenceBus, Depends(get_presence_bus)],
+    site_id: SiteQuery = None
+) -> StreamingResponse:
+    """Server-Sent Events: a ``snapshot`` event, then a ``presence`` event per
+    punch. A new snapshot replaces everything the subscriber knew; one is
+    sent again whenever the subscriber has fallen too far behind."""
+    return StreamingResponse(
+        _server_sent_events(bus, site_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws")
+async def presence_websocket(
+    websocket: WebSocket,
+    bus: Annotated[PresenceBus, Depends(get_presence_bus)],
+    site_id: SiteQuery = None
+) -> None:
+    """The SSE feed as ``{"type": ..., "data": ...}`` WebSocket messages"""
+    await websocket.accept()
+    subscription = bus.subscribe(site_id)
+    try:
+        async with anyio.create_task_group() as task_group:
+            async def close_on_disconnect() -> None:
+                while (await websocket.receive())["type"] != "websocket.disconnect":
+                    pass
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(close_on_disconnect)
+            while True:
+                update = await _next_update(subscription)
+                for message in _messages(update):
+                    await websocket.send_text(message)
+    except* WebSocketDisconnect:
+        # Sending raced the client going away
+        pass
+    finally:
+        subscription.close()
+
+
+async def _server_sent_events(bus: PresenceBus, site_id: Optional[str]) -> AsyncIterator[bytes]:
+    # Subscribing here rather than in the route ties the subscription to
+    # the stream, which closes it however the stream ends
+    subscription = bus.subscribe(site_id)
+    try:
+        while True:
+            update = await _next_update(subscription)
+            if update is None:
+                yield b": keepalive\n\n"
+            elif update.snapshot is not None:
+                yield b"event: snapshot\ndata: " + dump_dataclass_json(update.snapshot) + b"\n\n"
+            else:
+                yield b"".join(
+                    b"event: presence\ndata: " + dump_dataclass_json(event) + b"\n\n"
+                    for event in update.events
+                )
+    finally:
+        subscription.close()
+
+
+async def _next_update(subscription: PresenceSubscription) -> Optional[PresenceUpdate]:
+    with anyio.move_on_after(KEEPALIVE_SECONDS):
+        return await subscription.receive()
+    return None
+
+
+def _messages(update: Optional[PresenceUpdate]) -> List[str]:
+    if update is None:
+        return ['{"type":"keepalive"}']
+    if update.snapshot is not None:
+        return ['{"type":"snapshot","data":' + dump_dataclass_json(update.snapshot).decode() + "}"]
+    return [
+        '{"type":"presence","data":' + dump_dataclass_json(event).decode() + "}"
+        for event in update.events
+    ]
@@ -0,0 +1,169 @@
+from contextlib import contextmanager
+from typing import Annotated, Iterator
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from ..schemas.timesheet_schemas import (
+    MonthlySummaryResponse,
+    SubmitTimesheetRequest,
+    RejectTimesheetRequest,
+    TimesheetStatusResponse,
+    BulkApproveTimesheetsRequest,
+    BulkApproveTimesheetsResponse
+)
+from ..responses import DataclassJSONResponse
+from ..instrumentation import InstrumentedRoute, timed_stage
+from ..dependencies import (
+    get_timesheet_repository,
+    get_async_timesheet_repository,
+    get_current_employee_id
+)
+from ...domain.repositories.timesheet_repository import TimesheetRepository
+from ...domain.repositories.async_timesheet_repository import AsyncTimesheetRepository
+from ...domain.exceptions import (
+    TimesheetNotFoundError,
+    NotTimesheetApproverError,
+    InvalidStateTransitionError,
+    ConcurrencyConflictError
+)
+from ...application.usecases.get_monthly_summary_usecase import AsyncGetMonthlySummaryUseCase
+from ...application.usecases.submit_timesheet_usecase import AsyncSubmitTimesheetUseCase
+from ...application.usecases.review_timesheet_usecase import (
+    AsyncApproveTimesheetUseCase,
+    AsyncRejectTimesheetUseCase
+)
+from ...application.usecases.bulk_approve_timesheets_usecase import BulkApproveTimesheetsUseCase
+from ...application.dtos import timesheet_dtos
+
+router = APIRouter(
+    prefix="/v1/timesheets",
+    tags=["timesheets"],
+    route_class=InstrumentedRoute
+)
+
+
+@router.get("/{year_month}/summary", response_model=MonthlySummaryResponse)
+async def get_monthly_summary(
+    year_month: str,
+    employee_id: Annotated[str, Depends(get_current_employee_id)],
+    repository: Annotated[AsyncTimesheetRepository, Depends(get_async_timesheet_repository)]
+) -> DataclassJSONResponse:
+    use_case = AsyncGetMonthlySummaryUseCase(repository)
+
+    dto_request = timesheet_dtos.MonthlySummaryRequest(
+        employee_id=employee_id,
+        year_month=year_month
+    )
+
+    try:
+        with timed_stage("use_case"):
+            dto_response = await use_case.execute(dto_request)
+    except TimesheetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return DataclassJSONResponse(dto_response)
+
+
+@router.post("/{year_month}/submit", response_model=TimesheetStatusResponse)
+async def submit_timesheet(
+    year_month: str,
+    employee_id: Annotated[str, Depends(get_current_employee_id)],
+    repository: Annotated[AsyncTimesheetRepository, Depends(get_async_timesheet_repository)],
+    request: SubmitTimesheetRequest | None = None
+) -> DataclassJSONResponse:
+    use_case = AsyncSubmitTimesheetUseCase(repository)
+
+    dto_request = timesheet_dtos.SubmitTimesheetRequest(
+        employee_id=employee_id,
+        year_month=year_month,
+        approver_id=request.approver_id if request else None
+    )
+
+    with _review_errors(), timed_stage("use_case"):
+        dto_response = await use_case.execute(dto_request)
+
+    return DataclassJSONResponse(dto_response)
+
+
+@router.post("/{year_month}/employees/{employee_id}/approve", response_model=TimesheetStatusResponse)
+async def approve_timesheet(
+    year_month: str,
+    employee_id: str,
+    reviewer_id: Annotated[str, Depends(get_current_employee_id)],
+    repository: Annotated[AsyncTimesheetRepository, Depends(get_async_timesheet_repository)]
+) -> DataclassJSONResponse:
+    use_case = AsyncApproveTimesheetUseCase(repository)
+
+    dto_request = timesheet_dtos.ReviewTimesheetRequest(
+        employee_id=employee_id,
+        year_month=year_month,
+        reviewer_id=reviewer_id
+    )
+
+    with _review_errors(), timed_stage("use_case"):
+        dto_response = await use_case.execute(dto_request)
+
+    return DataclassJSONResponse(dto_response)
+
+
+@router.post("/{year_month}/employees/{employee_id}/reject", response_model=TimesheetStatusResponse)
+async def reject_timesheet(
+    year_month: str,
+    employee_id: str,
+    reviewer_id: Annotated[str, Depends(get_current_employee_id)],
+    repository: Annotated[AsyncTimesheetRepository, Depends(get_async_timesheet_repository)],
+    request: RejectTimesheetRequest | None = None
+) -> DataclassJSONResponse:
+    use_case = AsyncRejectTimesheetUseCase(repository)
+
+    dto_request = timesheet_dtos.ReviewTimesheetRequest(
+        employee_id=employee_id,
+        year_month=year_month,
+        reviewer_id=reviewer_id,
+        comment=request.comment if request else None
+    )
+
+    with _review_errors(), timed_stage("use_case"):
+        dto_response = await use_case.execute(dto_request)
+
+    return DataclassJSONResponse(dto_response)
+
+
+@router.post("/{year_month}/approvals:batch", response_model=BulkApproveTimesheetsResponse)
+async def bulk_approve_timesheets(
+    year_month: str,
+    reviewer_id: Annotated[str, Depends(get_current_employee_id)],
+    repository: Annotated[TimesheetRepository, Depends(get_timesheet_repository)],
+    request: BulkApproveTimesheetsRequest | None = None
+) -> DataclassJSONResponse:
+    """Approve the listed employees' timesheets, or every submitted timesheet
+    assigned to the caller when no list is given. Failures are reported per
+    employee; the request itself only fails for a malformed month."""
+    use_case = BulkApproveTimesheetsUseCase(repository)
+
+    dto_request = timesheet_dtos.BulkApproveTimesheetsRequest(
+        year_month=year_month,
+        reviewer_id=reviewer_id,
+        employee_ids=request.employee_ids if request else None
+    )
+
+    # Chunks are written with the blocking save_all, off the event loop
+    with _review_errors(), timed_stage("use_case"):
+        dto_response = await run_in_threadpool(use_case.execute, dto_request)
+
+    return DataclassJSONResponse(dto_response)
+
+
+@contextmanager
+def _review_errors() -> Iterator[None]:
+    try:
+        yield
+    except TimesheetNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except NotTimesheetApproverError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except (InvalidStateTransitionError, ConcurrencyConflictError) as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
 
 class ClockInRequest(BaseModel):
@@ -132,4 +132,110 @@ class EndBreakResponse(BaseModel):
                 "current_state": "clocked_in",
                 "break_duration_minutes": 60
             }
+        }
+
+
+class AttendanceEventItem(BaseModel):
+    employee_id: str
+    event_type: Literal["clock_in", "start_break", "end_break", "clock_out"]
+    occurred_at: datetime
+    site_id: Optional[str] = None
+
+
+class AttendanceEventsBatchRequest(BaseModel):
+    events: List[AttendanceEventItem]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "events": [
+                    {
+                        "employee_id": "EMP001",
+                        "event_type": "clock_in",
+                        "occurred_at": "2024-01-15T09:00:00"
+                    },
+                    {
+                        "employee_id": "EMP002",
+                        "event_type": "clock_in",
+                        "occurred_at": "2024-01-15T09:02:00"
+                    }
+                ]
+            }
+        }
+
+
+class AttendanceEventResult(BaseModel):
+    index: int
+    employee_id: str
+    event_type: str
+    occurred_at: str
+    success: bool
+    message: str
+    current_state: str
+
+
+class AttendanceEventsBatchResponse(BaseModel):
+    processed: int
+    succeeded: int
+    failed: int
+    results: List[AttendanceEventResult]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "processed": 2,
+                "succeeded": 1,
+                "failed": 1,
+                "results": [
+                    {
+                        "index": 0,
+                        "employee_id": "EMP001",
+                        "event_type": "clock_in",
+                        "occurred_at": "2024-01-15T09:00:00",
+                        "success": True,
+                        "message": "Successfully clocked in",
+                        "current_state": "clocked_in"
+                    },
+                    {
+                        "index": 1,
+                        "employee_id": "EMP002",
+                        "event_type": "clock_in",
+                        "occurred_at": "2024-01-15T09:02:00",
+                        "success": False,
+                        "message": "Cannot clock in when state is clocked_in",
+                        "current_state": "error"
+                    }
+                ]
+            }
+        }
+
+
+class AttendanceImportError(BaseModel):
+    line_number: int
+    message: str
+
+
+class ImportAttendanceResponse(BaseModel):
+    rows_read: int
+    rows_imported: int
+    rows_failed: int
+    elapsed_seconds: float
+    rows_per_second: float
+    errors: List[AttendanceImportError]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "rows_read": 120000,
+                "rows_imported": 119998,
+                "rows_failed": 2,
+                "elapsed_seconds": 4.2,
+                "rows_per_second": 28571.4,
+                "errors": [
+                    {
+                        "line_number": 5310,
+                        "message": "Clock out time 2024-01-15T08:00:00 must be after clock in time 2024-01-15T09:00:00"
+                    }
+                ]
+            }
         }
\ No newline at end of file
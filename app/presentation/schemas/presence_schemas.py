@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class PresenceEvent(BaseModel):
+    employee_id: str
+    site_id: Optional[str] = None
+    event_type: str
+    current_state: str
+    occurred_at: str
+
+
+class PresenceSnapshotResponse(BaseModel):
+    present: List[PresenceEvent]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "present": [
+                    {
+                        "employee_id": "EMP001",
+                        "site_id": "PLANT-A",
+                        "event_type": "start_break",
+                        "current_state": "on_break",
+                        "occurred_at": "2024-01-15T12:00:00"
+                    }
+                ]
+            }
+        }
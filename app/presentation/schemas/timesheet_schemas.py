@@ -0,0 +1,113 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class MonthlySummaryResponse(BaseModel):
+    employee_id: str
+    year_month: str
+    status: str
+    total_worked_minutes: int
+    total_break_minutes: int
+    overtime_minutes: int
+    days_present: int
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "employee_id": "EMP001",
+                "year_month": "2024-01",
+                "status": "draft",
+                "total_worked_minutes": 9660,
+                "total_break_minutes": 1200,
+                "overtime_minutes": 60,
+                "days_present": 20
+            }
+        }
+
+
+class SubmitTimesheetRequest(BaseModel):
+    approver_id: Optional[str] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "approver_id": "MGR001"
+            }
+        }
+
+
+class RejectTimesheetRequest(BaseModel):
+    comment: Optional[str] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "comment": "Missing clock out on 2024-01-12"
+            }
+        }
+
+
+class TimesheetStatusResponse(BaseModel):
+    employee_id: str
+    year_month: str
+    status: str
+    approver_id: Optional[str] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "employee_id": "EMP001",
+                "year_month": "2024-01",
+                "status": "submitted",
+                "approver_id": "MGR001"
+            }
+        }
+
+
+class BulkApproveTimesheetsRequest(BaseModel):
+    # Omit to approve every submitted timesheet assigned to the caller
+    employee_ids: Optional[List[str]] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "employee_ids": ["EMP001", "EMP002"]
+            }
+        }
+
+
+class TimesheetApprovalResult(BaseModel):
+    employee_id: str
+    success: bool
+    message: str
+    status: str
+
+
+class BulkApproveTimesheetsResponse(BaseModel):
+    processed: int
+    succeeded: int
+    failed: int
+    results: List[TimesheetApprovalResult]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "processed": 2,
+                "succeeded": 1,
+                "failed": 1,
+                "results": [
+                    {
+                        "employee_id": "EMP001",
+                        "success": True,
+                        "message": "Successfully approved timesheet",
+                        "status": "approved"
+                    },
+                    {
+                        "employee_id": "EMP002",
+                        "success": False,
+                        "message": "Cannot approve timesheet with status draft",
+                        "status": "draft"
+                    }
+                ]
+            }
+        }
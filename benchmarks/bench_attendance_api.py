@@ -0,0 +1,302 @@
+"""Load-test the attendance API with a synthetic working day.
+
+Each simulated day has a morning clock-in burst, a midday phase where most
+employees take a break and some check their monthly summary, and an
+end-of-day clock-out. Every (mode, backend) combination runs in a fresh
+process configured through the same environment variables as the server:
+
+- ``inprocess`` drives ``app.main:app`` through httpx's ASGI transport, so
+  it measures the application without any network or server overhead
+- ``socket`` starts uvicorn on a local port and sends real HTTP requests;
+  the load generator shares the machine's CPUs with the server, so compare
+  socket results only with runs from the same host
+
+Throughput and p50/p95/p99 latency are reported per endpoint and the full
+results are written as JSON, so runs before and after a change can be diffed.
+
+Usage: python -m benchmarks.bench_attendance_api [--employees N] [--days N]
+           [--concurrency N] [--modes inprocess,socket]
+           [--backends memory,sqlite,event_log] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+MODES = ("inprocess", "socket")
+BACKENDS = ("memory", "sqlite", "event_log")
+
+# (endpoint name, method, path, JSON body, employee ID)
+_Call = Tuple[str, str, str, Optional[Dict[str, Any]], str]
+
+
+def build_day(employees: int, day: datetime, rng: random.Random) -> List[List[_Call]]:
+    """The three phases of one working day; calls within a phase run concurrently"""
+    ids = [f"EMP{n:06d}" for n in range(employees)]
+    morning, midday, evening = [], [], []
+
+    for employee_id in ids:
+        # Most arrivals land in the ten minutes around nine
+        arrival = day.replace(hour=8, minute=55) + timedelta(seconds=rng.randint(0, 600))
+        morning.append(_punch("clock-in", employee_id, "clock_in_time", arrival))
+
+        if rng.random() < 0.7:
+            break_start = day.replace(hour=12) + timedelta(minutes=rng.randint(0, 60))
+            break_end = break_start + timedelta(minutes=rng.randint(15, 60))
+            midday.append(_punch("start-break", employee_id, "break_start_time", break_start))
+            midday.append(_punch("end-break", employee_id, "break_end_time", break_end))
+        if rng.random() < 0.2:
+            midday.append((
+                "summary", "GET", f"/v1/timesheets/{day:%Y-%m}/summary", None, employee_id
+            ))
+
+        departure = day.replace(hour=17, minute=30) + timedelta(seconds=rng.randint(0, 3600))
+        evening.append(_punch("clock-out", employee_id, "clock_out_time", departure))
+
+    # A break has to start before it ends, so keep each employee's pair in
+    # order but interleave employees
+    midday = _interleave(midday, rng)
+    rng.shuffle(morning)
+    rng.shuffle(evening)
+    return [morning, midday, evening]
+
+
+def _punch(endpoint: str, employee_id: str, field: str, at: datetime) -> _Call:
+    return (endpoint, "POST", f"/v1/attendance/{endpoint}", {field: at.isoformat()}, employee_id)
+
+
+def _interleave(calls: List[_Call], rng: random.Random) -> List[_Call]:
+    per_employee: Dict[str, List[_Call]] = {}
+    for call in calls:
+        per_employee.setdefault(call[4], []).append(call)
+    queues = list(per_employee.values())
+    ordered = []
+    while queues:
+        queue = queues[rng.randrange(len(queues))]
+        ordered.append(queue.pop(0))
+        if not queue:
+            queues.remove(queue)
+    return ordered
+
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    calls: List[_Call],
+    concurrency: int,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int]
+) -> None:
+    pending = iter(calls)
+    # One employee's calls must not overtake each other
+    busy: Dict[str, asyncio.Lock] = {}
+
+    async def worker() -> None:
+        for endpoint, method, path, body, employee_id in pending:
+            lock = busy.setdefault(employee_id, asyncio.Lock())
+            async with lock:
+                started = time.perf_counter()
+                response = await client.request(
+                    method, path, json=body, headers={"X-Employee-ID": employee_id}
+                )
+                latencies.setdefault(endpoint, []).append(time.perf_counter() - started)
+                if response.status_code >= 400:
+                    errors[endpoint] = errors.get(endpoint, 0) + 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def drive(client: httpx.AsyncClient, args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    latencies: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    first_day = datetime(2024, 1, 1)
+
+    started = time.perf_counter()
+    for offset in range(args.days):
+        for phase in build_day(args.employees, first_day + timedelta(days=offset), rng):
+            await run_phase(client, phase, args.concurrency, latencies, errors)
+    elapsed = time.perf_counter() - started
+
+    total = sum(len(samples) for samples in latencies.values())
+    return {
+        "requests": total,
+        "errors": sum(errors.values()),
+        "elapsed_seconds": elapsed,
+        "requests_per_second": total / elapsed,
+        "endpoints": {
+            endpoint: _summarize(samples, errors.get(endpoint, 0), elapsed)
+            for endpoint, samples in sorted(latencies.items())
+        },
+    }
+
+
+def _summarize(samples: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    samples = sorted(samples)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "requests_per_second": len(samples) / elapsed,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": _percentile(samples, 0.50) * 1000,
+        "p95_ms": _percentile(samples, 0.95) * 1000,
+        "p99_ms": _percentile(samples, 0.99) * 1000,
+    }
+
+
+def _percentile(sorted_samples: List[float], q: float) -> float:
+    return sorted_samples[max(int(len(sorted_samples) * q) - 1, 0)]
+
+
+def _backend_environment(backend: str, workdir: str) -> Dict[str, str]:
+    return {
+        "TIMESHEET_REPOSITORY": backend,
+        "TIMESHEET_SQLITE_PATH": str(Path(workdir) / "attendance.db"),
+        "TIMESHEET_EVENT_LOG_DIR": str(Path(workdir) / "timesheets"),
+    }
+
+
+def run_inprocess(backend: str, args: argparse.Namespace) -> Dict[str, Any]:
+    # Runs in a fresh process: the dependencies read their configuration
+    # from the environment when app.main is first imported
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ.update(_backend_environment(backend, workdir))
+        from app.main import app
+
+        async def main() -> Dict[str, Any]:
+            async with app.router.lifespan_context(app):
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                    return await drive(client, args)
+
+        return asyncio.run(main())
+
+
+def run_socket(backend: str, args: argparse.Namespace) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as workdir:
+        port = _free_port()
+        env = {**os.environ, **_backend_environment(backend, workdir)}
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "app.main:app",
+                "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+                "--no-access-log"
+            ],
+            env=env
+        )
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            _wait_until_ready(base_url, server)
+            limits = httpx.Limits(max_connections=args.concurrency)
+
+            async def main() -> Dict[str, Any]:
+                async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+                    return await drive(client, args)
+
+            return asyncio.run(main())
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(base_url: str, server: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+        try:
+            httpx.get(f"{base_url}/ping", timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError("uvicorn did not start in time")
+
+
+def run(mode: str, backend: str, args: argparse.Namespace) -> Dict[str, Any]:
+    runner = run_inprocess if mode == "inprocess" else run_socket
+    return {"mode": mode, "backend": backend, **runner(backend, args)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    modes = [mode for mode in args.modes.split(",") if mode]
+    backends = [backend for backend in args.backends.split(",") if backend]
+    for name, values, allowed in (("mode", modes, MODES), ("backend", backends, BACKENDS)):
+        unknown = set(values) - set(allowed)
+        if unknown:
+            parser.error(f"unknown {name}: {', '.join(sorted(unknown))}")
+
+    runs = []
+    print(f"{'mode':<10} {'backend':<10} {'endpoint':<12} {'reqs':>7} {'err':>5} "
+          f"{'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    context = multiprocessing.get_context("spawn")
+    for mode in modes:
+        for backend in backends:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run, mode, backend, args).result()
+            runs.append(result)
+            for endpoint, stats in result["endpoints"].items():
+                _print_row(mode, backend, endpoint, stats)
+            _print_row(mode, backend, "all", {
+                "requests": result["requests"],
+                "errors": result["errors"],
+                "requests_per_second": result["requests_per_second"],
+                "p50_ms": None, "p95_ms": None, "p99_ms": None,
+            })
+
+    if args.output:
+        results = {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parameters": {
+                "employees": args.employees,
+                "days": args.days,
+                "concurrency": args.concurrency,
+                "seed": args.seed,
+            },
+            "runs": runs,
+        }
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+
+def _print_row(mode: str, backend: str, endpoint: str, stats: Dict[str, Any]) -> None:
+    latencies = " ".join(
+        f"{stats[key]:>8.3f}" if stats[key] is not None else f"{'':>8}"
+        for key in ("p50_ms", "p95_ms", "p99_ms")
+    )
+    print(f"{mode:<10} {backend:<10} {endpoint:<12} {stats['requests']:>7} {stats['errors']:>5} "
+          f"{stats['requests_per_second']:>8.0f} {latencies}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Microbenchmarks for the domain code that runs on every punch and summary.
+
+Usage: python -m benchmarks.bench_domain [--filter TEXT] [--save FILE]
+           [--compare FILE] [--threshold RATIO]
+
+Each case reports the best per-call time over several repeats. --save
+writes the timings to a JSON baseline; --compare checks the current run
+against one and exits with status 1 if any case got slower than
+``threshold`` times its baseline. Timings only compare meaningfully on the
+machine and Python version the baseline was recorded with.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+import uuid
+from datetime import date, datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from app.domain.models import (
+    Timesheet,
+    TimesheetId,
+    EmployeeId,
+    YearMonth,
+    Date,
+    DateTime,
+    Minutes,
+    AttendanceEntry,
+    AttendanceState,
+    BreakInterval
+)
+
+# (name, statement, calls per repeat, operations per statement)
+_Case = Tuple[str, Callable[[], object], int, int]
+
+_JANUARY = [Date(date(2024, 1, day)) for day in range(1, 32)]
+
+
+def disjoint_breaks(count: int) -> List[BreakInterval]:
+    start = datetime(2024, 1, 15, 9)
+    return [
+        BreakInterval(
+            start_at=DateTime(start + timedelta(minutes=10 * n)),
+            end_at=DateTime(start + timedelta(minutes=10 * n + 5))
+        )
+        for n in range(count)
+    ]
+
+
+def worked_entry(day: date, breaks: int = 2) -> AttendanceEntry:
+    start = datetime.combine(day, datetime.min.time()).replace(hour=8)
+    return AttendanceEntry(
+        date=Date(day),
+        state=AttendanceState.CLOCKED_OUT,
+        clock_in_at=DateTime(start),
+        clock_out_at=DateTime(start + timedelta(hours=10)),
+        breaks=[
+            BreakInterval(
+                start_at=DateTime(start + timedelta(hours=2 + 2 * n)),
+                end_at=DateTime(start + timedelta(hours=2 + 2 * n, minutes=30))
+            )
+            for n in range(breaks)
+        ]
+    )
+
+
+def full_month() -> Timesheet:
+    timesheet = Timesheet(
+        timesheet_id=TimesheetId(str(uuid.uuid4())),
+        employee_id=EmployeeId("EMP000001"),
+        year_month=YearMonth(2024, 1)
+    )
+    for day in range(1, 32):
+        timesheet.add_or_update_entry(worked_entry(date(2024, 1, day)))
+    return timesheet
+
+
+def create_month_of_entries() -> None:
+    timesheet = Timesheet(
+        timesheet_id=TimesheetId("bench"),
+        employee_id=EmployeeId("EMP000001"),
+        year_month=YearMonth(2024, 1)
+    )
+    for day in _JANUARY:
+        timesheet.get_or_create_entry(day)
+
+
+def cases() -> List[_Case]:
+    now = datetime(2024, 1, 15, 9)
+    today = date(2024, 1, 15)
+    entry = worked_entry(today)
+    month = full_month()
+    existing_day = Date(today)
+
+    result: List[_Case] = []
+    for count in (1, 4, 16, 64):
+        breaks = disjoint_breaks(count)
+        result.append((
+            f"validate_no_overlaps[{count}]",
+            partial(BreakInterval.validate_no_overlaps, breaks),
+            max(20_000 // (count * count), 50),
+            1
+        ))
+    micro_breaks = disjoint_breaks(64)
+    result.append((
+        # Rehydrating an entry from storage validates its breaks
+        "AttendanceEntry(breaks)[64]",
+        lambda: AttendanceEntry(date=existing_day, breaks=micro_breaks),
+        2_000,
+        1
+    ))
+    result += [
+        ("calculate_worked_minutes", entry.calculate_worked_minutes, 100_000, 1),
+        ("calculate_overtime_minutes", month.calculate_overtime_minutes, 100_000, 1),
+        ("calculate_overtime_minutes[7h]", lambda: month.calculate_overtime_minutes(7), 5_000, 1),
+        ("get_or_create_entry[existing]", lambda: month.get_or_create_entry(existing_day), 100_000, 1),
+        # A fresh timesheet filled one day at a time
+        ("get_or_create_entry[new]", create_month_of_entries, 2_000, len(_JANUARY)),
+        ("DateTime(datetime)", lambda: DateTime(now), 200_000, 1),
+        ("Date(date)", lambda: Date(today), 200_000, 1),
+        ("Minutes(int)", lambda: Minutes(480), 200_000, 1),
+        ("YearMonth(year, month)", lambda: YearMonth(2024, 1), 200_000, 1),
+    ]
+    return result
+
+
+def measure(statement: Callable[[], object], number: int) -> float:
+    """Best nanoseconds per call over five repeats"""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--save", help="write the timings to this JSON baseline")
+    parser.add_argument("--compare", help="compare against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio that fails --compare (default 1.25)")
+    args = parser.parse_args()
+
+    baseline: Dict[str, float] = {}
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["results"]
+
+    results: Dict[str, float] = {}
+    regressions = []
+    print(f"{'case':<32} {'per call':>13} {'baseline':>13} {'ratio':>7}")
+    for name, statement, number, operations in cases():
+        if args.filter not in name:
+            continue
+        nanoseconds = measure(statement, number) / operations
+        results[name] = nanoseconds
+
+        line = f"{name:<32} {nanoseconds:>10.0f} ns"
+        if name in baseline:
+            ratio = nanoseconds / baseline[name]
+            line += f" {baseline[name]:>10.0f} ns {ratio:>7.2f}"
+            if ratio > args.threshold:
+                regressions.append(name)
+                line += "  SLOWER"
+        print(line)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps({
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }, indent=2) + "\n")
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than {args.threshold}x the baseline: "
+              f"{', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Time the payroll export against per-timesheet domain calculations.
+
+Usage: python -m benchmarks.bench_payroll_export [--employees N] [--days N] [--backend memory|sqlite]
+
+Every employee's exported worked and overtime minutes are checked against
+Timesheet.calculate_total_worked_minutes and calculate_overtime_minutes.
+"""
+import argparse
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Tuple
+
+from app.application.dtos.payroll_dtos import ExportPayrollRequest
+from app.application.usecases import export_payroll_usecase
+from app.application.usecases.export_payroll_usecase import ExportPayrollUseCase
+from app.domain.models import (
+    Timesheet,
+    TimesheetId,
+    EmployeeId,
+    YearMonth,
+    Date,
+    DateTime,
+    AttendanceEntry,
+    AttendanceState,
+    BreakInterval
+)
+from app.domain.repositories.timesheet_repository import TimesheetRepository
+from app.infrastructure.repositories import (
+    InMemoryTimesheetRepository,
+    SQLiteTimesheetRepository
+)
+
+
+def random_timesheet(rng: random.Random, employee_id: str, days: int) -> Timesheet:
+    timesheet = Timesheet(
+        timesheet_id=TimesheetId(str(uuid.uuid4())),
+        employee_id=EmployeeId(employee_id),
+        year_month=YearMonth(2024, 1)
+    )
+    for offset in range(days):
+        start = datetime(2024, 1, 1 + offset, 8) + timedelta(microseconds=rng.randrange(7_200_000_000))
+        break_start = start + timedelta(microseconds=rng.randrange(10_800_000_000, 14_400_000_000))
+        break_end = break_start + timedelta(microseconds=rng.randrange(600_000_000, 3_600_000_000))
+        end = break_end + timedelta(microseconds=rng.randrange(10_800_000_000, 25_200_000_000))
+        timesheet.add_or_update_entry(AttendanceEntry(
+            date=Date(start.date()),
+            state=AttendanceState.CLOCKED_OUT,
+            clock_in_at=DateTime(start),
+            clock_out_at=DateTime(end),
+            breaks=[BreakInterval(start_at=DateTime(break_start), end_at=DateTime(break_end))]
+        ))
+    return timesheet
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=22)
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        repository: TimesheetRepository
+        if args.backend == "sqlite":
+            repository = SQLiteTimesheetRepository(str(Path(workdir) / "bench.db"))
+        else:
+            repository = InMemoryTimesheetRepository()
+
+        rng = random.Random(42)
+        expected: Dict[str, Tuple[int, int]] = {}
+        for n in range(args.employees):
+            timesheet = random_timesheet(rng, f"EMP{n:06d}", args.days)
+            expected[timesheet.employee_id] = (
+                timesheet.calculate_total_worked_minutes().value,
+                timesheet.calculate_overtime_minutes().value
+            )
+            repository.save(timesheet)
+
+        started = time.perf_counter()
+        for timesheet in repository.find_all_by_year_month(YearMonth(2024, 1)):
+            timesheet.calculate_total_worked_minutes()
+            timesheet.calculate_overtime_minutes(standard_hours_per_day=7)
+        scan_seconds = time.perf_counter() - started
+
+        export = ExportPayrollUseCase(repository).execute(ExportPayrollRequest("2024-01"))
+        for employee_id, worked, overtime in zip(
+            export.employee_ids, export.worked_minutes, export.overtime_minutes
+        ):
+            if expected[employee_id] != (worked, overtime):
+                raise SystemExit(f"Mismatch for {employee_id}: {expected[employee_id]} != {(worked, overtime)}")
+
+        close = getattr(repository, "close", None)
+        if close:
+            close()
+
+    engine = "numpy" if export_payroll_usecase.np is not None else "python"
+    print(f"{len(export.employee_ids)} employees x {args.days} days ({args.backend}, {engine})")
+    print(f"per-entry domain scan: {scan_seconds:.3f}s")
+    print(f"columnar export:       {export.elapsed_seconds:.3f}s (totals match)")
+
+
+if __name__ == "__main__":
+    main()
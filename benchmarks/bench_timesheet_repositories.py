@@ -0,0 +1,126 @@
+"""Compare timesheet repository backends under the attendance use cases.
+
+Usage: python -m benchmarks.bench_timesheet_repositories [--employees N] [--days N] [--threads N]
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Union
+
+from app.application.dtos.attendance_dtos import (
+    ClockInRequest,
+    ClockInResponse,
+    ClockOutRequest,
+    ClockOutResponse,
+    StartBreakRequest,
+    StartBreakResponse,
+    EndBreakRequest,
+    EndBreakResponse
+)
+from app.application.usecases.clock_in_usecase import ClockInUseCase
+from app.application.usecases.clock_out_usecase import ClockOutUseCase
+from app.application.usecases.start_break_usecase import StartBreakUseCase
+from app.application.usecases.end_break_usecase import EndBreakUseCase
+from app.domain.repositories.timesheet_repository import TimesheetRepository
+from app.infrastructure.repositories import (
+    InMemoryTimesheetRepository,
+    EventLogTimesheetRepository,
+    SQLiteTimesheetRepository,
+    CachingTimesheetRepository,
+    WriteBehindTimesheetRepository
+)
+
+StepResponse = Union[ClockInResponse, StartBreakResponse, EndBreakResponse, ClockOutResponse]
+
+
+def run_workday(repository: TimesheetRepository, employee_id: str, day: datetime) -> List[float]:
+    steps: List[Callable[[], StepResponse]] = [
+        lambda: ClockInUseCase(repository).execute(
+            ClockInRequest(employee_id, day.replace(hour=9))),
+        lambda: StartBreakUseCase(repository).execute(
+            StartBreakRequest(employee_id, day.replace(hour=12))),
+        lambda: EndBreakUseCase(repository).execute(
+            EndBreakRequest(employee_id, day.replace(hour=13))),
+        lambda: ClockOutUseCase(repository).execute(
+            ClockOutRequest(employee_id, day.replace(hour=18))),
+    ]
+    latencies = []
+    for step in steps:
+        started = time.perf_counter()
+        response = step()
+        latencies.append(time.perf_counter() - started)
+        if not response.success:
+            raise RuntimeError(response.message)
+    return latencies
+
+
+def bench(
+    name: str,
+    factory: Callable[[], TimesheetRepository],
+    employees: int,
+    days: int,
+    threads: int
+) -> Dict[str, Any]:
+    repository = factory()
+    latencies: List[float] = []
+    first_day = datetime(2024, 1, 1)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            for result in executor.map(
+                lambda n: run_workday(repository, f"EMP{n:06d}", day),
+                range(employees)
+            ):
+                latencies.extend(result)
+    # Closing drains buffered saves, so it counts towards the elapsed time
+    close = getattr(repository, "close", None)
+    if close:
+        close()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "backend": name,
+        "operations": len(latencies),
+        "ops_per_second": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        backends: Dict[str, Callable[[], TimesheetRepository]] = {
+            "memory": InMemoryTimesheetRepository,
+            "sqlite": lambda: SQLiteTimesheetRepository(str(Path(workdir) / "bench.db")),
+            "sqlite+lru": lambda: CachingTimesheetRepository(
+                SQLiteTimesheetRepository(str(Path(workdir) / "bench-cached.db"))
+            ),
+            "sqlite+wb": lambda: WriteBehindTimesheetRepository(CachingTimesheetRepository(
+                SQLiteTimesheetRepository(str(Path(workdir) / "bench-write-behind.db"))
+            )),
+            "event_log": lambda: EventLogTimesheetRepository(str(Path(workdir) / "log")),
+        }
+        print(f"{'backend':<12} {'ops':>8} {'ops/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, factory in backends.items():
+            result = bench(name, factory, args.employees, args.days, args.threads)
+            print(
+                f"{result['backend']:<12} {result['operations']:>8} "
+                f"{result['ops_per_second']:>10.0f} {result['p50_ms']:>8.3f} {result['p99_ms']:>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Construction and memory microbenchmarks for the domain value objects.
+
+Usage: python -m benchmarks.bench_value_objects [--employees N] [--months N] [--days N]
+
+The memory figure is the traced allocation for a run of timesheets held in
+memory, extrapolated to 20k employees.
+"""
+import argparse
+import copy
+import timeit
+import tracemalloc
+import uuid
+from datetime import date, datetime, timedelta
+from typing import List
+
+from app.domain.models import (
+    Timesheet,
+    TimesheetId,
+    EmployeeId,
+    YearMonth,
+    Date,
+    DateTime,
+    Minutes,
+    AttendanceEntry,
+    AttendanceState,
+    BreakInterval
+)
+
+
+def build_timesheets(employees: int, months: int, days: int) -> List[Timesheet]:
+    timesheets = []
+    for n in range(employees):
+        for month in range(1, months + 1):
+            timesheet = Timesheet(
+                timesheet_id=TimesheetId(str(uuid.uuid4())),
+                employee_id=EmployeeId(f"EMP{n:06d}"),
+                year_month=YearMonth(2024, month)
+            )
+            for day in range(1, days + 1):
+                start = datetime(2024, month, day, 9)
+                timesheet.add_or_update_entry(AttendanceEntry(
+                    date=Date(start.date()),
+                    state=AttendanceState.CLOCKED_OUT,
+                    clock_in_at=DateTime(start),
+                    clock_out_at=DateTime(start + timedelta(hours=9)),
+                    breaks=[BreakInterval(
+                        start_at=DateTime(start + timedelta(hours=3)),
+                        end_at=DateTime(start + timedelta(hours=4))
+                    )]
+                ))
+            timesheets.append(timesheet)
+    return timesheets
+
+
+def report(name: str, statement, number: int) -> None:
+    seconds = min(timeit.repeat(statement, number=number, repeat=5))
+    print(f"{name:<28} {seconds / number * 1e9:>10.0f} ns")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--days", type=int, default=22)
+    args = parser.parse_args()
+
+    now = datetime(2024, 1, 15, 9)
+    today = date(2024, 1, 15)
+    earlier, later = DateTime(now), DateTime(now + timedelta(hours=1))
+    print(f"{'operation':<28} {'per call':>13}")
+    report("DateTime(datetime)", lambda: DateTime(now), 200_000)
+    report("Date(date)", lambda: Date(today), 200_000)
+    report("Minutes(int)", lambda: Minutes(480), 200_000)
+    report("YearMonth(year, month)", lambda: YearMonth(2024, 1), 200_000)
+    report("YearMonth.from_string", lambda: YearMonth.from_string("2024-01"), 200_000)
+    report("DateTime < DateTime", lambda: earlier < later, 200_000)
+
+    tracemalloc.start()
+    timesheets = build_timesheets(args.employees, args.months, args.days)
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report("deepcopy(Timesheet)", lambda: copy.deepcopy(timesheets[0]), 200)
+
+    per_employee = traced / args.employees
+    print(
+        f"\n{len(timesheets)} timesheets x {args.days} entries: {traced / 2**20:.1f} MiB, "
+        f"{per_employee / 1024:.1f} KiB per employee, "
+        f"~{per_employee * 20_000 / 2**30:.2f} GiB for 20k employees"
+    )
+
+
+if __name__ == "__main__":
+    main()
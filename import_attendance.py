@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+import argparse
+import io
+import os
+import sys
+from app.application.usecases.import_attendance_usecase import (
+    ImportAttendanceUseCase,
+    DEFAULT_CHUNK_SIZE
+)
+from app.infrastructure.importers import read_attendance_records, SUPPORTED_FORMATS
+from app.presentation.dependencies import get_timesheet_repository, close_repositories
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import historical attendance from NDJSON or CSV")
+    parser.add_argument("path", help="file to import, or - for stdin")
+    parser.add_argument("--format", choices=SUPPORTED_FORMATS, help="defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--allow-memory",
+        action="store_true",
+        help="import into the in-memory store anyway; it is discarded on exit, so this only validates the file"
+    )
+    args = parser.parse_args()
+
+    # The in-memory store lives only as long as this process
+    if os.environ.get("TIMESHEET_REPOSITORY", "memory") == "memory" and not args.allow_memory:
+        parser.error(
+            "TIMESHEET_REPOSITORY is memory, so nothing would be kept; set it to sqlite or "
+            "event_log, or pass --allow-memory to only validate the file"
+        )
+
+    file_format = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+
+    def report(progress):
+        print(
+            f"\r{progress.rows_read} rows read, {progress.rows_imported} imported, "
+            f"{progress.rows_failed} failed ({progress.rows_per_second:,.0f} rows/s)",
+            end="",
+            file=sys.stderr
+        )
+
+    use_case = ImportAttendanceUseCase(
+        get_timesheet_repository(),
+        chunk_size=args.chunk_size,
+        on_progress=report
+    )
+
+    if args.path == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    else:
+        stream = open(args.path, encoding="utf-8", newline="")
+    try:
+        response = use_case.execute(read_attendance_records(stream, file_format))
+    finally:
+        stream.close()
+        close_repositories()
+
+    print(file=sys.stderr)
+    for error in response.errors:
+        print(f"line {error.line_number}: {error.message}", file=sys.stderr)
+    print(
+        f"Imported {response.rows_imported} of {response.rows_read} rows in "
+        f"{response.elapsed_seconds:.1f}s ({response.rows_per_second:,.0f} rows/s)"
+    )
+    return 1 if response.rows_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+import argparse
+import sys
+from typing import Dict, Iterator, List, Union
+from app.domain.models import YearMonth
+from app.infrastructure.repositories import (
+    EventLogTimesheetRepository,
+    SQLiteTimesheetRepository,
+    ShardedTimesheetRepository,
+    rebalance_timesheets
+)
+
+_ShardRepository = Union[SQLiteTimesheetRepository, EventLogTimesheetRepository]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Move timesheets between shards after TIMESHEET_SHARDS changes. "
+                    "Stop the API first."
+    )
+    parser.add_argument("--backend", choices=("sqlite", "event_log"), default="sqlite")
+    parser.add_argument("--from", dest="source", required=True, help="current shard locations, comma separated")
+    parser.add_argument("--to", dest="target", required=True, help="new shard locations, comma separated")
+    parser.add_argument("--months", required=True, help="year-months to move, e.g. 2024-01:2024-12")
+    args = parser.parse_args()
+
+    source_locations = _split(args.source)
+    target_locations = _split(args.target)
+    repositories: Dict[str, _ShardRepository] = {
+        location: _open_shard(args.backend, location)
+        for location in dict.fromkeys(source_locations + target_locations)
+    }
+    source = ShardedTimesheetRepository(
+        {location: repositories[location] for location in source_locations}
+    )
+    target = ShardedTimesheetRepository(
+        {location: repositories[location] for location in target_locations}
+    )
+    try:
+        stats = rebalance_timesheets(source, target, _year_months(args.months))
+    finally:
+        for repository in repositories.values():
+            repository.close()
+
+    print(f"Moved {stats.moved} of {stats.examined} timesheets")
+    return 0
+
+
+def _split(locations: str) -> List[str]:
+    return [location for location in locations.split(",") if location]
+
+
+def _open_shard(backend: str, location: str) -> _ShardRepository:
+    if backend == "event_log":
+        return EventLogTimesheetRepository(location)
+    return SQLiteTimesheetRepository(location)
+
+
+def _year_months(value: str) -> Iterator[YearMonth]:
+    first, _, last = value.partition(":")
+    year_month = YearMonth.from_string(first)
+    end = YearMonth.from_string(last or first)
+    while (year_month.year, year_month.month) <= (end.year, end.month):
+        yield year_month
+        if year_month.month == 12:
+            year_month = YearMonth(year=year_month.year + 1, month=1)
+        else:
+            year_month = YearMonth(year=year_month.year, month=year_month.month + 1)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,41 @@
 #!/usr/bin/env python
+import argparse
+import os
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", reload=True)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the attendance API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", "1")),
+        help="worker processes; more than one requires the shared sqlite backend"
+    )
+    parser.add_argument(
+        "--reload",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="reload on code changes (default: on with a single worker)"
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.reload and args.workers > 1:
+        parser.error("--reload runs a single process and cannot be combined with --workers")
+
+    if args.workers > 1:
+        # Every worker is a separate process with its own module globals, so
+        # they can only share state through the SQLite database
+        os.environ.setdefault("TIMESHEET_REPOSITORY", "sqlite")
+    # Workers read this to pick settings that are safe across processes
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+
+    uvicorn.run(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        reload=args.reload if args.reload is not None else args.workers == 1
+    )
@@ -0,0 +1,117 @@
+import threading
+from datetime import date, datetime
+
+from app.domain.exceptions import ConcurrencyConflictError
+from app.domain.models import (
+    AttendanceState,
+    Date,
+    DateTime,
+    EmployeeId,
+    Timesheet,
+    TimesheetId,
+    YearMonth
+)
+from app.infrastructure.repositories import SQLiteTimesheetRepository
+
+
+JANUARY = YearMonth(2024, 1)
+
+
+def work_day(timesheet: Timesheet, day: int, breaks: int = 1) -> None:
+    entry = timesheet.get_or_create_entry(Date(date(2024, 1, day)))
+    entry.clock_in(DateTime(datetime(2024, 1, day, 9)))
+    for hour in range(12, 12 + breaks):
+        entry.start_break(DateTime(datetime(2024, 1, day, hour)))
+        entry.end_break(DateTime(datetime(2024, 1, day, hour, 30)))
+    entry.clock_out(DateTime(datetime(2024, 1, day, 18)))
+
+
+def test_saved_timesheet_loads_back_unchanged(tmp_path):
+    path = str(tmp_path / "timesheets.db")
+    timesheet = Timesheet(TimesheetId("ts-1"), EmployeeId("EMP001"), JANUARY)
+    work_day(timesheet, 2, breaks=2)
+    ongoing = timesheet.get_or_create_entry(Date(date(2024, 1, 3)))
+    ongoing.clock_in(DateTime(datetime(2024, 1, 3, 9)))
+    ongoing.start_break(DateTime(datetime(2024, 1, 3, 12)))
+
+    writer = SQLiteTimesheetRepository(path)
+    writer.save(timesheet)
+    writer.close()
+
+    reader = SQLiteTimesheetRepository(path)
+    loaded = reader.find_by(EmployeeId("EMP001"), JANUARY)
+    reader.close()
+
+    assert loaded == timesheet
+    assert loaded.get_entry(Date(date(2024, 1, 3))).state == AttendanceState.ON_BREAK
+    assert loaded.calculate_total_worked_minutes() == timesheet.calculate_total_worked_minutes()
+
+
+def test_resaving_drops_removed_breaks_and_entries(tmp_path):
+    repository = SQLiteTimesheetRepository(str(tmp_path / "timesheets.db"))
+    timesheet = Timesheet(TimesheetId("ts-1"), EmployeeId("EMP001"), JANUARY)
+    work_day(timesheet, 2, breaks=3)
+    work_day(timesheet, 3)
+    repository.save(timesheet)
+
+    replacement = Timesheet(
+        TimesheetId("ts-1"), EmployeeId("EMP001"), JANUARY, version=timesheet.version
+    )
+    work_day(replacement, 2, breaks=1)
+    repository.save(replacement)
+
+    loaded = repository.find_by(EmployeeId("EMP001"), JANUARY)
+    repository.close()
+    assert loaded == replacement
+    assert len(loaded.get_entry(Date(date(2024, 1, 2))).breaks) == 1
+
+
+def test_concurrent_writers_from_two_pools_round_trip(tmp_path):
+    # Two repositories on one file stand in for two worker processes
+    path = str(tmp_path / "timesheets.db")
+    repositories = [SQLiteTimesheetRepository(path), SQLiteTimesheetRepository(path)]
+    employees = [EmployeeId(f"EMP{n:03d}") for n in range(3)]
+    days_per_writer = 4
+    writers = 6
+    start = threading.Barrier(writers)
+    errors = []
+
+    def write(writer: int) -> None:
+        repository = repositories[writer % len(repositories)]
+        start.wait()
+        try:
+            for n in range(days_per_writer):
+                day = 2 + writer * days_per_writer + n
+                for employee_id in employees:
+                    while True:
+                        timesheet = repository.find_by(employee_id, JANUARY)
+                        if timesheet is None:
+                            timesheet = Timesheet(
+                                TimesheetId(f"ts-{employee_id}"), employee_id, JANUARY
+                            )
+                        work_day(timesheet, day)
+                        try:
+                            repository.save(timesheet)
+                            break
+                        except ConcurrencyConflictError:
+                            continue
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(writer,)) for writer in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for repository in repositories:
+        repository.close()
+
+    assert errors == []
+    reader = SQLiteTimesheetRepository(path)
+    expected_days = list(range(2, 2 + writers * days_per_writer))
+    for employee_id in employees:
+        loaded = reader.find_by(employee_id, JANUARY)
+        assert sorted(entry_date.day for entry_date in loaded.entries) == expected_days
+        assert loaded.version == len(expected_days)
+        assert all(len(entry.breaks) == 1 for entry in loaded.entries.values())
+    reader.close()
@@ -0,0 +1,156 @@
+import threading
+from datetime import date, datetime
+
+import pytest
+
+from app.application.dtos.attendance_dtos import ClockInRequest
+from app.application.usecases.clock_in_usecase import ClockInUseCase
+from app.application.usecases.conflict_retry import MAX_CONFLICT_ATTEMPTS, retry_on_conflict
+from app.domain.exceptions import ConcurrencyConflictError
+from app.domain.models import Date, DateTime, EmployeeId, Timesheet, TimesheetId, YearMonth
+from app.infrastructure.repositories import (
+    EventLogTimesheetRepository,
+    InMemoryTimesheetRepository,
+    SQLiteTimesheetRepository
+)
+
+
+JANUARY = YearMonth(2024, 1)
+EMPLOYEE = EmployeeId("EMP001")
+
+
+@pytest.fixture(params=["memory", "sqlite", "event_log"])
+def repository(request, tmp_path):
+    if request.param == "memory":
+        repository = InMemoryTimesheetRepository()
+    elif request.param == "sqlite":
+        repository = SQLiteTimesheetRepository(str(tmp_path / "timesheets.db"))
+    else:
+        repository = EventLogTimesheetRepository(str(tmp_path / "log"))
+    yield repository
+    close = getattr(repository, "close", None)
+    if close:
+        close()
+
+
+def clock_in(timesheet: Timesheet, day: int) -> None:
+    entry = timesheet.get_or_create_entry(Date(date(2024, 1, day)))
+    entry.clock_in(DateTime(datetime(2024, 1, day, 9)))
+
+
+def test_save_increments_version(repository):
+    timesheet = Timesheet(TimesheetId("ts-1"), EMPLOYEE, JANUARY)
+    clock_in(timesheet, 2)
+
+    repository.save(timesheet)
+    assert timesheet.version == 1
+
+    loaded = repository.find_by(EMPLOYEE, JANUARY)
+    assert loaded.version == 1
+    clock_in(loaded, 3)
+    repository.save(loaded)
+    assert repository.find_by(EMPLOYEE, JANUARY).version == 2
+
+
+def test_stale_save_is_rejected(repository):
+    timesheet = Timesheet(TimesheetId("ts-1"), EMPLOYEE, JANUARY)
+    repository.save(timesheet)
+
+    first = repository.find_by(EMPLOYEE, JANUARY)
+    second = repository.find_by(EMPLOYEE, JANUARY)
+    clock_in(first, 2)
+    repository.save(first)
+
+    clock_in(second, 3)
+    with pytest.raises(ConcurrencyConflictError):
+        repository.save(second)
+
+    stored = repository.find_by(EMPLOYEE, JANUARY)
+    assert stored.version == 2
+    assert [entry_date.day for entry_date in stored.entries] == [2]
+
+
+def test_creating_an_existing_timesheet_is_rejected(repository):
+    repository.save(Timesheet(TimesheetId("ts-1"), EMPLOYEE, JANUARY))
+
+    with pytest.raises(ConcurrencyConflictError):
+        repository.save(Timesheet(TimesheetId("ts-2"), EMPLOYEE, JANUARY))
+
+
+def test_retry_on_conflict_reruns_the_operation():
+    attempts = []
+
+    def operation():
+        attempts.append(None)
+        if len(attempts) < 3:
+            raise ConcurrencyConflictError("lost the race")
+        return "saved"
+
+    assert retry_on_conflict(operation) == "saved"
+    assert len(attempts) == 3
+
+
+def test_retry_on_conflict_gives_up_after_max_attempts():
+    attempts = []
+
+    def operation():
+        attempts.append(None)
+        raise ConcurrencyConflictError("lost the race")
+
+    with pytest.raises(ConcurrencyConflictError):
+        retry_on_conflict(operation)
+    assert len(attempts) == MAX_CONFLICT_ATTEMPTS
+
+
+def test_clock_in_reloads_and_retries_after_a_conflict(repository):
+    repository.save(Timesheet(TimesheetId("ts-1"), EMPLOYEE, JANUARY))
+    racing_save = threading.Event()
+    find_by = repository.find_by
+
+    def find_by_then_race(employee_id, year_month):
+        timesheet = find_by(employee_id, year_month)
+        if not racing_save.is_set():
+            # Another request saves between this load and its save
+            racing_save.set()
+            other = find_by(employee_id, year_month)
+            clock_in(other, 2)
+            repository.save(other)
+        return timesheet
+
+    repository.find_by = find_by_then_race
+    response = ClockInUseCase(repository).execute(
+        ClockInRequest(employee_id="EMP001", clock_in_time=datetime(2024, 1, 3, 9))
+    )
+
+    assert response.success
+    stored = find_by(EMPLOYEE, JANUARY)
+    assert stored.version == 3
+    assert sorted(entry_date.day for entry_date in stored.entries) == [2, 3]
+
+
+def test_concurrent_writers_never_lose_a_save(repository):
+    threads = 8
+    start = threading.Barrier(threads)
+
+    def write(day: int) -> None:
+        start.wait()
+        while True:
+            timesheet = repository.find_by(EMPLOYEE, JANUARY)
+            if timesheet is None:
+                timesheet = Timesheet(TimesheetId(f"ts-{day}"), EMPLOYEE, JANUARY)
+            clock_in(timesheet, day)
+            try:
+                repository.save(timesheet)
+                return
+            except ConcurrencyConflictError:
+                continue
+
+    workers = [threading.Thread(target=write, args=(day,)) for day in range(2, 2 + threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    stored = repository.find_by(EMPLOYEE, JANUARY)
+    assert sorted(entry_date.day for entry_date in stored.entries) == list(range(2, 2 + threads))
+    assert stored.version == threads
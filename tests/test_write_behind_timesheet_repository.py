@@ -0,0 +1,129 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+from app.domain.exceptions import ConcurrencyConflictError
+from app.domain.models import Date, DateTime, EmployeeId, Timesheet, TimesheetId, YearMonth
+from app.infrastructure.repositories import (
+    AsyncTimesheetRepositoryAdapter,
+    InMemoryTimesheetRepository,
+    WriteBehindTimesheetRepository
+)
+
+
+JANUARY = YearMonth(2024, 1)
+EMPLOYEE = EmployeeId("EMP001")
+
+
+class FailingRepository(InMemoryTimesheetRepository):
+    """Backend whose writes fail, as when the database is unreachable"""
+
+    def save_all(self, timesheets):
+        raise OSError("disk I/O error")
+
+
+@pytest.fixture
+def backend():
+    return InMemoryTimesheetRepository()
+
+
+@pytest.fixture
+def repository(backend):
+    repository = WriteBehindTimesheetRepository(backend, max_delay_seconds=0.001)
+    yield repository
+    repository.close()
+
+
+def clock_in(timesheet: Timesheet, day: int) -> None:
+    entry = timesheet.get_or_create_entry(Date(date(2024, 1, day)))
+    entry.clock_in(DateTime(datetime(2024, 1, day, 9)))
+
+
+def stale_copy(repository, backend) -> Timesheet:
+    """A timesheet loaded through repository, then saved by another writer"""
+    backend.save(Timesheet(TimesheetId("ts-1"), EMPLOYEE, JANUARY))
+    stale = repository.find_by(EMPLOYEE, JANUARY)
+    newer = backend.find_by(EMPLOYEE, JANUARY)
+    clock_in(newer, 2)
+    backend.save(newer)
+    clock_in(stale, 3)
+    return stale
+
+
+def test_save_returns_once_the_backend_has_the_write(repository, backend):
+    timesheet = Timesheet(TimesheetId("ts-1"), EMPLOYEE, JANUARY)
+    clock_in(timesheet, 2)
+
+    repository.save(timesheet)
+
+    stored = backend.find_by(EMPLOYEE, JANUARY)
+    assert stored.version == 1
+    assert [entry_date.day for entry_date in stored.entries] == [2]
+
+
+def test_save_raises_a_conflict_the_backend_finds(repository, backend):
+    stale = stale_copy(repository, backend)
+
+    with pytest.raises(ConcurrencyConflictError):
+        repository.save(stale)
+
+    # The rejected state is dropped, so reads see the backend's copy again
+    reloaded = repository.find_by(EMPLOYEE, JANUARY)
+    assert reloaded.version == 2
+    assert [entry_date.day for entry_date in reloaded.entries] == [2]
+
+
+def test_commit_handle_fails_with_the_backend_conflict(repository, backend):
+    stale = stale_copy(repository, backend)
+
+    handle = repository.save_deferred(stale)
+
+    with pytest.raises(ConcurrencyConflictError):
+        handle.result(timeout=5)
+    assert handle.done()
+
+
+def test_save_all_reports_backend_conflicts_per_timesheet(repository, backend):
+    stale = stale_copy(repository, backend)
+    other = Timesheet(TimesheetId("ts-2"), EmployeeId("EMP002"), JANUARY)
+
+    errors = repository.save_all([stale, other])
+
+    assert isinstance(errors[0], ConcurrencyConflictError)
+    assert errors[1] is None
+    assert backend.find_by(EmployeeId("EMP002"), JANUARY).version == 1
+
+
+@pytest.mark.parametrize("run_in_thread", [False, True])
+def test_async_save_raises_the_backend_conflict(repository, backend, run_in_thread):
+    stale = stale_copy(repository, backend)
+    adapter = AsyncTimesheetRepositoryAdapter(repository, run_in_thread=run_in_thread)
+
+    with pytest.raises(ConcurrencyConflictError):
+        asyncio.run(adapter.save(stale))
+
+
+def test_backend_errors_reach_the_caller():
+    repository = WriteBehindTimesheetRepository(FailingRepository(), max_delay_seconds=0.001)
+    try:
+        with pytest.raises(OSError):
+            repository.save(Timesheet(TimesheetId("ts-1"), EMPLOYEE, JANUARY))
+        assert repository.find_by(EMPLOYEE, JANUARY) is None
+    finally:
+        repository.close()
+
+
+def test_close_writes_queued_saves(backend):
+    repository = WriteBehindTimesheetRepository(backend, max_delay_seconds=60)
+    handles = [
+        repository.save_deferred(
+            Timesheet(TimesheetId(f"ts-{n}"), EmployeeId(f"EMP{n:03d}"), JANUARY)
+        )
+        for n in range(5)
+    ]
+
+    repository.close()
+
+    assert all(handle.done() for handle in handles)
+    assert all(backend.find_by(EmployeeId(f"EMP{n:03d}"), JANUARY) for n in range(5))